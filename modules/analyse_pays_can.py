@@ -3,30 +3,141 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+from src.datasets import get_dataset
+from src.artifacts import artifact_version, get_artifact
+from src.query_cache import memoize_query
+from src import perf
+from modules.debug_panel import instrumented
 
 # ==========================================================
 # LOAD DATASETS
 # ==========================================================
 
-@st.cache_data
 def load_afcon_results():
-    df = pd.read_csv("data/afcon_results.csv")
-    df["date"] = pd.to_datetime(df["date"])
-    df["year"] = df["date"].dt.year
-    return df
+    return get_dataset("afcon")  # vue partagée en lecture seule (date, year déjà typés)
 
-@st.cache_data
 def load_afcon_goals():
-    df = pd.read_csv("data/afcon_goalscorers.csv")
-    df["date"] = pd.to_datetime(df["date"])
-    return df
+    return get_dataset("afcon_goals")
 
+@st.cache_resource
+def load_can_scorer_index(version):
+    return get_artifact("can_scorer_index")
 
+@st.cache_resource
+def load_can_score_cube(version):
+    return get_artifact("can_score_cube")
+
+@st.cache_resource
+def load_can_h2h_matrix(version):
+    return get_artifact("can_h2h_matrix")
+
+
+# ==========================================================
+# HELPERS
+# ==========================================================
+
+def team_matches(team, tournament_class):
+    afcon = load_afcon_results()
+    return afcon[
+        (afcon["tournament_class"] == tournament_class) &
+        ((afcon["home_team"] == team) | (afcon["away_team"] == team))
+    ]
+
+def stats(df, team):
+    if df.empty:
+        return 0,0,0,0,0
+
+    wins = 0
+    gf = 0
+    ga = 0
+    cs = 0
+
+    for _, r in df.iterrows():
+        if r["home_team"] == team:
+            gA, gB = r["home_score"], r["away_score"]
+        else:
+            gA, gB = r["away_score"], r["home_score"]
+
+        gf += gA
+        ga += gB
+        if gA > gB: wins += 1
+        if gB == 0: cs += 1
+
+    total = len(df)
+
+    return (
+        wins / total * 100,
+        gf / total,
+        ga / total,
+        cs / total * 100,
+        total
+    )
+
+def goals_per_year(df, team):
+    rows = []
+    for year, group in df.groupby("year"):
+        gf = 0
+        for _, r in group.iterrows():
+            if r["home_team"] == team:
+                gf += r["home_score"]
+            elif r["away_team"] == team:
+                gf += r["away_score"]
+        rows.append({"year": year, "goals": gf})
+    return pd.DataFrame(rows)
+
+
+# ==========================================================
+# CACHED QUERIES (mémoire partagée entre sessions, LRU)
+# ==========================================================
+
+@memoize_query("afcon")
+def team_summary(team):
+    """(CAN finale, qualifications) : winrate, GF/match, GA/match, clean sheets %, matchs."""
+    return (
+        stats(team_matches(team, "can_final"), team),
+        stats(team_matches(team, "can_qualification"), team),
+    )
+
+
+@memoize_query("afcon")
+def team_goals_per_year(team):
+    return goals_per_year(team_matches(team, "can_final"), team)
+
+
+@memoize_query("afcon")
+def team_opponents(team):
+    can_matches = team_matches(team, "can_final")
+    adversaires = []
+
+    for _, r in can_matches.iterrows():
+        if r["home_team"] == team:
+            adversaires.append(r["away_team"])
+        else:
+            adversaires.append(r["home_team"])
+
+    return pd.Series(adversaires, dtype=object).value_counts()
+
+
+@memoize_query("afcon")
+def team_h2h(team):
+    h2h = load_can_h2h_matrix(artifact_version("can_h2h_matrix"))
+    h2h = h2h[h2h["team"] == team].set_index("opponent")
+
+    return (
+        h2h[["played", "wins", "winrate"]]
+        .rename(columns={"played": "matchs"})
+        .rename_axis(None)
+        .sort_values("winrate", ascending=False)
+    )
+
+
+@instrumented("analyse_pays_can")
 def render():
     st.title("🐘 Analyse CAN par Pays")
 
+    perf.step("0 - selection")
     afcon = load_afcon_results()
-    goals = load_afcon_goals()
+    scorer_index = load_can_scorer_index(artifact_version("can_scorer_index"))
 
     countries = sorted(
         set(afcon["home_team"]).union(afcon["away_team"])
@@ -35,60 +146,16 @@ def render():
     # ==========================================================
     # COUNTRY SELECTION
     # ==========================================================
-    team = st.selectbox("Sélectionne un pays", countries, index=countries.index("Ivory Coast"))
-
-    # Subsets
-    df_can = afcon[afcon["tournament"] == "African Cup of Nations"].copy()
-    df_qualif = afcon[afcon["tournament"] == "African Cup of Nations qualification"].copy()
+    team = st.selectbox("Sélectionne un pays", countries, index=countries.index("Ivory Coast"), key="analyse_team")
 
     # ==========================================================
     # 1️⃣ GLOBAL SUMMARY
     # ==========================================================
 
+    perf.step("1 - summary")
     st.header(f"1️⃣ Résumé général de {team} à la CAN")
 
-    # CAN finale
-    can_matches = df_can[
-        (df_can["home_team"] == team) | (df_can["away_team"] == team)
-    ]
-
-    # Qualifs
-    qualif_matches = df_qualif[
-        (df_qualif["home_team"] == team) | (df_qualif["away_team"] == team)
-    ]
-
-    def stats(df, team):
-        if df.empty:
-            return 0,0,0,0,0
-
-        wins = 0
-        gf = 0
-        ga = 0
-        cs = 0
-
-        for _, r in df.iterrows():
-            if r["home_team"] == team:
-                gA, gB = r["home_score"], r["away_score"]
-            else:
-                gA, gB = r["away_score"], r["home_score"]
-
-            gf += gA
-            ga += gB
-            if gA > gB: wins += 1
-            if gB == 0: cs += 1
-
-        total = len(df)
-
-        return (
-            wins / total * 100,
-            gf / total,
-            ga / total,
-            cs / total * 100,
-            total
-        )
-
-    Wc, GFc, GAc, CSc, Mc = stats(can_matches, team)
-    Wq, GFq, GAq, CSq, Mq = stats(qualif_matches, team)
+    (Wc, GFc, GAc, CSc, Mc), (Wq, GFq, GAq, CSq, Mq) = team_summary(team)
 
     colA, colB = st.columns(2)
 
@@ -111,20 +178,14 @@ def render():
     # ==========================================================
     # 2️⃣ BUTEURS DU PAYS EN CAN
     # ==========================================================
+    perf.step("2 - scorers")
     st.header("2️⃣ Buteurs du pays en CAN")
 
-    team_goals = goals[goals["team"] == team]
+    top_scorers = scorer_index.top(team=team).set_index("scorer")[["goals"]]
 
-    if team_goals.empty:
+    if top_scorers.empty:
         st.info("Aucun buteur enregistré pour ce pays dans le dataset.")
     else:
-        top_scorers = (
-            team_goals.groupby("scorer")["scorer"]
-            .count()
-            .sort_values(ascending=False)
-            .rename("goals")
-        ).to_frame()
-
         st.subheader("🥅 Top buteurs (toutes CAN confondues)")
         st.dataframe(top_scorers)
 
@@ -140,22 +201,10 @@ def render():
     # ==========================================================
     # 3️⃣ PERFORMANCES PAR ANNÉE / COMPÉTITION
     # ==========================================================
+    perf.step("3 - goals per year")
     st.header("3️⃣ Performance historique à la CAN")
 
-    # Buts par année
-    def goals_per_year(df, team):
-        rows = []
-        for year, group in df.groupby("year"):
-            gf = 0
-            for _, r in group.iterrows():
-                if r["home_team"] == team:
-                    gf += r["home_score"]
-                elif r["away_team"] == team:
-                    gf += r["away_score"]
-            rows.append({"year": year, "goals": gf})
-        return pd.DataFrame(rows)
-
-    df_gf = goals_per_year(can_matches, team)
+    df_gf = team_goals_per_year(team)
 
     if not df_gf.empty:
         fig_g = px.line(df_gf, x="year", y="goals", title="Buts par année en CAN")
@@ -164,18 +213,13 @@ def render():
     # ==========================================================
     # 4️⃣ ADVERSAIRES LES PLUS FRÉQUENTS
     # ==========================================================
+    perf.step("4 - opponents")
     st.header("4️⃣ Adversaires les plus affrontés en CAN")
 
-    adversaires = []
-
-    for _, r in can_matches.iterrows():
-        if r["home_team"] == team:
-            adversaires.append(r["away_team"])
-        else:
-            adversaires.append(r["home_team"])
+    adv_df = team_opponents(team)
+    perf.add_rows(int(adv_df.sum()))
 
-    if len(adversaires) > 0:
-        adv_df = pd.Series(adversaires).value_counts()
+    if len(adv_df) > 0:
         st.bar_chart(adv_df.head(12))
     else:
         st.info("Aucun match CAN pour ce pays.")
@@ -183,48 +227,22 @@ def render():
     # ==========================================================
     # 5️⃣ HEAD-TO-HEAD EN CAN
     # ==========================================================
+    perf.step("5 - h2h")
     st.header("5️⃣ Head-to-head CAN (vs autres équipes)")
 
-    h2h_stats = {}
-
-    for opp in adv_df.index:
-        subset = can_matches[
-            ((can_matches["home_team"] == team) & (can_matches["away_team"] == opp)) |
-            ((can_matches["home_team"] == opp) & (can_matches["away_team"] == team))
-        ]
-
-        wins = 0
-        for _, r in subset.iterrows():
-            if r["home_team"] == team:
-                gA, gB = r["home_score"], r["away_score"]
-            else:
-                gA, gB = r["away_score"], r["home_score"]
-
-            if gA > gB:
-                wins += 1
-
-        h2h_stats[opp] = {
-            "matchs": len(subset),
-            "wins": wins,
-            "winrate": wins / len(subset) * 100 if len(subset) else 0
-        }
-
-    h2h_df = (
-        pd.DataFrame(h2h_stats).T.sort_values("winrate", ascending=False)
-    )
+    h2h_df = team_h2h(team)
+    perf.add_rows(len(h2h_df))
 
     st.dataframe(h2h_df, use_container_width=True)
 
     # ==========================================================
     # 6️⃣ HEATMAP DES SCORES EN CAN
     # ==========================================================
+    perf.step("6 - score heatmap")
     st.header("6️⃣ Heatmap des scores CAN")
 
-    heat_df = can_matches.copy()
-    heat_df["score"] = heat_df["home_score"].astype(str) + "-" + heat_df["away_score"].astype(str)
-
-    heat_count = heat_df["score"].value_counts().reset_index()
-    heat_count.columns = ["score", "count"]
+    # Scores du point de vue du pays (buts pour - buts contre)
+    heat_count = load_can_score_cube(artifact_version("can_score_cube")).top_scores(team=team)
 
     fig_heat = px.treemap(
         heat_count,
@@ -237,6 +255,7 @@ def render():
     # ==========================================================
     # 7️⃣ ANALYSE AUTOMATIQUE
     # ==========================================================
+    perf.step("7 - analysis")
     st.header("7️⃣ Analyse automatique")
 
     analysis = f"""
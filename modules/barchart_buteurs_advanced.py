@@ -1,48 +1,22 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-
-# ==========================================================
-# DATA
-# ==========================================================
-
-@st.cache_data
-def load_goals():
-    df = pd.read_csv("data/afcon_goalscorers.csv")
-    df["date"] = pd.to_datetime(df["date"])
-    df["year"] = df["date"].dt.year
-    return df
-
-@st.cache_data
-def load_results():
-    df = pd.read_csv("data/afcon_results.csv")
-    df["date"] = pd.to_datetime(df["date"])
-    df["year"] = df["date"].dt.year
-    df = df[df["tournament"] == "African Cup of Nations"]
-    return df
+from src.artifacts import artifact_version, get_artifact
+from modules.debug_panel import instrumented
 
 # ==========================================================
 # STRICT MERGE FINAL PHASE ONLY
 # ==========================================================
 
-def get_buteur_dataset():
-    df_goals = load_goals()
-    df_results = load_results()
+@st.cache_resource
+def get_buteur_dataset(version):
+    # Index built once (persisted on disk) : goals restricted to final-phase matches
+    index = get_artifact("can_final_scorer_index")
 
-    merged = df_goals.merge(
-        df_results[["date", "home_team", "away_team"]],
-        on=["date", "home_team", "away_team"],
-        how="inner"
-    )
+    min_year = min(index.years)
+    max_year = max(index.years)
 
-    if "team" not in merged.columns:
-        merged["team"] = merged["home_team"]
-
-    min_year = int(merged["year"].min())
-    max_year = int(merged["year"].max())
-
-    return merged, min_year, max_year
+    return index, min_year, max_year
 
 
 # ==========================================================
@@ -128,16 +102,17 @@ def model_flag(df_year):
 # PAGE RENDER
 # ==========================================================
 
+@instrumented("barchart_buteurs_advanced")
 def render():
     st.title("🏃‍♂️ Bar Chart — Buteurs CAN (par année)")
 
-    merged, min_year, max_year = get_buteur_dataset()
+    index, min_year, max_year = get_buteur_dataset(artifact_version("can_final_scorer_index"))
 
 
     # ----------------------------
     # 1) Sélecteur d’année CAN
     # ----------------------------
-    can_years = sorted(merged["year"].unique(), reverse=True)
+    can_years = sorted(index.years, reverse=True)
     #year_choice = st.sidebar.selectbox("Année CAN", can_years, index=len(can_years)-1)
 
     #df_year = merged[merged["year"] == year_choice]
@@ -153,30 +128,25 @@ def render():
         year_choice = st.selectbox(
             "Année CAN",
             can_years,
-            index=len(can_years) - 1
+            index=len(can_years) - 1,
+            key="scorers_year"
         )
 
     with col2:
         st.write("")  # espace visuel
 
-    # Filtrage année
-    df_year = merged[merged["year"] == year_choice]
-
     # ----------------------------
-    # 2) Agrégation des buteurs pour l’année choisie
+    # 2) Buteurs de l’année choisie (index pré-trié)
     # ----------------------------
-    df_score = (
-        df_year.groupby(["year", "scorer", "team"])
-        .agg(goals=("scorer", "count"))
-        .reset_index()
-    )
+    df_score = index.top(year=year_choice)[["year", "scorer", "team", "goals"]]
 
     # ----------------------------
     # 3) Choix du modèle
     # ----------------------------
     model = st.radio(
         "Modèle",
-        ["Flag Inside Bar"]
+        ["Flag Inside Bar"],
+        key="scorers_model"
     )
 
     if model == "BBC Style":
@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from modules.debug_panel import instrumented
+from src.live import with_scores
 
 # ===========================================
 # CONFIG PAGE
 # ===========================================
+@instrumented("can2025_info")
 def render():
     st.set_page_config(layout="wide")
 
@@ -159,13 +162,15 @@ def render():
     ]
 
     df = pd.DataFrame(data, columns=["date", "heure", "équipe_a", "équipe_b", "groupe", "stade", "ville"])
+    # Scores des matchs déjà joués (data/can2025_results.csv)
+    df = with_scores(df, "équipe_a", "équipe_b", column="score")
     df["date"] = pd.to_datetime(df["date"])
 
     # Filtres
     col_f1, col_f2 = st.columns(2)
 
     with col_f1:
-        groupe_filter = st.selectbox("Filtrer par groupe :", ["Tous", "A", "B", "C", "D", "E", "F"])
+        groupe_filter = st.selectbox("Filtrer par groupe :", ["Tous", "A", "B", "C", "D", "E", "F"], key="can2025_group")
 
     with col_f2:
         date_filter = st.date_input("Filtrer par date :", value=None)
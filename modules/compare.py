@@ -3,21 +3,25 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+from src.datasets import get_dataset
+from src.query_cache import memoize_query
+from src import perf
+from modules.debug_panel import instrumented
 
 # ==========================================================
 # LOAD DATASETS
 # ==========================================================
+# Vues partagées en lecture seule, typées une seule fois au chargement
+# (date, year, decade, tournament_class) : rien à convertir ici.
 
 def load_main_data():
-    return st.session_state["df_main"]  # results.csv
+    return get_dataset("results")  # une seule copie par processus, pas par session
 
-@st.cache_data
 def load_official_recent():
-    return pd.read_csv("data/official_A_last_year.csv")
+    return get_dataset("official_recent")
 
-@st.cache_data
 def load_afcon():
-    return pd.read_csv("data/afcon_results.csv")  # CAN + qualifiers (we will filter)
+    return get_dataset("afcon")  # CAN + qualifiers (we will filter)
 
 
 # ==========================================================
@@ -86,9 +90,6 @@ def rolling_goals(df, team):
 
 
 def decade_win(df, team):
-    df = df.copy()
-    df["decade"] = (df["date"].dt.year // 10) * 10
-
     rows = []
     for dec, group in df.groupby("decade"):
         wins = 0
@@ -111,28 +112,74 @@ def decade_win(df, team):
     return pd.DataFrame(rows)
 
 
+# ==========================================================
+# CACHED QUERIES (mémoire partagée entre sessions, LRU)
+# ==========================================================
+
+def can_period(start_year):
+    afcon = load_afcon()
+    return afcon[(afcon["tournament_class"] == "can_final") & (afcon["year"] >= start_year)]
+
+
+@memoize_query("afcon")
+def can_team_stats(team, start_year):
+    return compute_stats(can_period(start_year), team)
+
+
+@memoize_query("official_recent")
+def recent_team_stats(team):
+    return compute_stats(load_official_recent(), team)
+
+
+@memoize_query("afcon")
+def h2h_summary(team1, team2, start_year):
+    """H2H CAN matches + (wins team1, wins team2, draws)."""
+    h2h = compute_h2h(can_period(start_year), team1, team2)
+
+    wins1 = 0
+    wins2 = 0
+    draws = 0
+
+    for _, r in h2h.iterrows():
+        if r["home_team"] == team1:
+            gA, gB = r["home_score"], r["away_score"]
+        else:
+            gA, gB = r["away_score"], r["home_score"]
+
+        if gA > gB: wins1 += 1
+        elif gA < gB: wins2 += 1
+        else: draws += 1
+
+    return h2h, wins1, wins2, draws
+
+
+@memoize_query("afcon")
+def can_rolling_goals(team, start_year):
+    return rolling_goals(can_period(start_year), team)
+
+
+@memoize_query("afcon")
+def can_decade_win(team, start_year):
+    return decade_win(can_period(start_year), team)
+
+
 # ==========================================================
 # MAIN STREAMLIT RENDER
 # ==========================================================
 
+@instrumented("compare")
 def render():
 
     st.title("⚔️ Comparateur CAF – Phase finale de la CAN")
 
+    perf.step("0 - selection")
     # ===== Load base datasets =====
-    main_df = load_main_data()               # ONLY used for radar (12 months all comps)
-    official_recent = load_official_recent() # 12 months official games
     afcon = load_afcon()                     # CAN + qualifiers
 
-    # Convert dates
-    main_df["date"] = pd.to_datetime(main_df["date"])
-    official_recent["date"] = pd.to_datetime(official_recent["date"])
-    afcon["date"] = pd.to_datetime(afcon["date"])
-
     # ==========================================================
     # 1) RESTRICT TO CAN FINAL ONLY
     # ==========================================================
-    df_can = afcon[afcon["tournament"] == "African Cup of Nations"].copy()
+    df_can = afcon[afcon["tournament_class"] == "can_final"]
 
     # List of African countries (those that have played CAN final)
     teams = sorted(
@@ -144,9 +191,9 @@ def render():
     # ==========================================================
     col1, col2 = st.columns(2)
     with col1:
-        team1 = st.selectbox("Équipe A (référence)", teams, index=teams.index("Ivory Coast"))
+        team1 = st.selectbox("Équipe A (référence)", teams, index=teams.index("Ivory Coast"), key="compare_team_a")
     with col2:
-        team2 = st.selectbox("Équipe B (comparée)", teams)
+        team2 = st.selectbox("Équipe B (comparée)", teams, key="compare_team_b")
 
     if team1 == team2:
         st.warning("Choisis deux équipes différentes.")
@@ -157,8 +204,8 @@ def render():
     # ==========================================================
     st.sidebar.subheader("📌 Choix de la période (CAN finale uniquement)")
 
-    min_year = int(df_can["date"].dt.year.min())
-    max_year = int(df_can["date"].dt.year.max())
+    min_year = int(df_can["year"].min())
+    max_year = int(df_can["year"].max())
 
     period = st.sidebar.radio(
         "Analyser :",
@@ -168,7 +215,8 @@ def render():
             "10 dernières années",
             "15 dernières années",
             "Année personnalisée"
-        ]
+        ],
+        key="compare_period"
     )
 
     if period == "Toute l’histoire":
@@ -180,30 +228,16 @@ def render():
     elif period == "15 dernières années":
         start_year = max_year - 15
     else:
-        start_year = st.sidebar.slider("Année de départ", min_year, max_year, 2010)
-
-    df_period = df_can[df_can["date"].dt.year >= start_year]
+        start_year = st.sidebar.slider("Année de départ", min_year, max_year, 2010, key="compare_start_year")
 
     # ==========================================================
     # 2) HEAD-TO-HEAD CAN ONLY
     # ==========================================================
+    perf.step("1 - h2h")
     st.header("1️⃣ Face-à-face en CAN (phase finale)")
 
-    h2h = compute_h2h(df_period, team1, team2)
-
-    wins1 = 0
-    wins2 = 0
-    draws = 0
-
-    for _, r in h2h.iterrows():
-        if r["home_team"] == team1:
-            gA, gB = r["home_score"], r["away_score"]
-        else:
-            gA, gB = r["away_score"], r["home_score"]
-
-        if gA > gB: wins1 += 1
-        elif gA < gB: wins2 += 1
-        else: draws += 1
+    h2h, wins1, wins2, draws = h2h_summary(team1, team2, start_year)
+    perf.add_rows(len(h2h))
 
     colA, colB, colC, colD = st.columns(4)
     colA.metric("Matchs CAN", len(h2h))
@@ -221,10 +255,11 @@ def render():
     # ==========================================================
     # 3) STATS GLOBAL CAN ONLY
     # ==========================================================
+    perf.step("2 - stats")
     st.header("2️⃣ Statistiques globales – phase finale CAN")
 
-    W1, GF1, GA1, CS1 = compute_stats(df_period, team1)
-    W2, GF2, GA2, CS2 = compute_stats(df_period, team2)
+    W1, GF1, GA1, CS1 = can_team_stats(team1, start_year)
+    W2, GF2, GA2, CS2 = can_team_stats(team2, start_year)
 
     col1, col2 = st.columns(2)
     with col1:
@@ -244,6 +279,7 @@ def render():
     # ==========================================================
     # 4) MATCHES DETAILS CAN ONLY
     # ==========================================================
+    perf.step("3 - details")
     st.header("3️⃣ Détails des confrontations CAN")
 
     st.dataframe(
@@ -255,10 +291,12 @@ def render():
     # ==========================================================
     # 5) ROLLING MEAN CAN ONLY
     # ==========================================================
+    perf.step("4 - rolling goals")
     st.header("4️⃣ Forme offensive (CAN uniquement)")
 
-    t1_rm = rolling_goals(df_period, team1)
-    t2_rm = rolling_goals(df_period, team2)
+    t1_rm = can_rolling_goals(team1, start_year)
+    t2_rm = can_rolling_goals(team2, start_year)
+    perf.add_rows(len(t1_rm) + len(t2_rm))
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=t1_rm["date"], y=t1_rm["goals_rm"], mode="lines+markers", name=team1))
@@ -269,10 +307,11 @@ def render():
     # ==========================================================
     # 6) RADAR — OFFICIAL A (12 MONTHS)
     # ==========================================================
+    perf.step("5 - radar")
     st.header("5️⃣ Forme récente (12 mois – matchs officiels A)")
 
-    W1_r, GF1_r, GA1_r, CS1_r = compute_stats(official_recent, team1)
-    W2_r, GF2_r, GA2_r, CS2_r = compute_stats(official_recent, team2)
+    W1_r, GF1_r, GA1_r, CS1_r = recent_team_stats(team1)
+    W2_r, GF2_r, GA2_r, CS2_r = recent_team_stats(team2)
 
     radar_df = pd.DataFrame({
         "Stat": ["Winrate", "Attaque", "Défense", "Clean Sheets"],
@@ -304,10 +343,12 @@ def render():
     # ==========================================================
     # 7) WINRATE PAR DÉCENNIE CAN
     # ==========================================================
+    perf.step("6 - decades")
     st.header("6️⃣ Winrate par décennie (CAN)")
 
-    dfD1 = decade_win(df_period, team1)
-    dfD2 = decade_win(df_period, team2)
+    dfD1 = can_decade_win(team1, start_year)
+    dfD2 = can_decade_win(team2, start_year)
+    perf.add_rows(len(dfD1) + len(dfD2))
 
     fig_dec = go.Figure()
     fig_dec.add_trace(go.Bar(x=dfD1["decade"], y=dfD1["winrate"], name=team1))
@@ -318,6 +359,7 @@ def render():
     # ==========================================================
     # 8) ANALYSE AUTOMATIQUE BASED ON CAN
     # ==========================================================
+    perf.step("7 - analysis")
     st.header("7️⃣ Analyse automatique – CAN")
 
     analysis = f"""
@@ -0,0 +1,78 @@
+import functools
+
+import pandas as pd
+import streamlit as st
+
+from src import perf, profiling
+
+# ==========================================================
+# DEBUG PANEL (AFCON_DEBUG=1)
+# ==========================================================
+# Timings of the rerun that just finished (src/perf.py), in the sidebar.
+# Without AFCON_DEBUG nothing is drawn; without AFCON_DEBUG / AFCON_PERF_LOG
+# nothing is even recorded. With AFCON_PROFILE the rerun is also profiled
+# (src/profiling.py) and its hottest functions listed.
+
+
+def show_perf_panel(run):
+    """Sidebar table of a finished rerun (dict returned by perf.end_rerun)."""
+    if not perf.DEBUG or run is None:
+        return
+
+    with st.sidebar.expander(f"⏱️ Rendu : {run['seconds'] * 1000:.0f} ms", expanded=False):
+        st.caption(f"{run['page']} — cache {run['cache_hits']} hits / {run['cache_misses']} misses")
+        if run["sections"]:
+            sections = pd.DataFrame(run["sections"])
+            sections["ms"] = (sections["seconds"] * 1000).round(1)
+            st.dataframe(
+                sections[["section", "ms", "rows", "cache_hits", "cache_misses"]].sort_values("ms", ascending=False),
+                hide_index=True, use_container_width=True,
+            )
+
+        history = [r["seconds"] * 1000 for r in perf.last_runs(run["page"])]
+        if len(history) > 1:
+            st.caption(f"{len(history)} derniers reruns : médiane {pd.Series(history).median():.0f} ms, "
+                       f"max {max(history):.0f} ms")
+
+
+def widget_values():
+    """Scalar widget values of the session (keyed widgets), used to name profiles."""
+    return {k: v for k, v in st.session_state.items() if isinstance(v, (str, int, float, bool))}
+
+
+def start_profile(page):
+    """RerunProfile already running if this rerun is profiled (AFCON_PROFILE / ?profile=1), else None."""
+    if not profiling.should_profile(st.query_params.get("profile")):
+        return None
+    return profiling.RerunProfile(page, widget_values).__enter__()
+
+
+def show_profile_panel(profile):
+    """Stops and saves a RerunProfile, then lists its top functions in the sidebar."""
+    if profile is None:
+        return
+    profile.__exit__(None, None, None)
+    with st.sidebar.expander("🔬 Profil", expanded=False):
+        st.caption(f"`{profile.path}` — `python -m pstats {profile.path}`")
+        st.dataframe(pd.DataFrame(profile.top), hide_index=True, use_container_width=True)
+
+
+def instrumented(page):
+    """Decorator for a page's render() : timing record + optional profile per rerun, debug panels."""
+    def decorator(render):
+        if not perf.ENABLED and not profiling.ENABLED:
+            return render
+
+        @functools.wraps(render)
+        def wrapper(*args, **kwargs):
+            if perf.ENABLED:
+                perf.begin_rerun(page)
+            profile = start_profile(page) if profiling.ENABLED else None
+            try:
+                return render(*args, **kwargs)
+            finally:
+                show_profile_panel(profile)
+                if perf.ENABLED:
+                    show_perf_panel(perf.end_rerun())
+        return wrapper
+    return decorator
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
+from src.datasets import get_dataset
+from modules.debug_panel import instrumented
 
+@instrumented("home")
 def render():
 
     # ================================
@@ -92,10 +94,8 @@ def render():
     # ================================
     st.subheader("🧠 Statistiques globales CAN")
 
-    df = pd.read_csv("data/afcon_results.csv")
-    df["date"] = pd.to_datetime(df["date"])
-    df["year"] = df["date"].dt.year
-    df_final = df[df["tournament"] == "African Cup of Nations"]
+    df = get_dataset("afcon")
+    df_final = df[df["tournament_class"] == "can_final"]
 
     best_attack = df_final.groupby("home_team")["home_score"].sum().sort_values(ascending=False)
     best_team = best_attack.index[0]
@@ -0,0 +1,33 @@
+import streamlit as st
+
+from src.memory import budget_warning, memory_report, process_rss, rss_monitor
+
+# ==========================================================
+# DEBUG : MÉMOIRE DU PROCESSUS (AFCON_DEBUG=1)
+# ==========================================================
+# Ce que le processus garde en mémoire (src/memory.py) : vues partagées,
+# artefacts, cache de requêtes, et RSS échantillonné toutes les 5 s.
+
+
+def render():
+    st.subheader("🧠 Mémoire du processus")
+
+    rss_monitor.start()
+    rss = rss_monitor.sample()
+    report = memory_report()
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("RSS", f"{rss / 2**20:.0f} MB")
+    col2.metric("Caches suivis", f"{report['bytes'].sum() / 2**20:.1f} MB")
+    col3.metric("Objets en cache", len(report))
+
+    warning = budget_warning(rss)
+    if warning:
+        st.warning(f"⚠️ {warning}")
+
+    st.dataframe(report.drop(columns=["bytes"]), hide_index=True, use_container_width=True)
+
+    history = rss_monitor.frame()
+    if len(history) > 1:
+        st.line_chart(history.set_index("time")["rss_mb"])
+    st.caption(f"Budget : AFCON_MEMORY_BUDGET_MB — RSS actuel {process_rss() / 2**20:.0f} MB")
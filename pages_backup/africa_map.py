@@ -2,94 +2,104 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import json
+import os
+from src.datasets import CAN_FINAL, get_dataset, get_version
+from src.fingerprint import dataset_version
+from src.geo_build import OUTPUT_FILE as AFRICA_GEO_FILE, build_africa_geojson
+from src.query_cache import memoize_query
+from src.artifacts import artifact_version, get_artifact
+from modules.debug_panel import instrumented
 
 # ==========================================================
 # LOAD DATA
 # ==========================================================
 
-@st.cache_data
 def load_afcon():
-    df = pd.read_csv("data/afcon_results.csv")
-    df["date"] = pd.to_datetime(df["date"])
-    return df
+    return get_dataset("afcon")
 
-@st.cache_data
-def load_geojson():
-    # Utilise ton fichier haute résolution uploadé
-    with open("./assets/custom.geo.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+@st.cache_resource
+def load_geojson(version):
+    # Géométrie simplifiée (python -m src.geo_build) ; si elle est absente,
+    # on la reconstruit en mémoire depuis le fichier haute résolution.
+    if os.path.exists(AFRICA_GEO_FILE) and os.path.getsize(AFRICA_GEO_FILE) > 0:
+        with open(AFRICA_GEO_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return build_africa_geojson()
 
 # ==========================================================
 # HELPER FUNCTIONS
 # ==========================================================
 
-def compute_can_stats(df, team):
+@st.cache_resource
+def load_can_h2h_matrix(version):
+    return get_artifact("can_h2h_matrix")
+
+@memoize_query("afcon")
+def compute_can_stats(team):
     """
     Calcule les stats CAN finale du pays sélectionné contre tous les adversaires africains.
     """
-    df = df[df["tournament"] == "African Cup of Nations"].copy()
-
-    rows = []
-
-    for opponent in sorted(set(df["home_team"]).union(df["away_team"])):
-        if opponent == team:
-            continue
-
-        matches = df[
-            ((df["home_team"] == team) & (df["away_team"] == opponent)) |
-            ((df["home_team"] == opponent) & (df["away_team"] == team))
-        ]
-
-        if matches.empty:
-            rows.append({
-                "opponent": opponent,
-                "matches": 0,
-                "wins": 0,
-                "winrate": 0,
-                "goals_for": 0,
-                "goals_against": 0,
-                "goal_diff": 0
-            })
-            continue
-
-        wins = 0
-        gf = 0
-        ga = 0
-
-        for _, r in matches.iterrows():
-            if r["home_team"] == team:
-                gf += r["home_score"]
-                ga += r["away_score"]
-            else:
-                gf += r["away_score"]
-                ga += r["home_score"]
-
-            if gf > ga:
-                wins += 1
-
-        winrate = wins / len(matches) * 100
-
-        rows.append({
-            "opponent": opponent,
-            "matches": len(matches),
-            "wins": wins,
-            "winrate": winrate,
-            "goals_for": gf,
-            "goals_against": ga,
-            "goal_diff": gf - ga
-        })
-
-    return pd.DataFrame(rows)
+    df = get_dataset("afcon")
+    df = df[df["tournament"] == CAN_FINAL]
+    opponents = sorted(set(df["home_team"]).union(df["away_team"]) - {team})
+
+    h2h = load_can_h2h_matrix(artifact_version("can_h2h_matrix"))
+    h2h = h2h[h2h["team"] == team].set_index("opponent")
+
+    cols = ["played", "wins", "goals_for", "goals_against", "goal_diff", "winrate"]
+    stats = h2h[cols].reindex(opponents, fill_value=0).rename_axis("opponent").reset_index()
+    stats = stats.rename(columns={"played": "matches"})
+    return stats[["opponent", "matches", "wins", "winrate", "goals_for", "goals_against", "goal_diff"]]
+
+@st.cache_data(max_entries=256)
+def build_map_payload(team, metric_key, version):
+    """
+    Figure plotly (dict sérialisable) pour un couple (pays, métrique).
+    Seules les géométries des adversaires affichés sont embarquées.
+    """
+    stats_df = compute_can_stats(team).copy()
+    stats_df["value"] = stats_df[metric_key]
+
+    geojson = load_geojson(dataset_version(AFRICA_GEO_FILE))
+    shown = set(stats_df["opponent"])
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [f for f in geojson["features"] if f["id"] in shown],
+    }
+
+    fig = px.choropleth(
+        stats_df,
+        geojson=geojson,
+        featureidkey="id",
+        locations="opponent",
+        color="value",
+        color_continuous_scale="YlGnBu",
+        hover_data={
+            "opponent": True,
+            "matches": True,
+            "wins": True,
+            "winrate": True,
+            "goals_for": True,
+            "goals_against": True,
+            "goal_diff": True,
+            "value": False
+        },
+        scope="africa"
+    )
+
+    fig.update_geos(fitbounds="locations", visible=False)
+    fig.update_layout(height=600, margin={"r":0,"t":0,"l":0,"b":0})
+    return fig.to_dict()
 
 # ==========================================================
 # MAIN PAGE
 # ==========================================================
 
+@instrumented("africa_map")
 def render():
     st.title("🌍 Carte Afrique – Analyse CAN par adversaire")
 
     df = load_afcon()
-    geojson = load_geojson()
 
     # liste des pays africains ayant joué la CAN
     teams = sorted(set(df["home_team"]).union(df["away_team"]))
@@ -98,7 +108,7 @@ def render():
     # Sidebar
     # -----------------------------
     st.sidebar.header("⚙️ Options")
-    team_selected = st.sidebar.selectbox("Choisir un pays", teams, index=teams.index("Ivory Coast"))
+    team_selected = st.sidebar.selectbox("Choisir un pays", teams, index=teams.index("Ivory Coast"), key="map_team")
 
     metric = st.sidebar.selectbox(
         "Choisir la métrique à afficher sur la carte",
@@ -108,7 +118,8 @@ def render():
             "Buts marqués",
             "Buts encaissés",
             "Goal difference"
-        ]
+        ],
+        key="map_metric"
     )
 
     st.sidebar.info("Données : Phase finale de la CAN uniquement")
@@ -116,7 +127,7 @@ def render():
     # -----------------------------
     # Compute stats
     # -----------------------------
-    stats_df = compute_can_stats(df, team_selected)
+    stats_df = compute_can_stats(team_selected)
 
     metric_key = {
         "Winrate": "winrate",
@@ -126,37 +137,13 @@ def render():
         "Goal difference": "goal_diff"
     }[metric]
 
-    stats_df["value"] = stats_df[metric_key]
-
     # -----------------------------
     # Carte Afrique
     # -----------------------------
     st.subheader(f"Carte Afrique — {team_selected} : {metric}")
 
-    fig = px.choropleth(
-        stats_df,
-        geojson=geojson,
-        featureidkey="properties.name",   # IMPORTANT
-        locations="opponent",
-        color="value",
-        color_continuous_scale="YlGnBu",
-        hover_data={
-            "opponent": True,
-            "matches": True,
-            "wins": True,
-            "winrate": True,
-            "goals_for": True,
-            "goals_against": True,
-            "goal_diff": True,
-            "value": False
-        },
-        scope="africa"
-    )
-
-    fig.update_geos(fitbounds="locations", visible=False)
-    fig.update_layout(height=600, margin={"r":0,"t":0,"l":0,"b":0})
-
-    st.plotly_chart(fig, use_container_width=True)
+    version = get_version("afcon") + dataset_version(AFRICA_GEO_FILE)
+    st.plotly_chart(build_map_payload(team_selected, metric_key, version), use_container_width=True)
 
     # -----------------------------
     # Table détail
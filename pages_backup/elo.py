@@ -1,22 +1,35 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from src.elo_engine import compute_period_elo
+from src.datasets import freeze, get_dataset
+from src.artifacts import artifact_version, build_artifact, get_artifact, period_start_years
+from modules.debug_panel import instrumented
 
-def render():
+CUSTOM_YEARS_KEPT = 4
+
+
+@st.cache_resource
+def load_period_elo(version, start_year):
+    # Les périodes proposées ci-dessous sont pré-calculées par src/prewarm.py
+    return get_artifact("period_elo", start_year)
 
-    st.title("🏆 Classement Elo – Analyse dynamique")
 
-    df = st.session_state.get("df_main")
-    if df is None:
-        st.error("Dataset non chargé.")
-        return
+@st.cache_resource(max_entries=CUSTOM_YEARS_KEPT)
+def load_custom_period_elo(version, start_year):
+    # Année personnalisée : calculée hors du store (aucun fichier écrit), seules les
+    # dernières années demandées restent en mémoire
+    timeline, ratings = build_artifact("period_elo", start_year)
+    return freeze(timeline), ratings
 
-    df = df.copy()
-    df["year"] = pd.to_datetime(df["date"]).dt.year
+@instrumented("elo")
+def render():
+
+    st.title("🏆 Classement Elo – Analyse dynamique")
 
-    min_year = int(df["year"].min())   # 1957
-    max_year = int(df["year"].max())   # 2024
+    # Mêmes bornes que les périodes pré-calculées (src.artifacts.period_start_years)
+    years = get_dataset("results")["year"]
+    min_year = int(years.min())   # 1872
+    max_year = int(years.max())
 
     st.sidebar.subheader("📌 Choix de la période")
 
@@ -28,7 +41,8 @@ def render():
             "10 dernières années",
             "15 dernières années",
             "Année personnalisée"
-        ]
+        ],
+        key="elo_period"
     )
 
     if period == "Toute l’histoire":
@@ -40,11 +54,15 @@ def render():
     elif period == "15 dernières années":
         start_year = max_year - 15
     else:
-        start_year = st.sidebar.slider("Début analyse", min_year, max_year, 2010)
+        start_year = st.sidebar.slider("Début analyse", min_year, max_year, 2010, key="elo_start_year")
 
     st.markdown(f"### Analyse Elo depuis **{start_year}**")
 
-    timeline, ratings = compute_period_elo(df, start_year)
+    if start_year in period_start_years():
+        timeline, ratings = load_period_elo(artifact_version("period_elo"), start_year)
+    else:
+        with st.spinner(f"Calcul de l'Elo depuis {start_year}..."):
+            timeline, ratings = load_custom_period_elo(artifact_version("period_elo"), start_year)
 
     ranking = (
         pd.DataFrame(ratings.items(), columns=["Team", "Elo"])
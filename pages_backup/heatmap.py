@@ -1,16 +1,23 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
+from src.artifacts import artifact_version, get_artifact
+from modules.debug_panel import instrumented
 
+
+@st.cache_resource
+def get_score_cube(version):
+    return get_artifact("results_score_cube")
+
+
+@instrumented("heatmap")
 def render():
 
     st.title("🔥 Heatmap des scores – Analyse filtrée")
 
-    df = st.session_state.get("df_main").copy()
-    df["year"] = pd.to_datetime(df["date"]).dt.year
+    cube = get_score_cube(artifact_version("results_score_cube"))
 
-    min_year = int(df["year"].min())
-    max_year = int(df["year"].max())
+    min_year = int(cube.years.min())
+    max_year = int(cube.years.max())
 
     st.sidebar.subheader("📌 Choix de la période")
     period = st.sidebar.radio(
@@ -21,7 +28,8 @@ def render():
             "10 dernières années",
             "15 dernières années",
             "Année personnalisée"
-        ]
+        ],
+        key="heatmap_period"
     )
 
     if period == "Toute l’histoire":
@@ -33,19 +41,12 @@ def render():
     elif period == "15 dernières années":
         start_year = max_year - 15
     else:
-        start_year = st.sidebar.slider("Début analyse", min_year, max_year, 2010)
-
-    df = df[df["year"] >= start_year]
-
-    df["Score"] = df["home_score"].astype(int).astype(str) + "-" + df["away_score"].astype(int).astype(str)
+        start_year = st.sidebar.slider("Début analyse", min_year, max_year, 2010, key="heatmap_start_year")
 
     st.subheader("🏅 Scores les plus fréquents")
-    st.dataframe(df["Score"].value_counts().reset_index())
-
-    max_home = int(df["home_score"].max())
-    max_away = int(df["away_score"].max())
+    st.dataframe(cube.top_scores(start_year=start_year))
 
-    matrix = pd.crosstab(df["home_score"], df["away_score"])
+    matrix = cube.matrix(start_year=start_year)
 
     fig = px.imshow(
         matrix,
@@ -1,5 +1,7 @@
 import streamlit as st
+from modules.debug_panel import instrumented
 
+@instrumented("historical_can")
 def render():
     st.title("📜 Historique de la CAN (1957 → aujourd’hui)")
 
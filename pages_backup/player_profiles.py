@@ -1,5 +1,7 @@
 import streamlit as st
+from modules.debug_panel import instrumented
 
+@instrumented("player_profiles")
 def render():
     st.title("👤 Profils joueurs – CAN")
 
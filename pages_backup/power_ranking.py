@@ -1,6 +1,63 @@
 import streamlit as st
+import plotly.express as px
+from src.artifacts import artifact_version, get_artifact
+from modules.debug_panel import instrumented
 
+# ==========================================================
+# LOAD DATA
+# ==========================================================
+
+@st.cache_resource
+def load_power_ranking(version):
+    return get_artifact("power_ranking")
+
+# ==========================================================
+# MAIN PAGE
+# ==========================================================
+
+@instrumented("power_ranking")
 def render():
     st.title("📊 Power Ranking CAF")
 
-    st.info("Page en construction. Ici apparaîtra un classement basé sur Elo + résultats CAN.")
+    ranking = load_power_ranking(artifact_version("power_ranking"))
+
+    sort_options = {
+        "Elo": "elo",
+        "Forme (5 derniers matchs)": "form_points",
+        "Winrate CAN (phase finale)": "can_winrate",
+        "Winrate qualifications": "qual_winrate",
+        "Buts marqués / match": "gf_per_match",
+        "Buts encaissés / match": "ga_per_match",
+        "Différence de buts / match": "goal_diff_per_match",
+    }
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        sort_label = st.selectbox("Trier par", list(sort_options), key="ranking_sort")
+    with col2:
+        min_can = st.number_input("Matchs CAN minimum", min_value=0, value=0, step=1, key="ranking_min_can")
+
+    sort_key = sort_options[sort_label]
+    view = ranking[ranking["can_played"] >= min_can].sort_values(
+        sort_key, ascending=(sort_key == "ga_per_match"), na_position="last"
+    )
+
+    st.subheader("🏅 Top 15")
+    fig = px.bar(view.head(15), x="team", y=sort_key, color="elo", color_continuous_scale="haline")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("📋 Classement complet")
+    st.dataframe(
+        view.rename(columns={
+            "rank": "Rang Elo", "team": "Pays", "elo": "Elo", "form": "Forme", "form_points": "Pts forme",
+            "can_played": "Matchs CAN", "can_wins": "Victoires CAN", "can_winrate": "% V CAN",
+            "can_gf_per_match": "BP/m CAN", "can_ga_per_match": "BC/m CAN",
+            "qual_played": "Matchs qualifs", "qual_wins": "Victoires qualifs", "qual_winrate": "% V qualifs",
+            "played": "Matchs (depuis 2010)", "gf_per_match": "BP/m", "ga_per_match": "BC/m",
+            "goal_diff_per_match": "Diff/m",
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+
+    st.caption("Elo avancé et forme calculés sur les matchs A depuis 2010 (hors CHAN).")
@@ -0,0 +1,13 @@
+"""
+AFCON analytics, independent of the Streamlit UI.
+
+    datasets        read-only, typed dataset views (get_dataset)
+    artifacts       derived artifacts (Elo model, cubes, indexes...) + disk cache
+    elo_engine      Elo models and rating snapshots
+    team_stats      team records, h2h matrix, power ranking
+    form, scorer_index, shootouts, score_cubes
+    can2025         CAN 2025 participants, groups, fixtures
+    simulation      CAN 2025 tournament simulation
+
+Command line : python -m src --help
+"""
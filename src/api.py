@@ -0,0 +1,294 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+from src.artifacts import ARTIFACTS, artifact_version, get_artifact, period_start_years
+from src.query_cache import QueryCache
+from src.queries import elo_ranking, h2h, known_teams, team_profile, team_rating, to_jsonable
+from src.simulation import simulate_many
+
+# ======================================================
+# HTTP JSON API (asyncio, stdlib only)
+# ======================================================
+# Serves the precomputed artifacts to other tools :
+#
+#   GET /health
+#   GET /teams                         CAF teams
+#   GET /ratings?top=20&since=2010     Elo ranking (advanced model, or classic since a precomputed start year)
+#   GET /ratings/<team>                Elo + CAF rank of one team
+#   GET /teams/<team>                  CAN profile (records, form, h2h, scorers, shootouts)
+#   GET /h2h?team=A&opponent=B         CAN final head-to-head
+#   GET /probabilities                 CAN 2025 round probabilities (reference run, cached)
+#   GET /simulate?n=5000&seed=1        fresh Monte Carlo (worker processes)
+#   GET /metrics                       latency / throughput counters
+#
+# Lookups are answered from an in-memory LRU of encoded responses (keyed by
+# the artifacts' data version); the first computation of a response runs in
+# a thread so the event loop never blocks. Simulations run in a process pool
+# with a bounded queue (503 when full).
+#
+#   python -m src serve [--port 8765] [--workers N]
+
+DEFAULT_HOST = os.environ.get("AFCON_API_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("AFCON_API_PORT", 8765))
+
+REFERENCE_SIMULATIONS = 10000
+MAX_SIMULATIONS = 200000
+VERSION_REFRESH_SECONDS = 5.0
+LATENCY_WINDOW = 4096
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ======================================================
+# Counters
+# ======================================================
+class RouteMetrics:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)   # seconds, most recent requests
+
+    def record(self, seconds, error=False):
+        self.count += 1
+        self.errors += error
+        self.latencies.append(seconds)
+
+    def summary(self):
+        lat = np.fromiter(self.latencies, dtype=float) * 1000
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99]) if len(lat) else (0.0, 0.0, 0.0)
+        return {"count": self.count, "errors": self.errors,
+                "p50_ms": round(float(p50), 3), "p95_ms": round(float(p95), 3), "p99_ms": round(float(p99), 3)}
+
+
+# ======================================================
+# Worker process side
+# ======================================================
+def _simulate(snapshot, n, seed):
+    return to_jsonable(simulate_many(snapshot, n=n, seed=seed))
+
+
+# ======================================================
+# Server
+# ======================================================
+class AnalyticsAPI:
+    def __init__(self, workers=None, max_pending=None, cache_entries=20000):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(self.workers)
+        self.sim_slots = asyncio.Semaphore(max_pending or 4 * self.workers)
+        self.responses = QueryCache(max_entries=cache_entries)
+        self.version = self._data_version()
+        self.metrics = {}
+        self.started = time.monotonic()
+        self.in_flight = 0
+
+    # ---------- data version ----------
+    @staticmethod
+    def _data_version():
+        token = "|".join(artifact_version(name) for name in ARTIFACTS)
+        return hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+
+    async def _watch_versions(self):
+        # Files are re-fingerprinted every few seconds, not on every request
+        while True:
+            await asyncio.sleep(VERSION_REFRESH_SECONDS)
+            self.version = await asyncio.to_thread(self._data_version)
+            self.responses.set_version("api", self.version)
+
+    # ---------- routing ----------
+    async def _cached(self, target, compute):
+        key = ("api", self.version, target)
+        hit, body = self.responses.get(key)
+        if hit:
+            return body
+        body = await asyncio.to_thread(lambda: _encode(compute()))
+        self.responses.put(key, body)
+        return body
+
+    async def _simulate_fresh(self, n, seed):
+        if self.sim_slots.locked():
+            raise HTTPError(503, "simulation queue full, retry later")
+        async with self.sim_slots:
+            snapshot = get_artifact("elo_model").snapshot()
+            loop = asyncio.get_running_loop()
+            start = time.perf_counter()
+            table = await loop.run_in_executor(self.pool, _simulate, snapshot, n, seed)
+            elapsed = time.perf_counter() - start
+        return _encode({"n": n, "seed": seed, "seconds": round(elapsed, 3),
+                        "snapshot_version": snapshot.version, "teams": table})
+
+    async def route(self, path, query, target):
+        """(route name, encoded body) or raises HTTPError / KeyError / ValueError."""
+        parts = [unquote(p) for p in path.strip("/").split("/") if p]
+        arg = lambda name, default=None: query.get(name, [default])[0]
+
+        if parts == ["health"]:
+            return "health", _encode({"status": "ok", "version": self.version})
+        if parts == ["metrics"]:
+            return "metrics", _encode(self.metrics_summary())
+        if parts == ["teams"]:
+            return "teams", await self._cached(target, lambda: sorted(known_teams()))
+        if len(parts) == 2 and parts[0] == "teams":
+            return "team_profile", await self._cached(target, lambda: team_profile(parts[1]))
+        if parts == ["ratings"]:
+            since, top = _int(arg("since")), _int(arg("top"))
+            if since is not None and since not in period_start_years():
+                # Each new year is a ~2 s replay kept in memory for good : only the precomputed periods
+                raise ValueError(f"since must be one of {sorted(period_start_years())}")
+            return "ratings", await self._cached(target, lambda: elo_ranking(since, top))
+        if len(parts) == 2 and parts[0] == "ratings":
+            return "team_rating", await self._cached(target, lambda: team_rating(parts[1]))
+        if parts == ["h2h"]:
+            team, opponent = arg("team"), arg("opponent")
+            if not team or not opponent:
+                raise ValueError("query parameters 'team' and 'opponent' are required")
+            return "h2h", await self._cached(target, lambda: h2h(team, opponent))
+        if parts == ["probabilities"]:
+            return "probabilities", await self._cached("/probabilities", self._reference_probabilities)
+        if parts == ["simulate"]:
+            n = _int(arg("n"), 1000)
+            if not 1 <= n <= MAX_SIMULATIONS:
+                raise ValueError(f"n must be between 1 and {MAX_SIMULATIONS}")
+            return "simulate", await self._simulate_fresh(n, _int(arg("seed")))
+
+        raise HTTPError(404, f"no route for {path}")
+
+    def _reference_probabilities(self):
+        snapshot = get_artifact("elo_model").snapshot()
+        return {"n": REFERENCE_SIMULATIONS, "seed": 0, "snapshot_version": snapshot.version,
+                "teams": self.pool.submit(_simulate, snapshot, REFERENCE_SIMULATIONS, 0).result()}
+
+    # ---------- HTTP ----------
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                status, body = await self.respond(method, target)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                head = (
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode("latin-1")
+                writer.write(head + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, target):
+        start = time.perf_counter()
+        self.in_flight += 1
+        name, status = "unknown", 200
+        try:
+            if method != "GET":
+                raise HTTPError(405, "only GET is supported")
+            url = urlsplit(target)
+            name, body = await self.route(url.path, parse_qs(url.query), target)
+        except HTTPError as e:
+            status, body = e.status, _encode({"error": str(e)})
+        except KeyError as e:
+            status, body = 404, _encode({"error": e.args[0] if e.args else str(e)})
+        except ValueError as e:
+            status, body = 400, _encode({"error": str(e)})
+        except Exception as e:
+            status, body = 500, _encode({"error": f"{type(e).__name__}: {e}"})
+        finally:
+            self.in_flight -= 1
+
+        self.metrics.setdefault(name, RouteMetrics()).record(time.perf_counter() - start, error=status >= 500)
+        return status, body
+
+    def metrics_summary(self):
+        uptime = time.monotonic() - self.started
+        total = sum(m.count for m in self.metrics.values())
+        return {
+            "uptime_s": round(uptime, 1),
+            "requests": total,
+            "requests_per_s": round(total / uptime, 1) if uptime else 0.0,
+            "in_flight": self.in_flight,
+            "workers": self.workers,
+            "response_cache": self.responses.stats(),
+            "routes": {name: m.summary() for name, m in sorted(self.metrics.items())},
+        }
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        # Artifacts loaded before the first request (disk, or built if missing)
+        await asyncio.to_thread(lambda: [get_artifact(n) for n in ("elo_model", "can_h2h_matrix", "training_form_index")])
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        watcher = asyncio.create_task(self._watch_versions())
+        print(f"🌐 AFCON API on http://{host}:{port} ({self.workers} simulation workers)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+            self.pool.shutdown(cancel_futures=True)
+
+
+def _encode(value):
+    return json.dumps(to_jsonable(value), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+def _int(value, default=None):
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"expected an integer, got '{value}'")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AFCON analytics HTTP JSON API.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="simulation processes (default : CPU count)")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(AnalyticsAPI(workers=args.workers).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+# ======================================================
+# Persistent artifact store
+# ======================================================
+# Derived artifacts (Elo model, period timelines, aggregates...) pickled on
+# disk so a restart does not recompute them. A file is only reused when both
+# the code version and the input data fingerprint match.
+#
+# - atomic writes : temp file in the same directory + os.replace
+# - eviction      : least recently used files first, above max_bytes
+
+CACHE_DIR = os.environ.get("AFCON_CACHE_DIR", os.path.join(".cache", "artifacts"))
+DEFAULT_MAX_BYTES = int(float(os.environ.get("AFCON_CACHE_MAX_MB", 512)) * 1024 * 1024)
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_code_version = None
+
+
+def code_version():
+    """Hash of the analytics code (src/*.py), or AFCON_CODE_VERSION if set (e.g. a git sha)."""
+    global _code_version
+    if _code_version is None:
+        env = os.environ.get("AFCON_CODE_VERSION")
+        if env:
+            _code_version = env
+        else:
+            h = hashlib.blake2b(digest_size=6)
+            for path in sorted(glob.glob(os.path.join(SRC_DIR, "*.py"))):
+                with open(path, "rb") as f:
+                    h.update(f.read())
+            _code_version = h.hexdigest()
+    return _code_version
+
+
+def _safe_name(name):
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in str(name))
+
+
+class ArtifactStore:
+    def __init__(self, root=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def path(self, name, data_version):
+        return os.path.join(self.root, f"{_safe_name(name)}--{code_version()}--{data_version}.pkl")
+
+    def load(self, name, data_version):
+        """(True, value) if a matching artifact exists on disk, else (False, None)."""
+        path = self.path(name, data_version)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception as e:
+            # Corrupted / incompatible file : ignore it, it will be rebuilt
+            print(f"Artifact ignoré ({path}) : {e}")
+            return False, None
+
+        try:
+            os.utime(path)   # mark as recently used for eviction
+        except OSError:
+            pass
+        return True, value
+
+    def save(self, name, data_version, value):
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path(name, data_version)
+
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=".pkl")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        self._drop_other_versions(name, keep=path)
+        self.evict()
+        return path
+
+    def get_or_build(self, name, data_version, builder):
+        """Load the artifact, or build it with builder() and persist it."""
+        hit, value = self.load(name, data_version)
+        if hit:
+            return value
+        value = builder()
+        try:
+            self.save(name, data_version, value)
+        except OSError as e:
+            # Read-only FS, disk full... the app keeps working without persistence
+            print(f"Artifact non sauvegardé ({name}) : {e}")
+        return value
+
+    def _drop_other_versions(self, name, keep):
+        for path in glob.glob(os.path.join(self.root, f"{_safe_name(name)}--*.pkl")):
+            if path != keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def entries(self):
+        """[(path, size, last_used)] of the stored artifacts."""
+        out = []
+        for path in glob.glob(os.path.join(self.root, "*.pkl")):
+            if os.path.basename(path).startswith(".tmp-"):
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            out.append((path, st.st_size, st.st_mtime))
+        return out
+
+    def total_bytes(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Remove least recently used artifacts until the store fits in max_bytes."""
+        with self._lock:
+            entries = sorted(self.entries(), key=lambda e: e[2])
+            total = sum(size for _, size, _ in entries)
+            for path, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            os.remove(path)
+
+
+artifact_store = ArtifactStore()
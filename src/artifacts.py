@@ -0,0 +1,148 @@
+import threading
+
+import pandas as pd
+
+from src import perf
+from src.artifact_store import artifact_store
+from src.can2025 import proba_matrix
+from src.datasets import dataset_files, freeze, get_dataset
+from src.elo_engine import AdvancedElo, compute_period_elo
+from src.fingerprint import dataset_version
+from src.form import FormIndex
+from src.goal_model import GoalModel
+from src.score_cubes import ScoreCube
+from src.scorer_index import ScorerIndex
+from src.shootouts import shootout_table
+from src.team_stats import h2h_matrix, power_ranking
+
+# ======================================================
+# Derived artifacts registry
+# ======================================================
+# One place that knows how every derived artifact is built and which
+# datasets it reads. Pages (through their st.cache_* wrappers) and the
+# pre-warm command (src/prewarm.py) both go through get_artifact(), so they
+# read and write exactly the same files in the artifact store.
+#
+# Parameterized artifacts (period_elo) take positional arguments, which are
+# part of the stored name : period_elo_2010, period_elo_2015...
+
+
+def _elo_model(progress=None):
+    model = AdvancedElo()
+    model.train_model(get_dataset("training"), progress=progress)
+    return model
+
+
+def _can_matches():
+    afcon = get_dataset("afcon")
+    return afcon[afcon["tournament_class"] == "can_final"]
+
+
+def _power_ranking():
+    training = get_dataset("training")
+    return power_ranking(
+        get_artifact("elo_model").ratings, training, get_dataset("afcon"), get_artifact("training_form_index")
+    )
+
+
+# name -> (datasets read, builder, artifacts it depends on)
+_SPECS = {
+    "elo_model": (["training"], _elo_model, []),
+    "goal_model": (["training"], lambda: GoalModel.fit(get_dataset("training")), []),
+    "training_form_index": (["training"], lambda: FormIndex.from_matches(get_dataset("training")), []),
+    "period_elo": (["results"], lambda start_year: compute_period_elo(get_dataset("results"), start_year), []),
+    "results_score_cube": (["results"], lambda: ScoreCube.from_matches(get_dataset("results")), []),
+    "can_score_cube": (["afcon"], lambda: ScoreCube.from_matches(_can_matches()), []),
+    "can_h2h_matrix": (["afcon"], lambda: h2h_matrix(_can_matches()), []),
+    "scorer_index": (["goals"], lambda: ScorerIndex.from_goals(get_dataset("goals")), []),
+    "can_scorer_index": (["afcon_goals"], lambda: ScorerIndex.from_goals(get_dataset("afcon_goals")), []),
+    "can_final_scorer_index": (
+        ["afcon_goals", "can"],
+        lambda: ScorerIndex.from_goals(get_dataset("afcon_goals"), matches=get_dataset("can")),
+        [],
+    ),
+    "can_shootout_table": (["can"], lambda: shootout_table(get_dataset("can")), []),
+    "proba_matrix": (["training"], lambda: proba_matrix(get_artifact("elo_model")), ["elo_model"]),
+    "power_ranking": (
+        ["training", "afcon"], _power_ranking, ["elo_model", "training_form_index"]
+    ),
+}
+
+ARTIFACTS = list(_SPECS)
+
+_loaded = {}                 # key -> (data version, value) : artifacts already in memory
+_lock = threading.RLock()
+
+
+def artifact_version(name):
+    """Fingerprint of the files an artifact is built from."""
+    files = sorted({f for d in _SPECS[name][0] for f in dataset_files(d)})
+    return dataset_version(*files)
+
+
+def artifact_dependencies(name):
+    return list(_SPECS[name][2])
+
+
+def artifact_key(name, *args):
+    """Name under which the artifact is stored (arguments included)."""
+    return "_".join([name] + [str(a) for a in args])
+
+
+def build_artifact(name, *args):
+    """Build an artifact from the data, bypassing the store (benchmarks, debugging)."""
+    if name not in _SPECS:
+        raise KeyError(f"Unknown artifact '{name}'. Available: {', '.join(ARTIFACTS)}")
+    return _SPECS[name][1](*args)
+
+
+def _shared(value):
+    # Kept in memory and handed to every caller : tables are read-only
+    if isinstance(value, pd.DataFrame):
+        return freeze(value)
+    if isinstance(value, tuple):
+        return tuple(_shared(v) for v in value)
+    return value
+
+
+def get_artifact(name, *args, progress=None):
+    """
+    Load an artifact (memory, then disk), or build and persist it.
+    The in-memory copy is shared by every caller of the process.
+    `progress(fraction)` is forwarded to long builders that report it (elo_model).
+    """
+    if name not in _SPECS:
+        raise KeyError(f"Unknown artifact '{name}'. Available: {', '.join(ARTIFACTS)}")
+
+    key, version = artifact_key(name, *args), artifact_version(name)
+    cached = _loaded.get(key)
+    if cached is not None and cached[0] == version:
+        perf.note_cache(True)
+        return cached[1]
+    perf.note_cache(False)
+
+    builder = _SPECS[name][1]
+    if progress is not None:
+        build = lambda: builder(*args, progress=progress)
+    else:
+        build = lambda: builder(*args)
+
+    with _lock:
+        cached = _loaded.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, _shared(artifact_store.get_or_build(key, version, build)))
+            _loaded[key] = cached
+    return cached[1]
+
+
+def loaded_artifacts():
+    """{key: (data version, value)} of the artifacts currently held in memory."""
+    with _lock:
+        return dict(_loaded)
+
+
+def period_start_years():
+    """Start years offered by the Elo page (whole history, last 5 / 10 / 15 years)."""
+    years = get_dataset("results")["year"]
+    min_year, max_year = int(years.min()), int(years.max())
+    return [min_year, max_year - 5, max_year - 10, max_year - 15]
@@ -0,0 +1,122 @@
+import gc
+import json
+import os
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from src.artifact_store import code_version
+from src.datasets import RESULTS_FILE
+from src.elo_engine import AdvancedElo, compute_elo_incremental, compute_period_elo
+from src.synthetic import synthetic_results
+
+# ======================================================
+# Rating engines benchmark
+# ======================================================
+# Times every Elo engine on the bundled results.csv and on synthetic
+# histories, and writes one JSON file per run :
+#
+#   python -m src bench --suite engines [--sizes results,10000,100000,1000000] [-o file.json]
+#
+# Per (engine, dataset) : best wall time over `repeat` runs, matches/s, and
+# peak Python memory (tracemalloc, measured in a separate run so it does not
+# slow down the timed ones).
+
+DEFAULT_SIZES = ["results", 10_000, 100_000, 1_000_000]
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+def load_benchmark_dataset(size, seed=0):
+    """('results', df) for the bundled file, ('synthetic_<n>', df) otherwise."""
+    if str(size) == "results":
+        df = pd.read_csv(RESULTS_FILE).dropna(subset=["home_score", "away_score"])
+        df["date"] = pd.to_datetime(df["date"])
+        return "results", df.sort_values("date", kind="stable").reset_index(drop=True)
+    n = int(size)
+    return f"synthetic_{n}", synthetic_results(n, seed=seed)
+
+
+def _advanced_elo(df):
+    AdvancedElo().train_model(df)
+
+
+ENGINES = {
+    "compute_elo_incremental": lambda df: compute_elo_incremental(df),
+    "compute_period_elo": lambda df: compute_period_elo(df, int(df["date"].dt.year.max()) - 10),
+    "advanced_elo": _advanced_elo,
+}
+
+
+def _time(func, df, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(func, df):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(df)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_engine_benchmarks(sizes=DEFAULT_SIZES, engines=None, repeat=1, memory=True, seed=0, log=print):
+    """List of result dicts, one per (engine, dataset)."""
+    engines = engines or list(ENGINES)
+    rows = []
+    for size in sizes:
+        dataset, df = load_benchmark_dataset(size, seed=seed)
+        for engine in engines:
+            func = ENGINES[engine]
+            seconds = _time(func, df, repeat)
+            peak = _peak_memory(func, df) if memory else None
+            row = {
+                "engine": engine,
+                "dataset": dataset,
+                "matches": len(df),
+                "seconds": round(seconds, 4),
+                "matches_per_s": round(len(df) / seconds, 1) if seconds else None,
+                "peak_mb": round(peak / 2**20, 2) if peak is not None else None,
+                "repeat": repeat,
+            }
+            rows.append(row)
+            if log:
+                peak_txt = f"{row['peak_mb']:>9.1f} MB" if memory else ""
+                log(f"{engine:<24} {dataset:<18} {seconds:>9.3f}s {row['matches_per_s']:>12,.0f} matches/s {peak_txt}")
+        del df
+    return rows
+
+
+def environment():
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "code_version": code_version(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_report(rows, path=None, suite="engines"):
+    """Writes {"suite", "environment", "results"} as JSON. Default : benchmarks/results/<suite>-<utc time>.json"""
+    if path is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = os.path.join(RESULTS_DIR, f"{suite}-{stamp}.json")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"suite": suite, "environment": environment(), "results": rows}, f, indent=2)
+    return path
@@ -0,0 +1,91 @@
+import pandas as pd
+
+# ======================================================
+# CAN 2025 (Maroc) : participants, groupes, calendrier
+# ======================================================
+# Noms affichés (français) -> noms des datasets (anglais)
+NAME_MAP = {
+    "Maroc": "Morocco", "Égypte": "Egypt", "Sénégal": "Senegal", "Côte d'Ivoire": "Ivory Coast",
+    "Cameroun": "Cameroon", "Algérie": "Algeria", "Tunisie": "Tunisia", "Afrique du Sud": "South Africa",
+    "RD Congo": "DR Congo", "Guinée": "Guinea", "Guinée équatoriale": "Equatorial Guinea",
+    "Comores": "Comoros", "Zambie": "Zambia", "Ouganda": "Uganda", "Tanzanie": "Tanzania",
+    "Bénin": "Benin", "Soudan": "Sudan", "Mozambique": "Mozambique", "Mali": "Mali",
+    "Nigeria": "Nigeria", "Burkina Faso": "Burkina Faso", "Angola": "Angola", "Gabon": "Gabon",
+    "Zimbabwe": "Zimbabwe", "Botswana": "Botswana"
+}
+
+HOST = "Maroc"
+HOST_ADVANTAGE = 100
+
+# Groupes officiels
+GROUPS = {
+    "A": ["Maroc", "Mali", "Zambie", "Comores"],
+    "B": ["Égypte", "Angola", "Afrique du Sud", "Zimbabwe"],
+    "C": ["Tunisie", "Nigeria", "Ouganda", "Tanzanie"],
+    "D": ["Sénégal", "RD Congo", "Botswana", "Bénin"],
+    "E": ["Algérie", "Burkina Faso", "Guinée équatoriale", "Soudan"],
+    "F": ["Côte d'Ivoire", "Cameroun", "Gabon", "Mozambique"]
+}
+
+# Calendrier de la phase de groupes : (date, heure, équipe A, équipe B, groupe, stade, ville)
+FIXTURES = [
+    ("2025-12-21", "19:00", "Maroc", "Comores", "A", "Prince Moulay Abdellah", "Rabat"),
+    ("2025-12-22", "15:30", "Mali", "Zambie", "A", "Mohammed V", "Casablanca"),
+    ("2025-12-22", "17:00", "Égypte", "Zimbabwe", "B", "Grand stade d’Agadir", "Agadir"),
+    ("2025-12-22", "19:30", "Afrique du Sud", "Angola", "B", "Grand stade de Marrakech", "Marrakech"),
+    ("2025-12-23", "12:00", "Nigeria", "Tanzanie", "C", "Complexe sportif de Fès", "Fès"),
+    ("2025-12-23", "14:30", "Tunisie", "Ouganda", "C", "Annexe Moulay Abdellah", "Rabat"),
+    ("2025-12-23", "17:00", "Sénégal", "Botswana", "D", "Grand stade de Tanger", "Tanger"),
+    ("2025-12-23", "19:30", "RD Congo", "Bénin", "D", "Stade El Barid", "Rabat"),
+    ("2025-12-24", "12:00", "Algérie", "Soudan", "E", "Prince Moulay El Hassan", "Rabat"),
+    ("2025-12-24", "14:30", "Burkina Faso", "Guinée équatoriale", "E", "Mohammed V", "Casablanca"),
+    ("2025-12-24", "17:00", "Côte d'Ivoire", "Mozambique", "F", "Grand stade de Marrakech", "Marrakech"),
+    ("2025-12-24", "19:30", "Cameroun", "Gabon", "F", "Grand stade d’Agadir", "Agadir"),
+    ("2025-12-26", "12:00", "Maroc", "Mali", "A", "Prince Moulay Abdellah", "Rabat"),
+    ("2025-12-26", "14:30", "Zambie", "Comores", "A", "Mohammed V", "Casablanca"),
+    ("2025-12-26", "17:00", "Égypte", "Afrique du Sud", "B", "Grand stade d’Agadir", "Agadir"),
+    ("2025-12-26", "19:30", "Angola", "Zimbabwe", "B", "Grand stade de Marrakech", "Marrakech"),
+    ("2025-12-27", "12:00", "Nigeria", "Tunisie", "C", "Complexe sportif de Fès", "Fès"),
+    ("2025-12-27", "14:30", "Ouganda", "Tanzanie", "C", "Stade El Barid", "Rabat"),
+    ("2025-12-27", "17:00", "RD Congo", "Sénégal", "D", "Grand stade de Tanger", "Tanger"),
+    ("2025-12-27", "19:30", "Bénin", "Botswana", "D", "Annexe Moulay Abdellah", "Rabat"),
+    ("2025-12-28", "12:00", "Algérie", "Burkina Faso", "E", "Prince Moulay El Hassan", "Rabat"),
+    ("2025-12-28", "14:30", "Guinée équatoriale", "Soudan", "E", "Mohammed V", "Casablanca"),
+    ("2025-12-28", "17:00", "Cameroun", "Côte d'Ivoire", "F", "Grand stade de Marrakech", "Marrakech"),
+    ("2025-12-28", "19:30", "Gabon", "Mozambique", "F", "Grand stade d’Agadir", "Agadir"),
+    ("2025-12-29", "17:30", "Maroc", "Zambie", "A", "Prince Moulay Abdellah", "Rabat"),
+    ("2025-12-29", "17:30", "Comores", "Mali", "A", "Mohammed V", "Casablanca"),
+    ("2025-12-29", "19:30", "Égypte", "Angola", "B", "Grand stade d’Agadir", "Agadir"),
+    ("2025-12-29", "19:30", "Zimbabwe", "Afrique du Sud", "B", "Grand stade de Marrakech", "Marrakech"),
+    ("2025-12-30", "17:00", "Nigeria", "Ouganda", "C", "Complexe sportif de Fès", "Fès"),
+    ("2025-12-30", "17:00", "Tanzanie", "Tunisie", "C", "Annexe Moulay Abdellah", "Rabat"),
+    ("2025-12-30", "19:30", "Botswana", "RD Congo", "D", "Stade El Barid", "Rabat"),
+    ("2025-12-30", "19:30", "Bénin", "Sénégal", "D", "Grand stade de Tanger", "Tanger"),
+    ("2025-12-31", "17:00", "Guinée équatoriale", "Algérie", "E", "Prince Moulay El Hassan", "Rabat"),
+    ("2025-12-31", "17:00", "Burkina Faso", "Soudan", "E", "Mohammed V", "Casablanca"),
+    ("2025-12-31", "19:30", "Cameroun", "Mozambique", "F", "Grand stade d’Agadir", "Agadir"),
+    ("2025-12-31", "19:30", "Côte d'Ivoire", "Gabon", "F", "Grand stade de Marrakech", "Marrakech"),
+]
+
+FIXTURE_COLUMNS = ["Date", "Heure", "Équipe A", "Équipe B", "Groupe", "Stade", "Ville"]
+
+
+def fixtures_frame():
+    return pd.DataFrame(FIXTURES, columns=FIXTURE_COLUMNS)
+
+
+def proba_matrix(model):
+    """P(victoire A contre B) pour chaque couple de participants (avantage au pays hôte)."""
+    ratings = model.snapshot()   # une seule version des ratings pour toute la matrice
+    teams_fr = list(NAME_MAP.keys())
+    rows = []
+    for t1 in teams_fr:
+        for t2 in teams_fr:
+            if t1 == t2:
+                prob = 0.5
+            else:
+                r1, r2 = ratings.get(NAME_MAP[t1]), ratings.get(NAME_MAP[t2])
+                home_adv = HOST_ADVANTAGE if t1 == HOST else (-HOST_ADVANTAGE if t2 == HOST else 0)
+                prob = 1 / (1 + 10 ** ((r2 - (r1 + home_adv)) / 400))
+            rows.append({"Équipe A": t1, "Équipe B": t2, "Probabilité": round(prob, 2)})
+    return pd.DataFrame(rows)
@@ -0,0 +1,272 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from src.artifacts import ARTIFACTS, build_artifact, get_artifact, period_start_years
+from src.queries import elo_ranking, team_profile, to_jsonable
+from src.simulation import simulate_many
+
+# ======================================================
+# Command line : python -m src <command>
+# ======================================================
+#   build      datasets (optional) + every derived artifact (see src/prewarm.py)
+#   elo        Elo ranking (advanced model, or classic Elo since a given year)
+#   stats      one team's CAN profile, or the CAF power ranking
+#   simulate   Monte Carlo of the CAN 2025 → probability of reaching each round (--lock : what-if)
+#   serve      HTTP JSON API over the same queries (src/api.py)
+#   memory     bytes / rows / dtypes of every cached dataset and artifact (src/memory.py)
+#   loadtest   concurrent AppTest sessions over app.py and the pages (src/loadtest.py)
+#   perf-gate  fresh benchmarks vs benchmarks/baseline.json, exit 1 on regression (src/perf_gate.py)
+#   live       CAN 2025 forecast from the results played so far (src/live.py)
+#   bench      build time of every artifact + simulation throughput,
+#              or (--suite engines) Elo engines on results.csv and synthetic histories
+#
+# Tables go to .json (records), .parquet or .csv depending on --out; without
+# --out the result is printed as JSON. No Streamlit import on these paths.
+
+
+# ======================================================
+# Output
+# ======================================================
+def write_output(value, path=None):
+    """DataFrame → .parquet / .csv / .json ; anything else → JSON. No path : stdout."""
+    if path is None:
+        json.dump(to_jsonable(value), sys.stdout, ensure_ascii=False, allow_nan=False, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    ext = os.path.splitext(path)[1].lower()
+
+    if isinstance(value, pd.DataFrame) and ext == ".parquet":
+        value.to_parquet(path, index=False)   # needs pyarrow or fastparquet
+    elif isinstance(value, pd.DataFrame) and ext == ".csv":
+        value.to_csv(path, index=False)
+    elif ext in (".json", ""):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(to_jsonable(value), f, ensure_ascii=False, allow_nan=False, indent=2)
+    else:
+        raise ValueError(f"Unsupported output '{path}' (use .json, .parquet or .csv for tables)")
+    print(f"✔️ {path}", file=sys.stderr)
+
+
+# ======================================================
+# Commands
+# ======================================================
+def cmd_build(args):
+    if args.datasets:
+        from src import build_datasets
+        build_datasets.main()
+
+    from src.prewarm import main as prewarm_main
+    return prewarm_main((["--jobs", str(args.jobs)] if args.jobs else []) + (["--force"] if args.force else []))
+
+
+def cmd_elo(args):
+    write_output(elo_ranking(args.since, args.top), args.out)
+
+
+def cmd_stats(args):
+    if args.team:
+        write_output(team_profile(args.team, args.form), args.out)
+    else:
+        write_output(get_artifact("power_ranking"), args.out)
+
+
+def cmd_simulate(args):
+    start = time.perf_counter()
+    if args.lock:
+        from src.scenarios import SimulationSet, parse_result
+        locks = dict(parse_result(text) for text in args.lock)
+        sims = SimulationSet(get_artifact("elo_model").snapshot(), n=args.n, seed=args.seed)
+        table = sims.probabilities(locks)
+    else:
+        table = simulate_many(get_artifact("elo_model").snapshot(), n=args.n, seed=args.seed)
+    print(f"🎲 {args.n} tournois en {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    write_output(table, args.out)
+
+
+def run_bench(repeat=1, n_sim=200):
+    """Build time of each artifact (store bypassed) + simulation throughput."""
+    rows = []
+    tasks = [(name, (period_start_years()[-1],) if name == "period_elo" else ()) for name in ARTIFACTS]
+    for name, extra in tasks:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            build_artifact(name, *extra)
+            times.append(time.perf_counter() - start)
+        rows.append({"name": "_".join([name] + [str(a) for a in extra]), "seconds": min(times), "repeat": repeat})
+
+    snapshot = get_artifact("elo_model").snapshot()
+    start = time.perf_counter()
+    simulate_many(snapshot, n=n_sim, seed=0)
+    elapsed = time.perf_counter() - start
+    rows.append({"name": f"simulate_{n_sim}", "seconds": elapsed, "repeat": 1,
+                 "tournaments_per_s": n_sim / elapsed if elapsed else None})
+    return pd.DataFrame(rows)
+
+
+def cmd_bench(args):
+    if args.suite == "engines":
+        from src.benchmarks import DEFAULT_SIZES, run_engine_benchmarks, write_report
+        sizes = args.sizes.split(",") if args.sizes else DEFAULT_SIZES
+        engines = args.engines.split(",") if args.engines else None
+        rows = run_engine_benchmarks(sizes, engines, repeat=args.repeat, memory=not args.no_memory,
+                                     log=lambda line: print(line, file=sys.stderr))
+        print(f"✔️ {write_report(rows, args.out, suite='engines')}", file=sys.stderr)
+        return 0
+
+    table = run_bench(args.repeat, args.n_sim)
+    for row in table.itertuples():
+        print(f"{row.name:<28} {row.seconds:>8.3f}s", file=sys.stderr)
+    write_output(table, args.out)
+
+
+def cmd_memory(args):
+    from src import memory
+    return memory.main(
+        (["--warm"] if args.warm else []) + (["--budget-mb", str(args.budget_mb)] if args.budget_mb else [])
+        + (["-o", args.out] if args.out else [])
+    )
+
+
+def cmd_loadtest(args):
+    from src import loadtest
+    return loadtest.main(
+        (["--targets", args.targets] if args.targets else [])
+        + ["--sessions", str(args.sessions), "--reruns", str(args.reruns), "--think-ms", str(args.think_ms),
+           "--seed", str(args.seed)]
+        + (["-o", args.out] if args.out else [])
+    )
+
+
+def cmd_perf_gate(args):
+    from src import perf_gate
+    return perf_gate.main(
+        ["--baseline", args.baseline, "--repeat", str(args.repeat)]
+        + (["--metrics", args.metrics] if args.metrics else [])
+        + (["--update-baseline"] if args.update_baseline else [])
+        + (["-o", args.out] if args.out else [])
+    )
+
+
+def cmd_live(args):
+    from src import live
+    return live.main(
+        [arg for text in args.add for arg in ("--add", text)]
+        + (["--date", args.date] if args.date else [])
+        + (["--winner", args.winner] if args.winner else [])
+        + ["--results", args.results, "--history", args.history, "-n", str(args.n), "--seed", str(args.seed)]
+        + (["-o", args.out] if args.out else [])
+    )
+
+
+def cmd_serve(args):
+    from src import api
+    return api.main(
+        (["--host", args.host] if args.host else []) + (["--port", str(args.port)] if args.port else [])
+        + (["--workers", str(args.workers)] if args.workers else [])
+    )
+
+
+# ======================================================
+# Entry point
+# ======================================================
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src", description="AFCON analytics (headless).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="build every derived artifact into the artifact store")
+    p.add_argument("--datasets", action="store_true", help="regenerate data/afcon_*.csv first")
+    p.add_argument("--jobs", type=int, default=None)
+    p.add_argument("--force", action="store_true")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("elo", help="Elo ranking")
+    p.add_argument("--since", type=int, default=None, help="classic Elo over the whole history, period from this year")
+    p.add_argument("--top", type=int, default=None)
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_elo)
+
+    p = sub.add_parser("stats", help="team CAN profile (or power ranking without a team)")
+    p.add_argument("team", nargs="?", default=None, help="English name, e.g. 'Ivory Coast'")
+    p.add_argument("--form", type=int, default=5, help="matches in the recent form")
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("simulate", help="CAN 2025 Monte Carlo")
+    p.add_argument("-n", type=int, default=1000, help="number of tournaments")
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--lock", action="append", default=[], metavar="'Maroc 1-1 Mali'",
+                   help="fix a group-stage result (repeatable), see src/scenarios.py")
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_simulate)
+
+    p = sub.add_parser("serve", help="HTTP JSON API (see src/api.py)")
+    p.add_argument("--host", default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--workers", type=int, default=None)
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("memory", help="memory held by cached datasets and artifacts")
+    p.add_argument("--warm", action="store_true", help="load every dataset and artifact first")
+    p.add_argument("--budget-mb", type=float, default=None, help="exit 1 above this RSS (default : AFCON_MEMORY_BUDGET_MB)")
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_memory)
+
+    p = sub.add_parser("loadtest", help="concurrent Streamlit sessions, rerun latency percentiles")
+    p.add_argument("--targets", default=None, help="comma list : app, compare, elo... (default : all)")
+    p.add_argument("--sessions", type=int, default=8)
+    p.add_argument("--reruns", type=int, default=20)
+    p.add_argument("--think-ms", type=float, default=0.0)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_loadtest)
+
+    p = sub.add_parser("perf-gate", help="compare fresh benchmarks with the committed baseline")
+    p.add_argument("--baseline", default=os.path.join("benchmarks", "baseline.json"))
+    p.add_argument("--metrics", default=None, help="comma list (default : all)")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--update-baseline", action="store_true")
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_perf_gate)
+
+    p = sub.add_parser("live", help="CAN 2025 forecast from the results played so far")
+    p.add_argument("--add", action="append", default=[], metavar="'Maroc 2-0 Comores'",
+                   help="append a result first (repeatable)")
+    p.add_argument("--date", default=None,
+                   help="date of the added results (default : fixture date of a group match, else today)")
+    p.add_argument("--winner", default=None, help="penalty shootout winner of the added drawn knockout results")
+    p.add_argument("--results", default=os.path.join("data", "can2025_results.csv"))
+    p.add_argument("--history", default=os.path.join("data", "can2025_forecasts.csv"))
+    p.add_argument("-n", type=int, default=20_000, help="number of tournaments")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_live)
+
+    p = sub.add_parser("bench", help="time every computation")
+    p.add_argument("--suite", choices=["artifacts", "engines"], default="artifacts",
+                   help="artifacts : every derived artifact ; engines : Elo engines across data sizes (src/benchmarks.py)")
+    p.add_argument("--repeat", type=int, default=1)
+    p.add_argument("--n-sim", type=int, default=200)
+    p.add_argument("--sizes", default=None, help="engines : comma list of 'results' and match counts")
+    p.add_argument("--engines", default=None, help="engines : comma list (default : all)")
+    p.add_argument("--no-memory", action="store_true", help="engines : skip the tracemalloc run")
+    p.add_argument("-o", "--out", default=None)
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args) or 0
+    except (KeyError, ValueError, ImportError) as e:
+        print(f"Erreur : {e.args[0] if e.args else e}", file=sys.stderr)
+        return 2
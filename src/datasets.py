@@ -0,0 +1,249 @@
+import os
+import threading
+
+import pandas as pd
+
+from src.elo_engine import training_window
+from src.fingerprint import dataset_version
+from src.shootouts import attach_shootouts
+
+# ======================================================
+# Read-only dataset views
+# ======================================================
+# Each dataset is parsed and typed ONCE per file fingerprint : datetime,
+# year, decade and tournament class already exist when a page gets it.
+# The returned frames are shared by every caller, so they refuse any
+# in-place mutation. Derived frames (filters, copies, merges...) are plain,
+# writable DataFrames.
+
+DATA_PATH = "data"
+
+RESULTS_FILE = os.path.join(DATA_PATH, "results.csv")
+GOALSCORERS_FILE = os.path.join(DATA_PATH, "goalscorers.csv")
+SHOOTOUTS_FILE = os.path.join(DATA_PATH, "shootouts.csv")
+AFCON_RESULTS_FILE = os.path.join(DATA_PATH, "afcon_results.csv")
+AFCON_GOALS_FILE = os.path.join(DATA_PATH, "afcon_goalscorers.csv")
+OFFICIAL_RECENT_FILE = os.path.join(DATA_PATH, "official_A_last_year.csv")
+
+CAN_FINAL = "African Cup of Nations"
+CAN_QUALIF = "African Cup of Nations qualification"
+
+TOURNAMENT_CLASSES = ["can_final", "can_qualification", "world_cup", "qualification", "friendly", "other"]
+
+
+class ReadOnlyDataError(TypeError):
+    """Raised when code tries to modify a shared dataset view."""
+
+
+def _refuse(*args, **kwargs):
+    raise ReadOnlyDataError(
+        "Shared dataset views are read-only. Work on a derived frame (e.g. df.copy()) instead."
+    )
+
+
+class _ReadOnlyIndexer:
+    """Wraps .loc / .iloc / .at / .iat : reading is allowed, assignment is not."""
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    __setitem__ = _refuse
+
+    def __call__(self, *args, **kwargs):
+        return _ReadOnlyIndexer(self._indexer(*args, **kwargs))
+
+
+class ReadOnlyFrame(pd.DataFrame):
+    """DataFrame that raises ReadOnlyDataError on any in-place modification."""
+
+    @property
+    def _constructor(self):
+        # Any derived result is an ordinary (mutable) DataFrame
+        return pd.DataFrame
+
+    def __setattr__(self, name, value):
+        if name in ("index", "columns") or (not name.startswith("_") and name in self.columns):
+            _refuse()
+        super().__setattr__(name, value)
+
+    __setitem__ = _refuse
+    __delitem__ = _refuse
+    insert = _refuse
+    pop = _refuse
+    update = _refuse
+    _update_inplace = _refuse  # every `inplace=True` path ends here
+
+    @property
+    def loc(self):
+        return _ReadOnlyIndexer(super().loc)
+
+    @property
+    def iloc(self):
+        return _ReadOnlyIndexer(super().iloc)
+
+    @property
+    def at(self):
+        return _ReadOnlyIndexer(super().at)
+
+    @property
+    def iat(self):
+        return _ReadOnlyIndexer(super().iat)
+
+
+class ReadOnlySeries(pd.Series):
+    """Series counterpart of ReadOnlyFrame (memoized query results)."""
+
+    @property
+    def _constructor(self):
+        return pd.Series
+
+    @property
+    def _constructor_expanddim(self):
+        return pd.DataFrame
+
+    def __setattr__(self, name, value):
+        if name in ("index", "name") and self.__dict__.get("_frozen"):
+            _refuse()
+        super().__setattr__(name, value)
+
+    __setitem__ = _refuse
+    __delitem__ = _refuse
+    pop = _refuse
+    update = _refuse
+    _update_inplace = _refuse
+
+    @property
+    def loc(self):
+        return _ReadOnlyIndexer(super().loc)
+
+    @property
+    def iloc(self):
+        return _ReadOnlyIndexer(super().iloc)
+
+    @property
+    def at(self):
+        return _ReadOnlyIndexer(super().at)
+
+    @property
+    def iat(self):
+        return _ReadOnlyIndexer(super().iat)
+
+
+def freeze(df):
+    """Read-only view over df, a DataFrame or a Series (df itself should not be used afterwards)."""
+    if isinstance(df, pd.Series):
+        series = ReadOnlySeries(df)
+        object.__setattr__(series, "_frozen", True)
+        return series
+    return ReadOnlyFrame(df)
+
+
+# ======================================================
+# Typing / derived columns
+# ======================================================
+def tournament_class(tournament):
+    """Vectorized tournament classification (see TOURNAMENT_CLASSES)."""
+    t = tournament.str.lower()
+    is_qualif = t.str.contains("qualification", regex=False)
+    cls = pd.Series("other", index=tournament.index)
+    cls[t.str.contains("friendly", regex=False)] = "friendly"
+    cls[is_qualif] = "qualification"
+    cls[t.str.contains("world cup", regex=False) & ~is_qualif] = "world_cup"
+    cls[tournament == CAN_QUALIF] = "can_qualification"
+    cls[tournament == CAN_FINAL] = "can_final"
+    return pd.Categorical(cls, categories=TOURNAMENT_CLASSES)
+
+
+def _with_dates(df):
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df = df.dropna(subset=["date"])
+    df["year"] = df["date"].dt.year.astype("int16")
+    df["decade"] = (df["year"] // 10 * 10).astype("int16")
+    return df
+
+
+def _prepare_matches(df):
+    # Unplayed fixtures (no score) are not part of the views
+    df = _with_dates(df.dropna(subset=["home_score", "away_score"]).copy())
+    df["home_score"] = df["home_score"].astype("int16")
+    df["away_score"] = df["away_score"].astype("int16")
+    df["neutral"] = df["neutral"].astype(bool)
+    df["tournament_class"] = tournament_class(df["tournament"])
+    return df.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+def _prepare_goals(df):
+    df = _with_dates(df.copy())
+    df["own_goal"] = df["own_goal"].astype(bool)
+    df["penalty"] = df["penalty"].astype(bool)
+    return df.reset_index(drop=True)
+
+
+def _prepare_shootouts(df):
+    return _with_dates(df.copy()).reset_index(drop=True)
+
+
+# ======================================================
+# Registry
+# ======================================================
+# name -> (source files, builder())
+def _build_can():
+    can = get_dataset("afcon")
+    can = can[can["tournament"] == CAN_FINAL]
+    return attach_shootouts(can, get_dataset("shootouts")).reset_index(drop=True)
+
+
+_SPECS = {
+    "results": ([RESULTS_FILE], lambda: _prepare_matches(pd.read_csv(RESULTS_FILE))),
+    "training": ([RESULTS_FILE], lambda: training_window(get_dataset("results")).reset_index(drop=True)),
+    "official_recent": ([OFFICIAL_RECENT_FILE], lambda: _prepare_matches(pd.read_csv(OFFICIAL_RECENT_FILE))),
+    "afcon": ([AFCON_RESULTS_FILE], lambda: _prepare_matches(pd.read_csv(AFCON_RESULTS_FILE))),
+    "can": ([AFCON_RESULTS_FILE, SHOOTOUTS_FILE], _build_can),
+    "goals": ([GOALSCORERS_FILE], lambda: _prepare_goals(pd.read_csv(GOALSCORERS_FILE))),
+    "afcon_goals": ([AFCON_GOALS_FILE], lambda: _prepare_goals(pd.read_csv(AFCON_GOALS_FILE))),
+    "shootouts": ([SHOOTOUTS_FILE], lambda: _prepare_shootouts(pd.read_csv(SHOOTOUTS_FILE))),
+}
+
+DATASETS = list(_SPECS)
+
+_views = {}
+_lock = threading.RLock()
+
+
+def dataset_files(name):
+    return list(_SPECS[name][0])
+
+
+def get_version(name):
+    """Fingerprint token of the files behind a dataset."""
+    return dataset_version(*_SPECS[name][0])
+
+
+def get_dataset(name):
+    """
+    Shared read-only view of a dataset, rebuilt only when its files change.
+    Names : results, training, official_recent, afcon, can, goals, afcon_goals, shootouts
+    """
+    if name not in _SPECS:
+        raise KeyError(f"Unknown dataset '{name}'. Available: {', '.join(DATASETS)}")
+
+    version = get_version(name)
+    cached = _views.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _lock:
+        cached = _views.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, freeze(_SPECS[name][1]()))
+            _views[name] = cached
+    return cached[1]
+
+
+def loaded_datasets():
+    """{name: (version, view)} of the datasets currently held in memory."""
+    with _lock:
+        return dict(_views)
@@ -1,3 +1,7 @@
+import threading
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 
 def expected_score(rA, rB):
@@ -107,3 +111,179 @@ def compute_period_elo(df, start_year, initial_rating=1500, k=30):
         })
 
     return pd.DataFrame(timeline_period), ratings
+
+
+def training_window(df, start_year=2010):
+    """Matchs utilisés pour l'Elo avancé : depuis start_year, hors CHAN, triés par date."""
+    return df[
+        (df["date"].dt.year >= start_year) &
+        (df["tournament"] != "African Nations Championship")
+    ].sort_values("date").copy()
+
+
+# ======================================================
+# Ratings snapshots
+# ======================================================
+# The trained model is shared by every Streamlit session (one thread each).
+# Readers take the current snapshot (a single attribute read) and keep
+# using it : it never changes. Writers build a new snapshot and swap it in,
+# so nobody ever sees a half-applied update and readers never lock.
+class RatingSnapshot:
+    """Immutable Elo ratings : sorted teams, a read-only float array and a team -> id map."""
+
+    def __init__(self, ratings, base_rating=1500, version=0):
+        teams = tuple(sorted(ratings))
+        values = np.array([ratings[t] for t in teams], dtype=float)
+        values.setflags(write=False)
+
+        set_ = super().__setattr__
+        set_("teams", teams)
+        set_("values", values)
+        set_("ids", MappingProxyType({t: i for i, t in enumerate(teams)}))
+        set_("ratings", MappingProxyType(dict(zip(teams, values.tolist()))))
+        set_("base_rating", base_rating)
+        set_("version", version)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RatingSnapshot is immutable")
+
+    def __reduce__(self):
+        return RatingSnapshot, (dict(self.ratings), self.base_rating, self.version)
+
+    def __len__(self):
+        return len(self.teams)
+
+    def __contains__(self, team):
+        return team in self.ids
+
+    def get(self, team):
+        return self.ratings.get(team, self.base_rating)
+
+    def as_dict(self):
+        """Mutable copy of the ratings (team -> Elo)."""
+        return dict(self.ratings)
+
+    def evolve(self, ratings):
+        """Next version of the snapshot with the given full ratings dict."""
+        return RatingSnapshot(ratings, self.base_rating, self.version + 1)
+
+
+# ======================================================
+# Elo "avancé" (pondération par compétition + avantage du terrain)
+# ======================================================
+class AdvancedElo:
+    def __init__(self, base_rating=1500):
+        self.base_rating = base_rating
+        self._snapshot = RatingSnapshot({}, base_rating)
+        self._write_lock = threading.Lock()   # writers only : serializes updates
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """New model starting from a snapshot (the snapshot's owner is left untouched)."""
+        model = cls(snapshot.base_rating)
+        model._snapshot = snapshot
+        return model
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_write_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._write_lock = threading.Lock()
+
+    @property
+    def ratings(self):
+        """Read-only team -> Elo mapping of the current snapshot."""
+        return self._snapshot.ratings
+
+    def snapshot(self):
+        """Current RatingSnapshot. Use it for several reads that must be consistent."""
+        return self._snapshot
+
+    def get_rating(self, team):
+        return self._snapshot.get(team)
+
+    def get_match_weight(self, tournament):
+        t = str(tournament).lower()
+        if "world cup" in t and "qualification" not in t: return 60
+        if "african cup" in t and "qualification" not in t: return 50
+        if "qualification" in t: return 40
+        if "friendly" in t: return 20
+        return 30
+
+    def expected_result(self, rating_a, rating_b, home_advantage=0):
+        return 1 / (1 + 10 ** ((rating_b - (rating_a + home_advantage)) / 400))
+
+    def _apply(self, ratings, team_a, team_b, score_a, score_b, tournament, neutral_ground=False):
+        """One match on a working ratings dict (not shared)."""
+        k = self.get_match_weight(tournament)
+        rat_a = ratings.get(team_a, self.base_rating)
+        rat_b = ratings.get(team_b, self.base_rating)
+        home_adv = 100 if not neutral_ground else 0
+        expected_a = self.expected_result(rat_a, rat_b, home_adv)
+
+        if score_a > score_b:
+            actual = 1
+        elif score_a == score_b:
+            actual = 0.5
+        else:
+            actual = 0
+
+        change = k * (actual - expected_a)
+        ratings[team_a] = rat_a + change
+        ratings[team_b] = rat_b - change
+
+    def _replay(self, df, progress=None):
+        """Replays df on top of the current ratings and publishes ONE new snapshot."""
+        with self._write_lock:
+            ratings = self._snapshot.as_dict()
+            total = len(df)
+            chunks = max(1, total // 100)
+            for i, row in enumerate(df.itertuples()):
+                self._apply(ratings, row.home_team, row.away_team, row.home_score, row.away_score,
+                            row.tournament, row.neutral)
+                if progress is not None and i % chunks == 0:
+                    progress(min(i / total, 1.0))
+            self._snapshot = self._snapshot.evolve(ratings)
+        return self._snapshot
+
+    def update(self, team_a, team_b, score_a, score_b, tournament, neutral_ground=False):
+        """One match → new snapshot."""
+        with self._write_lock:
+            ratings = self._snapshot.as_dict()
+            self._apply(ratings, team_a, team_b, score_a, score_b, tournament, neutral_ground)
+            self._snapshot = self._snapshot.evolve(ratings)
+        return self._snapshot
+
+    def update_many(self, df):
+        """Several matches (sorted by date) → a single new snapshot."""
+        return self._replay(df)
+
+    def pre_match_differences(self, df):
+        """
+        Replays df (sorted by date) from scratch on a private dict, no snapshot published.
+        :return: (Elo home − away before each match, home advantage included ;
+                  matches already played by the less experienced side)
+        """
+        ratings, played = {}, {}
+        diffs = np.empty(len(df))
+        experience = np.empty(len(df), dtype=np.int64)
+        for i, row in enumerate(df.itertuples()):
+            home_adv = 0 if row.neutral else 100
+            diffs[i] = (ratings.get(row.home_team, self.base_rating) + home_adv
+                        - ratings.get(row.away_team, self.base_rating))
+            experience[i] = min(played.get(row.home_team, 0), played.get(row.away_team, 0))
+            self._apply(ratings, row.home_team, row.away_team, row.home_score, row.away_score,
+                        row.tournament, row.neutral)
+            played[row.home_team] = played.get(row.home_team, 0) + 1
+            played[row.away_team] = played.get(row.away_team, 0) + 1
+        return diffs, experience
+
+    def train_model(self, df, progress=None):
+        """
+        Rejoue tous les matchs de df (triés par date).
+        :param progress: callback optionnel progress(fraction), appelé ~100 fois
+        """
+        self._replay(df, progress=progress)
@@ -0,0 +1,49 @@
+import hashlib
+import os
+import threading
+
+# ======================================================
+# Dataset fingerprints
+# ======================================================
+# Small string tokens identifying the exact content of the input files.
+# Cached builders key on these tokens instead of hashing whole DataFrames.
+#
+# The content hash is computed once per (path, size, mtime) : later calls
+# only cost an os.stat().
+
+_CHUNK = 1 << 20
+_memo = {}
+_lock = threading.Lock()
+
+
+def _content_hash(path):
+    h = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_CHUNK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_fingerprint(path):
+    """Token for one file : '<size>-<content hash>'. Missing file → 'missing'."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return "missing"
+
+    key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    token = _memo.get(key)
+    if token is None:
+        token = f"{st.st_size:x}-{_content_hash(path)}"
+        with _lock:
+            _memo[key] = token
+    return token
+
+
+def dataset_version(*paths):
+    """Single token for a set of files (order-sensitive)."""
+    h = hashlib.blake2b(digest_size=8)
+    for p in paths:
+        h.update(file_fingerprint(p).encode())
+        h.update(b"|")
+    return h.hexdigest()
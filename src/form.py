@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+# ======================================================
+# Recent form
+# ======================================================
+# One row per (team, match) sorted by (team, date): the last N matches of a
+# team before any reference date are a contiguous slice ending at a
+# searchsorted position, for one team or for every team at once.
+
+def _to_days(dates):
+    return pd.to_datetime(pd.Series(dates)).to_numpy().astype("datetime64[D]").astype(np.int64)
+
+
+class FormIndex:
+    """Per-team, date-sorted view of a match table (team perspective)."""
+
+    def __init__(self, teams, offsets, long, day0=0):
+        self.teams = teams
+        self._day0 = day0
+        self._team_pos = {t: i for i, t in enumerate(teams)}
+        self._offsets = offsets
+        self._long = long
+
+        self._days = long["day"].to_numpy()
+        self._result = long["result"].to_numpy()
+        self._points = long["points"].to_numpy()
+        self._gf = long["goals_for"].to_numpy()
+        self._ga = long["goals_against"].to_numpy()
+
+        # Composite key (team, day) for vectorized searchsorted over all teams
+        self._span = int(self._days.max()) + 2 if len(self._days) else 1
+        self._team_idx = np.repeat(np.arange(len(teams)), np.diff(offsets))
+        self._key = self._team_idx * self._span + self._days
+
+    # --------------------------------------------------
+    # Build
+    # --------------------------------------------------
+    @classmethod
+    def from_matches(cls, df):
+        df = df.dropna(subset=["home_score", "away_score"])
+        h = df["home_score"].to_numpy().astype(int)
+        a = df["away_score"].to_numpy().astype(int)
+        days = _to_days(df["date"])
+        day0 = int(days.min()) if len(days) else 0
+        days = days - day0
+
+        gf = np.concatenate([h, a])
+        ga = np.concatenate([a, h])
+        result = np.where(gf > ga, "W", np.where(gf == ga, "D", "L"))
+
+        long = pd.DataFrame({
+            "team": np.concatenate([df["home_team"].to_numpy(), df["away_team"].to_numpy()]),
+            "opponent": np.concatenate([df["away_team"].to_numpy(), df["home_team"].to_numpy()]),
+            "date": np.concatenate([df["date"].to_numpy(), df["date"].to_numpy()]),
+            "day": np.concatenate([days, days]),
+            "home": np.r_[np.ones(len(df), dtype=bool), np.zeros(len(df), dtype=bool)],
+            "tournament": np.concatenate([df["tournament"].to_numpy(), df["tournament"].to_numpy()]),
+            "goals_for": gf,
+            "goals_against": ga,
+            "result": result,
+            "points": np.where(gf > ga, 3, np.where(gf == ga, 1, 0)),
+        })
+        long = long.sort_values(["team", "day"], kind="stable").reset_index(drop=True)
+
+        team_col = long["team"].to_numpy()
+        teams, starts = np.unique(team_col, return_index=True)
+        offsets = np.r_[starts, len(long)]
+        return cls(list(teams), offsets, long, day0)
+
+    # --------------------------------------------------
+    # Helpers
+    # --------------------------------------------------
+    def _ref_day(self, before):
+        """Reference date → internal day number (matches strictly before it are kept)."""
+        if before is None:
+            return self._span - 1
+        return int(np.clip(_to_days([before])[0] - self._day0, 0, self._span - 1))
+
+    def _end(self, pos, before):
+        start, stop = self._offsets[pos], self._offsets[pos + 1]
+        if before is None:
+            return start, stop
+        return start, start + int(np.searchsorted(self._days[start:stop], self._ref_day(before), side="left"))
+
+    # --------------------------------------------------
+    # Queries
+    # --------------------------------------------------
+    def last_matches(self, team, n=5, before=None):
+        """Last `n` matches of `team` (most recent first), strictly before `before`."""
+        pos = self._team_pos.get(team)
+        if pos is None:
+            return self._long.iloc[0:0].drop(columns=["team", "day"])
+        start, end = self._end(pos, before)
+        lo = max(start, end - n)
+        return self._long.iloc[lo:end][::-1].drop(columns=["team", "day"]).reset_index(drop=True)
+
+    def form(self, team, n=5, before=None):
+        """(form string most recent first, points) over the last `n` matches."""
+        pos = self._team_pos.get(team)
+        if pos is None:
+            return "", 0
+        start, end = self._end(pos, before)
+        lo = max(start, end - n)
+        return "".join(self._result[lo:end][::-1]), int(self._points[lo:end].sum())
+
+    def all_teams(self, n=5, before=None):
+        """
+        Form of every team in one pass.
+        Columns : team, played, form, points, goals_for, goals_against
+        """
+        n_teams = len(self.teams)
+        starts = self._offsets[:-1]
+        if before is None:
+            ends = self._offsets[1:]
+        else:
+            ref = np.arange(n_teams) * self._span + self._ref_day(before)
+            ends = np.searchsorted(self._key, ref, side="left")
+
+        k = np.arange(n)
+        pos = ends[:, None] - 1 - k[None, :]           # (teams, n), most recent first
+        valid = pos >= starts[:, None]
+        safe = np.where(valid, pos, 0)
+
+        results = np.where(valid, self._result[safe] if len(self._result) else "", "")
+        form = ["".join(row) for row in results]
+
+        def masked_sum(values):
+            return np.where(valid, values[safe], 0).sum(axis=1) if len(values) else np.zeros(n_teams, dtype=int)
+
+        return pd.DataFrame({
+            "team": self.teams,
+            "played": valid.sum(axis=1),
+            "form": form,
+            "points": masked_sum(self._points),
+            "goals_for": masked_sum(self._gf),
+            "goals_against": masked_sum(self._ga),
+        })
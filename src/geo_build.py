@@ -0,0 +1,139 @@
+import json
+import os
+
+import numpy as np
+
+# ======================================================
+# Build a light Africa geometry for the choropleth
+# ======================================================
+# assets/custom.geo.json is a full-resolution Natural Earth export (~2.4 MB).
+# This step keeps only African countries, renames them to the team names
+# used in the match data, simplifies every ring (Douglas-Peucker) and
+# quantizes coordinates. Output : assets/africa_geo.json
+#
+# Usage : python -m src.geo_build [tolerance_degrees]
+
+SOURCE_FILE = os.path.join("assets", "custom.geo.json")
+OUTPUT_FILE = os.path.join("assets", "africa_geo.json")
+
+DEFAULT_TOLERANCE = 0.05   # degrees (~5 km)
+DECIMALS = 2               # ~1 km
+
+# Natural Earth short name -> name used in results.csv
+GEO_TO_TEAM = {
+    "Côte d'Ivoire": "Ivory Coast",
+    "Dem. Rep. Congo": "DR Congo",
+    "Central African Rep.": "Central African Republic",
+    "Eq. Guinea": "Equatorial Guinea",
+    "eSwatini": "Eswatini",
+    "S. Sudan": "South Sudan",
+    "Cabo Verde": "Cape Verde",
+    "São Tomé and Principe": "São Tomé and Príncipe",
+    "Somaliland": "Somalia",   # one football federation
+}
+
+# Territories without a national team in the data
+DROP = {"Bir Tawil", "W. Sahara"}
+
+
+def simplify_ring(points, tolerance):
+    """Douglas-Peucker on one closed ring (N x 2 array). Returns the kept points."""
+    n = len(points)
+    if n <= 4:
+        return points
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        seg = points[start + 1:end]
+        a, b = points[start], points[end]
+        ab = b - a
+        norm = np.hypot(ab[0], ab[1])
+        if norm == 0:
+            dist = np.hypot(seg[:, 0] - a[0], seg[:, 1] - a[1])
+        else:
+            dist = np.abs(ab[0] * (seg[:, 1] - a[1]) - ab[1] * (seg[:, 0] - a[0])) / norm
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+
+    return points[keep]
+
+
+def _clean_ring(ring, tolerance):
+    pts = np.asarray(ring, dtype=float)
+    pts = simplify_ring(pts, tolerance)
+    pts = np.round(pts, DECIMALS)
+
+    # Drop consecutive duplicates created by quantization
+    if len(pts) > 1:
+        pts = pts[np.r_[True, np.any(np.diff(pts, axis=0) != 0, axis=1)]]
+    if len(pts) and not np.array_equal(pts[0], pts[-1]):
+        pts = np.vstack([pts, pts[:1]])
+    return pts if len(pts) >= 4 else None
+
+
+def _polygons(geometry):
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def build_africa_geojson(source=SOURCE_FILE, tolerance=DEFAULT_TOLERANCE):
+    """Simplified FeatureCollection, one feature per team name (feature id = team name)."""
+    with open(source, "r", encoding="utf-8") as f:
+        src = json.load(f)
+
+    polygons_by_team = {}
+    for feature in src["features"]:
+        props = feature.get("properties", {})
+        if props.get("continent", "Africa") != "Africa":
+            continue
+        name = props.get("name")
+        if name in DROP:
+            continue
+        team = GEO_TO_TEAM.get(name, name)
+
+        for poly in _polygons(feature["geometry"]):
+            rings = [_clean_ring(r, tolerance) for r in poly]
+            if rings[0] is None:
+                # Island smaller than the tolerance : keep it unsimplified
+                rings[0] = np.round(np.asarray(poly[0], dtype=float), DECIMALS)
+            rings = [rings[0]] + [r for r in rings[1:] if r is not None]
+            polygons_by_team.setdefault(team, []).append([r.tolist() for r in rings])
+
+    features = []
+    for team in sorted(polygons_by_team):
+        polys = polygons_by_team[team]
+        geometry = (
+            {"type": "Polygon", "coordinates": polys[0]} if len(polys) == 1
+            else {"type": "MultiPolygon", "coordinates": polys}
+        )
+        features.append({"type": "Feature", "id": team, "properties": {"name": team}, "geometry": geometry})
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+def main(tolerance=DEFAULT_TOLERANCE):
+    geo = build_africa_geojson(tolerance=tolerance)
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        json.dump(geo, f, separators=(",", ":"), ensure_ascii=False)
+
+    before = os.path.getsize(SOURCE_FILE)
+    after = os.path.getsize(OUTPUT_FILE)
+    print(f"🗺️  {len(geo['features'])} pays → {OUTPUT_FILE} ({after / 1024:.0f} KB, {after / before:.1%} de l'original)")
+
+
+if __name__ == "__main__":
+    import sys
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TOLERANCE)
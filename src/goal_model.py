@@ -0,0 +1,121 @@
+import math
+import random
+
+import numpy as np
+
+from src.elo_engine import AdvancedElo
+
+# ======================================================
+# Goal model (Poisson, Elo-difference link)
+# ======================================================
+# Goals of each side are independent Poisson draws :
+#
+#   log λ_a = intercept + slope · d / 400      d = Elo(a) − Elo(b), home advantage included
+#   log λ_b = intercept − slope · d / 400
+#
+# Fitted by Newton-Raphson (Poisson maximum likelihood) on the historical
+# table, using the Elo difference of each match BEFORE it was played. The
+# first matches of a team are skipped (its rating is still the base rating).
+# Stored as the "goal_model" artifact, so it is refitted only when the data
+# changes.
+
+MIN_MATCHES = 10
+MAX_GOALS = 30                      # safety bound of the inversion samplers
+
+
+class GoalModel:
+    """Poisson scoreline model : rates(diff), sample / inverse(diff) for arrays, draw(diff) for one match."""
+
+    def __init__(self, intercept, slope, n_matches=0):
+        self.intercept = float(intercept)
+        self.slope = float(slope)
+        self.n_matches = int(n_matches)
+
+    def __repr__(self):
+        return f"GoalModel(intercept={self.intercept:.4f}, slope={self.slope:.4f}, n_matches={self.n_matches})"
+
+    # --------------------------------------------------
+    # Fit
+    # --------------------------------------------------
+    @classmethod
+    def fit(cls, df, min_matches=MIN_MATCHES, max_iter=50, tol=1e-10):
+        """Maximum likelihood fit on a match table (date, teams, scores, tournament, neutral)."""
+        df = df.dropna(subset=["home_score", "away_score"]).sort_values("date", kind="stable")
+        diffs, experience = AdvancedElo().pre_match_differences(df)
+        keep = experience >= min_matches
+
+        # One observation per side : (± d / 400, goals)
+        x = np.concatenate([diffs[keep], -diffs[keep]]) / 400
+        y = np.concatenate([df["home_score"].to_numpy()[keep], df["away_score"].to_numpy()[keep]]).astype(float)
+        if not len(y):
+            raise ValueError("No match left to fit the goal model")
+
+        design = np.column_stack([np.ones_like(x), x])
+        beta = np.array([math.log(max(y.mean(), 1e-6)), 0.0])
+        for _ in range(max_iter):
+            mu = np.exp(design @ beta)
+            gradient = design.T @ (y - mu)
+            hessian = design.T @ (design * mu[:, None])
+            step = np.linalg.solve(hessian, gradient)
+            beta += step
+            if np.abs(step).max() < tol:
+                break
+        return cls(beta[0], beta[1], keep.sum())
+
+    # --------------------------------------------------
+    # Rates and sampling
+    # --------------------------------------------------
+    def rates(self, diff):
+        """Expected goals (λ_a, λ_b) for an Elo difference (scalar or array)."""
+        x = np.asarray(diff, dtype=float) / 400
+        return np.exp(self.intercept + self.slope * x), np.exp(self.intercept - self.slope * x)
+
+    def sample(self, diff, rng=None, size=None):
+        """
+        Scorelines for an array of fixtures at once.
+        :param diff: Elo differences, any shape (broadcast against size)
+        :param rng: numpy Generator (or seed)
+        :return: (goals_a, goals_b) int arrays of shape `size` (default : diff's shape)
+        """
+        rng = np.random.default_rng(rng) if not isinstance(rng, np.random.Generator) else rng
+        lam_a, lam_b = self.rates(diff)
+        return rng.poisson(lam_a, size=size), rng.poisson(lam_b, size=size)
+
+    def inverse(self, diff, u_a, u_b):
+        """
+        Scorelines from uniforms (inverse CDF) : the same uniforms give comparable
+        draws when the Elo differences change (common random numbers).
+        """
+        lam_a, lam_b = self.rates(diff)
+        return _poisson_quantiles(u_a, lam_a), _poisson_quantiles(u_b, lam_b)
+
+    def draw(self, diff, rng=random):
+        """One scoreline with a `random.Random`-like rng (single-tournament display)."""
+        lam_a, lam_b = self.rates(diff)
+        return _poisson(float(lam_a), rng), _poisson(float(lam_b), rng)
+
+
+def _poisson(lam, rng):
+    # Inversion : enough for the small rates of football scores
+    u, k = rng.random(), 0
+    p = cumulative = math.exp(-lam)
+    while u > cumulative and k < MAX_GOALS:
+        k += 1
+        p *= lam / k
+        cumulative += p
+    return k
+
+
+def _poisson_quantiles(u, lam):
+    u = np.asarray(u)
+    p = np.broadcast_to(np.exp(-lam), u.shape).copy()
+    cumulative = p.copy()
+    goals = np.zeros(u.shape, dtype=np.int64)
+    for k in range(1, MAX_GOALS + 1):
+        above = u > cumulative
+        if not above.any():
+            break
+        goals += above
+        p *= lam / k
+        cumulative += p
+    return goals
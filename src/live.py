@@ -0,0 +1,300 @@
+import argparse
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from src.can2025 import FIXTURES, HOST, NAME_MAP
+from src.datasets import CAN_FINAL, DATA_PATH, freeze
+from src.elo_engine import AdvancedElo
+from src.fingerprint import file_fingerprint
+from src.scenarios import SimulationSet, parse_result
+from src.simulation import knockout_bracket
+
+# ======================================================
+# Prévisions en direct (CAN 2025)
+# ======================================================
+# Les résultats joués sont ajoutés à data/can2025_results.csv au coup de
+# sifflet final (à la main, ou `python -m src live --add "Maroc 2-0 Comores"`).
+# À chaque mise à jour (update()) :
+#   - seuls les NOUVEAUX matchs du fichier sont rejoués sur l'Elo
+#     (AdvancedElo.update_many → un nouveau snapshot) ;
+#   - les résultats joués sont relevés (played, knockouts).
+# Un fichier inchangé ne coûte qu'un os.stat(). Les tournois restants ne sont
+# tirés qu'à la première demande (simulations(), forecast) : les résultats de
+# poule joués y sont fixés, seuls les autres matchs sont tirés.
+#
+# Seule la commande `live` écrit l'historique des prévisions, une par
+# journée (data/can2025_forecasts.csv, record()) ; l'application le lit.
+#
+# Les matchs à élimination directe joués mettent l'Elo à jour et sont imposés
+# dans chaque tirage : le vainqueur passe le tour, le perdant est éliminé
+# (colonne `winner` pour un match nul, vainqueur aux tirs au but). Les
+# affiches des tours à venir restent tirées au sort comme dans
+# src/simulation.py : le tableau officiel n'est pas dans les données.
+
+RESULTS_FILE = os.path.join(DATA_PATH, "can2025_results.csv")
+HISTORY_FILE = os.path.join(DATA_PATH, "can2025_forecasts.csv")
+RESULT_COLUMNS = ["date", "team_a", "team_b", "score_a", "score_b", "winner"]
+LIVE_SIMULATIONS = 20_000
+
+GROUP_DATES = {frozenset((a, b)): date for date, _, a, b, *_ in FIXTURES}
+
+_loaded = {}                        # path -> (empreinte, résultats en lecture seule)
+_loaded_lock = threading.Lock()
+
+
+def read_results(path=RESULTS_FILE):
+    """Résultats joués (noms FR), dans l'ordre du fichier. Fichier absent → table vide."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    df = pd.read_csv(path, dtype={"team_a": str, "team_b": str, "winner": str})
+    if "winner" not in df.columns:          # facultative : matchs nuls de phase finale seulement
+        df["winner"] = ""
+    missing = set(RESULT_COLUMNS) - set(df.columns)
+    if missing:
+        raise ValueError(f"{path} : colonnes manquantes {sorted(missing)}")
+    unknown = (set(df["team_a"]) | set(df["team_b"])) - set(NAME_MAP)
+    if unknown:
+        raise ValueError(f"{path} : équipes inconnues {sorted(unknown)}")
+    df = df[RESULT_COLUMNS].dropna(subset=["score_a", "score_b"])
+    df["date"] = pd.to_datetime(df["date"])
+    df["score_a"] = df["score_a"].astype(int)
+    df["score_b"] = df["score_b"].astype(int)
+    df["winner"] = df["winner"].fillna("")
+    return df.reset_index(drop=True)
+
+
+def load_results(path=RESULTS_FILE):
+    """read_results partagé par le process, relu seulement quand l'empreinte du fichier change."""
+    fingerprint = file_fingerprint(path)
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    with _loaded_lock:
+        cached = _loaded.get(path)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, freeze(read_results(path)))
+            _loaded[path] = cached
+    return cached[1]
+
+
+def append_result(text, date=None, path=RESULTS_FILE, winner=None):
+    """
+    Ajoute "Maroc 2-0 Comores" à la fin du fichier des résultats.
+    Date par défaut : celle du calendrier pour un match de poule, sinon la date du jour.
+    `winner` : vainqueur aux tirs au but d'un match nul de phase finale.
+    """
+    (team_a, team_b), (score_a, score_b) = parse_result(text)
+    unknown = {team_a, team_b} - set(NAME_MAP)
+    if unknown:
+        raise ValueError(f"Équipes inconnues : {sorted(unknown)}")
+    if winner is not None and winner not in (team_a, team_b):
+        raise ValueError(f"{winner} ne joue pas {team_a} - {team_b}")
+
+    played = read_results(path)
+    pair = frozenset((team_a, team_b))
+    group_match = pair in GROUP_DATES and pair not in {frozenset(p) for p in zip(played["team_a"], played["team_b"])}
+    if not group_match and score_a == score_b and winner is None:
+        raise ValueError(f"{text} : match nul en phase finale, vainqueur aux tirs au but manquant")
+    if date is None:
+        date = GROUP_DATES[pair] if group_match else pd.Timestamp.today().strftime("%Y-%m-%d")
+    row = pd.DataFrame([[date, team_a, team_b, score_a, score_b, winner or ""]], columns=RESULT_COLUMNS)
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    row.to_csv(path, mode="a", header=new_file, index=False)
+    return row
+
+
+def elo_matches(results):
+    """Résultats → table au format de l'Elo (noms anglais, pays hôte à domicile)."""
+    rows = []
+    for r in results.itertuples(index=False):
+        a, b, sa, sb = r.team_a, r.team_b, r.score_a, r.score_b
+        if b == HOST:
+            a, b, sa, sb = b, a, sb, sa
+        rows.append({"date": r.date, "home_team": NAME_MAP[a], "away_team": NAME_MAP[b], "home_score": sa,
+                     "away_score": sb, "tournament": CAN_FINAL, "neutral": a != HOST})
+    return pd.DataFrame(rows, columns=["date", "home_team", "away_team", "home_score", "away_score",
+                                       "tournament", "neutral"])
+
+
+def _stages(results):
+    """
+    (match de poule ?, ligne) dans l'ordre du fichier. Un match de poule est la première rencontre
+    d'un couple du calendrier des poules (deux équipes d'un même groupe peuvent se retrouver en
+    phase finale) : la date n'intervient pas.
+    """
+    seen = set()
+    for r in results.itertuples(index=False):
+        pair = frozenset((r.team_a, r.team_b))
+        yield pair in GROUP_DATES and pair not in seen, r
+        seen.add(pair)
+
+
+def group_results(results):
+    """Résultats de poule {(A, B): (a, b)}."""
+    return {(r.team_a, r.team_b): (r.score_a, r.score_b) for group, r in _stages(results) if group}
+
+
+def knockout_winner(r):
+    if r.score_a != r.score_b:
+        return r.team_a if r.score_a > r.score_b else r.team_b
+    if r.winner not in (r.team_a, r.team_b):
+        raise ValueError(f"{r.team_a} {r.score_a}-{r.score_b} {r.team_b} : vainqueur aux tirs au but manquant "
+                         f"(colonne winner)")
+    return r.winner
+
+
+def knockout_results(results):
+    """Matchs de phase finale joués [(vainqueur, perdant, buts vainqueur, buts perdant)], dans l'ordre du fichier."""
+    matches = []
+    for group, r in _stages(results):
+        if not group:
+            if knockout_winner(r) == r.team_a:
+                matches.append((r.team_a, r.team_b, r.score_a, r.score_b))
+            else:
+                matches.append((r.team_b, r.team_a, r.score_b, r.score_a))
+    return matches
+
+
+def with_scores(fixtures, col_a, col_b, results=None, column="Score"):
+    """Copie du calendrier des poules avec le score des matchs déjà joués ("" sinon)."""
+    results = load_results() if results is None else results
+    scores = {}
+    for (team_a, team_b), (score_a, score_b) in group_results(results).items():
+        scores[(team_a, team_b)] = f"{score_a}-{score_b}"
+        scores[(team_b, team_a)] = f"{score_b}-{score_a}"
+    out = fixtures.copy()
+    out[column] = [scores.get((a, b), "") for a, b in zip(out[col_a], out[col_b])]
+    return out
+
+
+class LiveForecast:
+    """Elo + résultats joués tenus à jour à partir du fichier des résultats ; prévision tirée à la demande."""
+
+    def __init__(self, snapshot, goal_model=None, n=LIVE_SIMULATIONS, seed=0,
+                 results_file=RESULTS_FILE, history_file=HISTORY_FILE):
+        self.base = snapshot
+        self.goal_model = goal_model
+        self.n = n
+        self.seed = seed
+        self.results_file = results_file
+        self.history_file = history_file
+
+        self.model = AdvancedElo.from_snapshot(snapshot)
+        self.results = pd.DataFrame(columns=RESULT_COLUMNS)
+        self.played, self.knockouts = {}, []
+        self._sims = None
+        self._fingerprint = None
+        self._history, self._history_fingerprint = pd.DataFrame(), None
+        self._lock = threading.Lock()
+
+    def update(self):
+        """Relit le fichier s'il a changé (Elo, résultats joués) ; True s'il a changé."""
+        fingerprint = file_fingerprint(self.results_file)
+        if fingerprint == self._fingerprint:
+            return False
+
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return False
+            results = load_results(self.results_file)
+
+            # Fichier seulement complété : on ne rejoue que les lignes nouvelles
+            applied = len(self.results)
+            if applied and not results.head(applied).equals(self.results):
+                self.model, applied = AdvancedElo.from_snapshot(self.base), 0
+            new = results.iloc[applied:]
+            if len(new):
+                self.model.update_many(elo_matches(new))
+
+            self.played, self.knockouts = group_results(results), knockout_results(results)
+            self.results = results
+            self._sims = None
+            self._fingerprint = fingerprint
+        return True
+
+    def simulations(self):
+        """SimulationSet des matchs restants, tiré au premier appel après un changement du fichier."""
+        self.update()
+        with self._lock:
+            if self._sims is None:
+                self._sims = SimulationSet(self.model.snapshot(), n=self.n, seed=self.seed,
+                                           goal_model=self.goal_model, played=self.played,
+                                           knockouts=self.knockouts)
+            return self._sims
+
+    @property
+    def forecast(self):
+        return self.simulations().probabilities()
+
+    @property
+    def history(self):
+        """Prévisions enregistrées par record() (relues quand le fichier change)."""
+        fingerprint = file_fingerprint(self.history_file) if self.history_file else "missing"
+        if fingerprint != self._history_fingerprint:
+            self._history = (pd.read_csv(self.history_file, parse_dates=["matchday"])
+                             if fingerprint != "missing" else pd.DataFrame())
+            self._history_fingerprint = fingerprint
+        return self._history
+
+    def record(self):
+        """
+        Ajoute la prévision à l'historique : une par journée, la dernière mise à jour d'une journée
+        remplace les précédentes. Rien avant le premier résultat. True si le fichier a été écrit.
+        """
+        results = self.results
+        if not len(results) or not self.history_file:
+            return False
+        matchday = results["date"].max()
+        snapshot = self.forecast.assign(matchday=matchday, played=len(results),
+                                        ratings_version=self.model.snapshot().version)
+        history = self.history
+        if len(history):
+            history = history[history["matchday"].notna() & (history["matchday"] != matchday)]
+        history = pd.concat([history, snapshot], ignore_index=True) if len(history) else snapshot
+        history.to_csv(self.history_file, index=False)
+        return True
+
+
+# ======================================================
+# Command line
+# ======================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CAN 2025 forecast from the results played so far.")
+    parser.add_argument("--add", action="append", default=[], metavar="'Maroc 2-0 Comores'",
+                        help="append a result to the results file first (repeatable)")
+    parser.add_argument("--date", default=None,
+                        help="date of the added results (default : fixture date of a group match, else today)")
+    parser.add_argument("--winner", default=None, help="penalty shootout winner of the added drawn knockout results")
+    parser.add_argument("--results", default=RESULTS_FILE)
+    parser.add_argument("--history", default=HISTORY_FILE)
+    parser.add_argument("-n", type=int, default=LIVE_SIMULATIONS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--out", default=None)
+    args = parser.parse_args(argv)
+
+    from src.artifacts import get_artifact
+    from src.cli import write_output
+
+    for text in args.add:
+        append_result(text, args.date, args.results, args.winner)
+
+    start = time.perf_counter()
+    live = LiveForecast(get_artifact("elo_model").snapshot(), n=args.n, seed=args.seed,
+                        results_file=args.results, history_file=args.history)
+    forecast = live.forecast
+    recorded = live.record()
+    eliminated = sum(lost is not None for _, lost in knockout_bracket(live.knockouts)[0].values())
+    print(f"📡 {len(live.results)} matchs joués ({len(live.played)} de poule fixés, {eliminated} éliminés), "
+          f"prévision en {time.perf_counter() - start:.2f}s" + (f" → {args.history}" if recorded else ""),
+          file=sys.stderr)
+    write_output(forecast, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
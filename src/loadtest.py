@@ -0,0 +1,241 @@
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+# ======================================================
+# Multi-session load test (headless, offline)
+# ======================================================
+# Drives app.py and every page's render() with streamlit.testing AppTest :
+# each simulated session opens the page, then reruns it after a random
+# widget interaction (country, period, simulation button...). Sessions run
+# in parallel threads of one process, sharing its caches as they would on a
+# server.
+#
+#   python -m src loadtest [--targets app,compare] [--sessions 8] [--reruns 20] [-o report.json]
+#
+# Per target : p50 / p95 / p99 / max rerun latency, first-run latency,
+# errors and reruns per second over the whole run.
+
+# target -> (script : "app.py" or a module with render(), [(widget kind, label)])
+SCENARIOS = {
+    "app": ("app.py", [
+        ("selectbox", "Sélectionnez un pays"),
+        ("selectbox", "Filtrer par Groupe"),
+        ("selectbox", "Filtrer par Équipe"),
+        ("button", "🚀 Lancer la Simulation"),
+    ]),
+    "app_scenarios": ("app.py", [
+        ("selectbox", "Match"),
+        ("button", "🔒 Fixer le résultat"),
+        ("button", "🔓 Libérer ce match"),
+        ("button", "♻️ Tout réinitialiser"),
+    ]),
+    "home": ("modules.home", []),
+    "compare": ("modules.compare", [
+        ("selectbox", "Équipe A (référence)"),
+        ("selectbox", "Équipe B (comparée)"),
+        ("radio", "Analyser :"),
+    ]),
+    "analyse_pays_can": ("modules.analyse_pays_can", [("selectbox", "Sélectionne un pays")]),
+    "barchart_buteurs_advanced": ("modules.barchart_buteurs_advanced", [("selectbox", "Année CAN")]),
+    "can2025_info": ("modules.can2025_info", [("selectbox", "Filtrer par groupe :")]),
+    "elo": ("pages_backup.elo", [("radio", "Analyser :")]),
+    "heatmap": ("pages_backup.heatmap", [("radio", "Analyser :")]),
+    "power_ranking": ("pages_backup.power_ranking", [("selectbox", "Trier par")]),
+    "africa_map": ("pages_backup.africa_map", [
+        ("selectbox", "Choisir un pays"),
+        ("selectbox", "Choisir la métrique à afficher sur la carte"),
+    ]),
+}
+
+# target -> session state set before the first run (the scenario tournaments are
+# then drawn by the initial run : reruns time the locks only)
+INITIAL_STATE = {"app_scenarios": {"scenario_mode": True}}
+
+DEFAULT_TIMEOUT = 300
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _app_test(script):
+    from streamlit.testing.v1 import AppTest
+
+    if script.endswith(".py"):
+        return AppTest.from_file(os.path.join(ROOT_DIR, script), default_timeout=DEFAULT_TIMEOUT)
+    return AppTest.from_string(f"import {script} as page\npage.render()\n", default_timeout=DEFAULT_TIMEOUT)
+
+
+@contextmanager
+def _concurrent_app_tests():
+    """
+    AppTest is written for one run at a time :
+    - it installs its mock Runtime singleton at the start of each run and
+      clears it at the end, so one session's reset would pull it from under
+      the others : the last installed runtime stays reachable ;
+    - every run compiles the script again (a server compiles it once), and
+      concurrent ast.parse calls can fail on CPython 3.11 : the bytecode is
+      compiled once per script and file version, under a lock.
+    Both patches touch Streamlit internals : streamlit is pinned in
+    requirements.txt, check them again when bumping it.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    original = Runtime.__dict__["instance"], Runtime.__dict__["exists"]
+    get_bytecode = ScriptCache.get_bytecode
+    compile_lock = threading.Lock()
+    compiled = {}
+    last = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            last[:] = [cls._instance]
+            return cls._instance
+        if last:
+            return last[0]
+        raise RuntimeError("Runtime hasn't been created!")
+
+    Runtime.instance = classmethod(instance)
+    def cached_get_bytecode(self, script_path):
+        key = (script_path, os.stat(script_path).st_mtime_ns)
+        with compile_lock:
+            if key not in compiled:
+                compiled[key] = get_bytecode(self, script_path)
+            return compiled[key]
+
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(last))
+    ScriptCache.get_bytecode = cached_get_bytecode
+    try:
+        yield
+    finally:
+        Runtime.instance, Runtime.exists = original
+        ScriptCache.get_bytecode = get_bytecode
+
+
+def _quiet_streamlit():
+    # Bare-mode and deprecation warnings, once per thread and per rerun
+    from streamlit import config
+    from streamlit.logger import set_log_level
+
+    config.set_option("logger.level", "error")
+    set_log_level("error")
+
+
+def _interact(at, widgets, rng):
+    """Apply one random interaction; returns its description (or 'rerun')."""
+    available = []
+    for kind, label in widgets:
+        matches = [w for w in getattr(at, kind) if w.label == label]
+        if matches:
+            available.append((kind, matches[0]))
+    if not available:
+        return "rerun"
+
+    kind, widget = rng.choice(available)
+    if kind == "button":
+        widget.click()
+        return f"click {widget.label}"
+    i = rng.randrange(len(widget.options))
+    if kind == "selectbox":
+        widget.select_index(i)
+    else:
+        widget.set_value(widget.options[i])
+    return f"{widget.label} = {widget.options[i]}"
+
+
+def run_session(target, reruns, seed=0, think=0.0):
+    """One session : first run + `reruns` interactions. List of (phase, seconds, ok, action)."""
+    script, widgets = SCENARIOS[target]
+    rng = random.Random(seed)
+    at = _app_test(script)
+    for key, value in INITIAL_STATE.get(target, {}).items():
+        at.session_state[key] = value
+    timings = []
+
+    for i in range(reruns + 1):
+        action = "open" if i == 0 else _interact(at, widgets, rng)
+        start = time.perf_counter()
+        try:
+            at.run()
+            ok = not at.exception
+        except Exception:      # timeout, script crash outside Streamlit's handler
+            ok = False
+        timings.append(("initial" if i == 0 else "rerun", time.perf_counter() - start, ok, action))
+        if think:
+            time.sleep(think)
+    return timings
+
+
+def _summary(target, sessions, timings, wall):
+    reruns = np.array([s for phase, s, _, _ in timings if phase == "rerun"]) * 1000
+    initial = np.array([s for phase, s, _, _ in timings if phase == "initial"]) * 1000
+    pct = lambda a, q: round(float(np.percentile(a, q)), 1) if len(a) else None
+    return {
+        "target": target,
+        "sessions": sessions,
+        "reruns": len(reruns),
+        "errors": sum(not ok for _, _, ok, _ in timings),
+        "p50_ms": pct(reruns, 50),
+        "p95_ms": pct(reruns, 95),
+        "p99_ms": pct(reruns, 99),
+        "max_ms": round(float(reruns.max()), 1) if len(reruns) else None,
+        "initial_p50_ms": pct(initial, 50),
+        "reruns_per_s": round(len(reruns) / wall, 2) if wall else None,     # initial runs excluded
+        "wall_s": round(wall, 3),
+    }
+
+
+def run_load_test(targets=None, sessions=8, reruns=20, seed=0, think=0.0, log=print):
+    """List of per-target summaries; `sessions` sessions of a target run concurrently."""
+    targets = targets or list(SCENARIOS)
+    for target in targets:
+        if target not in SCENARIOS:
+            raise KeyError(f"Unknown target '{target}'. Available: {', '.join(SCENARIOS)}")
+    _quiet_streamlit()
+
+    rows = []
+    for target in targets:
+        timings, lock = [], threading.Lock()
+
+        def session(i):
+            result = run_session(target, reruns, seed=seed * 1000 + i, think=think)
+            with lock:
+                timings.extend(result)
+
+        start = time.perf_counter()
+        with _concurrent_app_tests(), ThreadPoolExecutor(max_workers=sessions) as pool:
+            list(pool.map(session, range(sessions)))
+        row = _summary(target, sessions, timings, time.perf_counter() - start)
+        rows.append(row)
+        if log:
+            log(f"{target:<26} p50 {row['p50_ms']:>8} ms  p95 {row['p95_ms']:>8} ms  p99 {row['p99_ms']:>8} ms  "
+                f"{row['reruns_per_s']:>7} reruns/s  errors {row['errors']}")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent AppTest sessions over app.py and the pages.")
+    parser.add_argument("--targets", default=None, help=f"comma list (default : all) — {', '.join(SCENARIOS)}")
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent sessions per target")
+    parser.add_argument("--reruns", type=int, default=20, help="interactions per session")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause between interactions")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--out", default=None, help="JSON report (default : benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    from src.benchmarks import write_report
+
+    rows = run_load_test(args.targets.split(",") if args.targets else None, args.sessions, args.reruns,
+                         args.seed, args.think_ms / 1000, log=lambda line: print(line, file=sys.stderr))
+    print(f"✔️ {write_report(rows, args.out, suite='loadtest')}", file=sys.stderr)
+    return 1 if any(r["errors"] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
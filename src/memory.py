@@ -0,0 +1,228 @@
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+import types
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from src.artifacts import ARTIFACTS, get_artifact, loaded_artifacts, period_start_years
+from src.datasets import DATASETS, get_dataset, loaded_datasets
+from src.query_cache import query_cache
+
+# ======================================================
+# Memory accounting
+# ======================================================
+# What the process keeps in memory, and how much of it :
+#
+#   - datasets      shared read-only views (src/datasets.py)
+#   - artifacts     Elo model, timelines, matrices, indexes (src/artifacts.py)
+#   - query_cache   memoized team / pair queries, per function
+#
+# Deep sizes follow DataFrames, arrays, containers and object attributes;
+# an object reached twice (a view inside an artifact...) is counted once per
+# entry. Process RSS is sampled over time and compared to a budget :
+#
+#   AFCON_MEMORY_BUDGET_MB=512 python -m src memory [--warm] [-o out/memory.csv]
+
+BUDGET_MB = float(os.environ.get("AFCON_MEMORY_BUDGET_MB", 0)) or None
+RSS_SAMPLES = 720
+
+logger = logging.getLogger("afcon.memory")
+
+
+# ======================================================
+# Deep size
+# ======================================================
+def deep_sizeof(value, _seen=None):
+    """Approximate deep size in bytes (DataFrames with deep=True)."""
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        # A view shares its base's buffer
+        return sys.getsizeof(value) if value.base is not None else int(value.nbytes) + 112
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return sys.getsizeof(value)
+    if isinstance(value, (dict, types.MappingProxyType)):
+        return sys.getsizeof(value) + sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        return sys.getsizeof(value) + sum(deep_sizeof(v, seen) for v in value)
+
+    size = sys.getsizeof(value)
+    attrs = getattr(value, "__dict__", None)
+    if attrs is not None:
+        size += deep_sizeof(attrs, seen)
+    for slot in getattr(type(value), "__slots__", ()):
+        if hasattr(value, slot):
+            size += deep_sizeof(getattr(value, slot), seen)
+    return size
+
+
+def _frames(value):
+    """DataFrames held by a value (directly, in a tuple or as attributes)."""
+    if isinstance(value, pd.DataFrame):
+        return [value]
+    if isinstance(value, (tuple, list)):
+        return [f for v in value for f in _frames(v)]
+    attrs = getattr(value, "__dict__", None) or {}
+    return [v for v in attrs.values() if isinstance(v, pd.DataFrame)]
+
+
+def _describe(value):
+    """(rows, dtypes summary) : rows of the DataFrames it holds, 'int16×3, object×2'."""
+    frames = _frames(value)
+    if not frames:
+        return None, type(value).__name__
+    counts = {}
+    for df in frames:
+        for dtype in df.dtypes.astype(str):
+            counts[dtype] = counts.get(dtype, 0) + 1
+    dtypes = ", ".join(f"{d}×{n}" for d, n in sorted(counts.items(), key=lambda kv: -kv[1]))
+    return sum(len(df) for df in frames), dtypes
+
+
+# ======================================================
+# Report
+# ======================================================
+def memory_report():
+    """One row per dataset / artifact / query-cache function currently in memory, largest first."""
+    rows = []
+    for name, (version, df) in loaded_datasets().items():
+        rows.append({"kind": "dataset", "name": name, "version": version, "bytes": deep_sizeof(df),
+                     "rows": len(df), "dtypes": _describe(df)[1]})
+    for key, (version, value) in loaded_artifacts().items():
+        n_rows, dtypes = _describe(value)
+        rows.append({"kind": "artifact", "name": key, "version": version, "bytes": deep_sizeof(value),
+                     "rows": n_rows, "dtypes": dtypes})
+    for name, (entries, size) in query_cache.usage().items():
+        rows.append({"kind": "query_cache", "name": name, "version": None, "bytes": size,
+                     "rows": entries, "dtypes": "entries"})
+
+    report = pd.DataFrame(rows, columns=["kind", "name", "version", "bytes", "rows", "dtypes"])
+    report["rows"] = report["rows"].astype("Int64")
+    report["mb"] = (report["bytes"] / 2**20).round(2)
+    return report.sort_values("bytes", ascending=False).reset_index(drop=True)
+
+
+def warm_all():
+    """Load every dataset and artifact (what a fully used app ends up holding)."""
+    for name in DATASETS:
+        get_dataset(name)
+    for name in ARTIFACTS:
+        if name == "period_elo":
+            for year in period_start_years():
+                get_artifact(name, year)
+        else:
+            get_artifact(name)
+
+
+# ======================================================
+# Process RSS
+# ======================================================
+def process_rss():
+    """Resident set size of the process in bytes (peak RSS where /proc is missing)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RSSMonitor:
+    """Samples the process RSS every `interval` seconds in a daemon thread; logs budget overruns."""
+
+    def __init__(self, interval=5.0, max_samples=RSS_SAMPLES):
+        self.interval = interval
+        self.samples = deque(maxlen=max_samples)    # (unix time, bytes)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._over_budget = False
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="afcon-rss", daemon=True)
+                self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            warning = budget_warning(self.sample())
+            if warning and not self._over_budget:
+                logger.warning(warning)     # once per crossing, not every sample
+            self._over_budget = warning is not None
+            time.sleep(self.interval)
+
+    def sample(self):
+        rss = process_rss()
+        self.samples.append((time.time(), rss))
+        return rss
+
+    def frame(self):
+        samples = list(self.samples)
+        df = pd.DataFrame(samples, columns=["time", "rss_bytes"])
+        df["time"] = pd.to_datetime(df["time"], unit="s")
+        df["rss_mb"] = (df["rss_bytes"] / 2**20).round(1)
+        return df
+
+
+rss_monitor = RSSMonitor()
+
+
+def budget_warning(rss=None, budget_mb=BUDGET_MB):
+    """Message if the process RSS is above the budget (AFCON_MEMORY_BUDGET_MB), else None."""
+    if not budget_mb:
+        return None
+    rss = process_rss() if rss is None else rss
+    if rss <= budget_mb * 2**20:
+        return None
+    return f"RSS {rss / 2**20:.0f} MB au-dessus du budget de {budget_mb:.0f} MB"
+
+
+# ======================================================
+# Command line
+# ======================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memory held by cached datasets and artifacts.")
+    parser.add_argument("--warm", action="store_true", help="load every dataset and artifact first")
+    parser.add_argument("--budget-mb", type=float, default=BUDGET_MB)
+    parser.add_argument("-o", "--out", default=None, help=".csv / .json / .parquet")
+    args = parser.parse_args(argv)
+
+    before = process_rss()
+    if args.warm:
+        warm_all()
+    report = memory_report()
+    rss = process_rss()
+
+    if args.out:
+        from src.cli import write_output
+        write_output(report, args.out)
+    else:
+        with pd.option_context("display.max_rows", None, "display.width", 200, "display.max_colwidth", 60):
+            print(report.drop(columns=["bytes", "version"]).to_string(index=False))
+
+    print(f"\nTotal suivi : {report['bytes'].sum() / 2**20:.1f} MB — RSS {rss / 2**20:.0f} MB "
+          f"(au démarrage {before / 2**20:.0f} MB)", file=sys.stderr)
+    warning = budget_warning(rss, args.budget_mb)
+    if warning:
+        print(f"⚠️ {warning}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,201 @@
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# ======================================================
+# Render timing instrumentation
+# ======================================================
+# One record per rerun (app.py or a page's render()), split in sections :
+#
+#   begin_rerun("compare")         # pages : @instrumented("compare") (modules/debug_panel.py)
+#   step("1 - h2h")                # linear render : closes the previous step
+#   ...
+#   with section("radar"):         # or an explicit block
+#       ...
+#   add_rows(len(df))              # rows processed by the current section
+#   end_rerun()
+#
+# Each section keeps its wall time, rows processed and the query / artifact
+# cache hits and misses made while it was open (memoize_query and
+# get_artifact report them through note_cache()).
+#
+#   AFCON_PERF_LOG=logs/perf.jsonl   one JSON line per rerun ("-" : stderr)
+#   AFCON_DEBUG=1                    debug sidebar panel (modules/debug_panel.py)
+#
+# With neither variable set nothing is recorded : every call returns at once.
+
+PERF_LOG = os.environ.get("AFCON_PERF_LOG", "")
+DEBUG = os.environ.get("AFCON_DEBUG", "") not in ("", "0", "false")
+ENABLED = bool(PERF_LOG) or DEBUG
+
+RECENT_RUNS = 50
+
+logger = logging.getLogger("afcon.perf")
+recent_runs = deque(maxlen=RECENT_RUNS)      # last finished reruns, every session of the process
+_recent_lock = threading.Lock()
+_current = contextvars.ContextVar("afcon_perf_run", default=None)
+
+
+class Section:
+    __slots__ = ("name", "started", "seconds", "rows", "cache_hits", "cache_misses")
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.rows = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def close(self):
+        if self.seconds is None:
+            self.seconds = time.perf_counter() - self.started
+
+    def as_dict(self):
+        return {"section": self.name, "seconds": round(self.seconds or 0.0, 6), "rows": self.rows,
+                "cache_hits": self.cache_hits, "cache_misses": self.cache_misses}
+
+
+class RerunRecord:
+    """Sections of one rerun; `open` is the stack of sections currently running."""
+
+    def __init__(self, page):
+        self.page = page
+        self.timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.sections = []
+        self.open = []
+        self.step = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def as_dict(self):
+        return {
+            "timestamp": self.timestamp,
+            "page": self.page,
+            "seconds": round(self.seconds or 0.0, 6),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "sections": [s.as_dict() for s in self.sections],
+        }
+
+
+# ======================================================
+# Rerun
+# ======================================================
+def begin_rerun(page):
+    """Start recording a rerun (no-op when disabled). An unfinished previous one is dropped."""
+    if not ENABLED:
+        return None
+    record = RerunRecord(page)
+    _current.set(record)
+    return record
+
+
+def end_rerun():
+    """Close the current rerun, log it and return it as a dict (None when disabled)."""
+    record = _current.get()
+    if record is None:
+        return None
+    _current.set(None)
+
+    _close_step(record)
+    while record.open:
+        record.open.pop().close()
+    record.seconds = time.perf_counter() - record.started
+
+    summary = record.as_dict()
+    with _recent_lock:
+        recent_runs.append(summary)
+        if PERF_LOG:
+            _configure_logger()
+    if PERF_LOG:
+        logger.info(json.dumps(summary, ensure_ascii=False))
+    return summary
+
+
+# ======================================================
+# Sections
+# ======================================================
+def _open(record, name):
+    parent = record.open[-1].name + " / " if record.open else ""
+    s = Section(parent + name)
+    record.sections.append(s)
+    record.open.append(s)
+    return s
+
+
+def _close_step(record):
+    if record.step is not None:
+        record.step.close()
+        if record.step in record.open:
+            record.open.remove(record.step)
+        record.step = None
+
+
+@contextmanager
+def section(name):
+    record = _current.get()
+    if record is None:
+        yield None
+        return
+    s = _open(record, name)
+    try:
+        yield s
+    finally:
+        s.close()
+        if s in record.open:
+            record.open.remove(s)
+
+
+def step(name):
+    """Close the previous step and open the next one (numbered sections of a render)."""
+    record = _current.get()
+    if record is None:
+        return
+    _close_step(record)
+    record.step = _open(record, name)
+
+
+def add_rows(n):
+    record = _current.get()
+    if record is not None and record.open:
+        record.open[-1].rows += int(n)
+
+
+def note_cache(hit):
+    """Called by the caches : counted on the rerun and on every open section."""
+    record = _current.get()
+    if record is None:
+        return
+    field = "cache_hits" if hit else "cache_misses"
+    setattr(record, field, getattr(record, field) + 1)
+    for s in record.open:
+        setattr(s, field, getattr(s, field) + 1)
+
+
+def last_runs(page=None, n=RECENT_RUNS):
+    with _recent_lock:
+        runs = [r for r in recent_runs if page is None or r["page"] == page]
+    return runs[-n:]
+
+
+def _configure_logger():
+    if logger.handlers:
+        return
+    if PERF_LOG == "-":
+        handler = logging.StreamHandler()
+    else:
+        os.makedirs(os.path.dirname(PERF_LOG) or ".", exist_ok=True)
+        handler = logging.FileHandler(PERF_LOG, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
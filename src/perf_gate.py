@@ -0,0 +1,201 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.benchmarks import environment, load_benchmark_dataset
+from src.elo_engine import AdvancedElo, compute_period_elo
+
+# ======================================================
+# Performance regression gate
+# ======================================================
+# Measures a fixed set of metrics and compares them with the committed
+# baseline (benchmarks/baseline.json); any metric worse than its tolerance
+# fails the run :
+#
+#   python -m src perf-gate                      # diff table, exit 1 on regression
+#   python -m src perf-gate --metrics elo_replay_s,simulation_per_s
+#   python -m src perf-gate --update-baseline    # after an intended change
+#
+# Everything runs locally (no network, no server). Timings are the median of
+# `repeat` runs; tolerances are relative (0.30 = 30 % worse than baseline).
+
+BASELINE_FILE = os.path.join("benchmarks", "baseline.json")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOADTEST_TARGETS = ["app", "app_scenarios", "compare", "analyse_pays_can"]
+SIMULATIONS = 20000
+
+_COLD_START = (
+    "from streamlit.testing.v1 import AppTest\n"
+    "at = AppTest.from_file('app.py', default_timeout=600).run()\n"
+    "raise SystemExit(1 if at.exception else 0)\n"
+)
+
+
+def _median_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _elo_replay(repeat):
+    df = load_benchmark_dataset("results")[1]
+    return _median_time(lambda: AdvancedElo().train_model(df), repeat)
+
+
+def _period_query(repeat):
+    df = load_benchmark_dataset("results")[1]
+    start_year = int(df["date"].dt.year.max()) - 10
+    return _median_time(lambda: compute_period_elo(df, start_year), repeat)
+
+
+def _simulation(repeat):
+    from src.artifacts import get_artifact
+    from src.simulation import simulate_many
+
+    snapshot = get_artifact("elo_model").snapshot()
+    simulate_many(snapshot, n=50, seed=0)       # warm-up
+    seconds = _median_time(lambda: simulate_many(snapshot, n=SIMULATIONS, seed=0), repeat)
+    return SIMULATIONS / seconds
+
+
+def _rerun_p95(target):
+    def measure(repeat):
+        from src.loadtest import run_load_test
+        row = run_load_test([target], sessions=2, reruns=20 * repeat, log=None)[0]
+        if row["errors"]:
+            raise RuntimeError(f"{row['errors']} failed reruns on '{target}'")
+        return row["p95_ms"]
+    return measure
+
+
+def _cold_start(repeat):
+    # Fresh interpreter + empty artifact store : first page view after a deploy
+    def run():
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = dict(os.environ, AFCON_CACHE_DIR=cache_dir, PYTHONPATH=ROOT_DIR)
+            subprocess.run([sys.executable, "-c", _COLD_START], cwd=ROOT_DIR, env=env, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return _median_time(run, repeat)
+
+
+# name -> (measure(repeat), unit, better : "lower" | "higher", default tolerance)
+METRICS = {
+    "elo_replay_s": (_elo_replay, "s", "lower", 0.30),
+    "period_query_s": (_period_query, "s", "lower", 0.30),
+    "simulation_per_s": (_simulation, "tournaments/s", "higher", 0.40),
+    **{f"rerun_p95_ms_{t}": (_rerun_p95(t), "ms", "lower", 0.50) for t in LOADTEST_TARGETS},
+    "cold_start_s": (_cold_start, "s", "lower", 0.40),
+}
+
+
+def collect_metrics(names=None, repeat=3, log=print):
+    """{metric: value} for the selected metrics (default : all)."""
+    values = {}
+    for name in names or list(METRICS):
+        if name not in METRICS:
+            raise KeyError(f"Unknown metric '{name}'. Available: {', '.join(METRICS)}")
+        measure, unit = METRICS[name][:2]
+        values[name] = measure(repeat)
+        if log:
+            log(f"{name:<34} {values[name]:>12.4f} {unit}")
+    return values
+
+
+# ======================================================
+# Baseline
+# ======================================================
+def load_baseline(path=BASELINE_FILE):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_baseline(values, path=BASELINE_FILE, previous=None):
+    """Stores the values; tolerances already in the previous baseline are kept."""
+    old = (previous or {}).get("metrics", {})
+    metrics = {}
+    for name, value in values.items():
+        _, unit, better, tolerance = METRICS[name]
+        metrics[name] = {"value": round(value, 6), "unit": unit, "better": better,
+                         "tolerance": old.get(name, {}).get("tolerance", tolerance)}
+    for name, entry in old.items():
+        metrics.setdefault(name, entry)      # metrics not re-measured this time
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "metrics": metrics}, f, indent=2)
+        f.write("\n")
+    return path
+
+
+def compare(values, baseline):
+    """One row per metric : baseline, current, relative change (+ = worse), tolerance, status."""
+    rows = []
+    reference = baseline.get("metrics", {})
+    for name, current in values.items():
+        entry = reference.get(name)
+        if entry is None:
+            rows.append({"metric": name, "baseline": None, "current": current, "change": None,
+                         "tolerance": None, "status": "new"})
+            continue
+        base, tolerance = entry["value"], entry["tolerance"]
+        worse = (current - base) / base if entry["better"] == "lower" else (base - current) / base
+        status = "REGRESSION" if worse > tolerance else "improved" if worse < -tolerance else "ok"
+        rows.append({"metric": name, "baseline": base, "current": current, "change": worse,
+                     "tolerance": tolerance, "status": status})
+    return rows
+
+
+def format_table(rows):
+    fmt = lambda v: "—" if v is None else f"{v:,.4g}"
+    pct = lambda v: "—" if v is None else f"{v:+.1%}"
+    lines = [f"{'metric':<34} {'baseline':>12} {'current':>12} {'worse by':>9} {'tol.':>6}  status"]
+    for r in rows:
+        lines.append(f"{r['metric']:<34} {fmt(r['baseline']):>12} {fmt(r['current']):>12} "
+                     f"{pct(r['change']):>9} {pct(r['tolerance']):>6}  {r['status']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare fresh benchmarks with the committed baseline.")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--metrics", default=None, help=f"comma list (default : all) — {', '.join(METRICS)}")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--update-baseline", action="store_true", help="write the measured values as the baseline")
+    parser.add_argument("-o", "--out", default=None, help="also write the comparison as JSON")
+    args = parser.parse_args(argv)
+
+    log = lambda line: print(line, file=sys.stderr)
+    values = collect_metrics(args.metrics.split(",") if args.metrics else None, args.repeat, log=log)
+
+    previous = load_baseline(args.baseline) if os.path.exists(args.baseline) else None
+    if args.update_baseline:
+        print(f"✔️ {write_baseline(values, args.baseline, previous)}", file=sys.stderr)
+        return 0
+    if previous is None:
+        raise ValueError(f"No baseline at '{args.baseline}' (create it with --update-baseline)")
+
+    rows = compare(values, previous)
+    print(format_table(rows))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "baseline": previous.get("environment"), "results": rows},
+                      f, indent=2)
+
+    regressions = [r["metric"] for r in rows if r["status"] == "REGRESSION"]
+    if regressions:
+        print(f"❌ {len(regressions)} régression(s) : {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    print("✅ Aucune régression", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from src.artifact_store import artifact_store
+from src.artifacts import ARTIFACTS, artifact_dependencies, artifact_key, artifact_version, get_artifact, period_start_years
+
+# ======================================================
+# Cache pre-warm
+# ======================================================
+# Builds every derived artifact the pages read and writes it to the artifact
+# store, so that no user request triggers a cold computation. Meant to run at
+# image build / deploy time, after src/build_datasets.py :
+#
+#     python -m src.prewarm [--jobs N] [--force]
+#
+# Independent artifacts are built in parallel (one process each); artifacts
+# that need another one (proba_matrix, power_ranking need the Elo model) are
+# scheduled once it is on disk.
+
+CUSTOM_START_YEAR = 2010   # default of the "Année personnalisée" slider (Elo page)
+
+
+def _tasks():
+    """[(name, args)] of everything to materialize."""
+    tasks = []
+    for name in ARTIFACTS:
+        if name == "period_elo":
+            for year in sorted(set(period_start_years() + [CUSTOM_START_YEAR])):
+                tasks.append((name, (year,)))
+        else:
+            tasks.append((name, ()))
+    return tasks
+
+
+def _materialize(name, args, force):
+    """Runs in a worker process : (status, seconds, size in bytes)."""
+    path = artifact_store.path(artifact_key(name, *args), artifact_version(name))
+    if force and os.path.exists(path):
+        os.remove(path)
+    cached = os.path.exists(path)
+
+    start = time.perf_counter()
+    get_artifact(name, *args)
+    elapsed = time.perf_counter() - start
+
+    size = os.path.getsize(path) if os.path.exists(path) else 0
+    return ("cached" if cached else "built"), elapsed, size
+
+
+def prewarm(jobs=None, force=False):
+    """Materialize every artifact. Returns [(artifact, status, seconds, bytes)]."""
+    pending = _tasks()
+    done_names, failed_names = set(), set()
+    rows = []
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        running = {}
+        while pending or running:
+            # Submit every task whose dependencies are already materialized
+            ready = [t for t in pending if all(d in done_names for d in artifact_dependencies(t[0]))]
+            for task in ready:
+                pending.remove(task)
+                running[pool.submit(_materialize, task[0], task[1], force)] = task
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name, args = running.pop(future)
+                try:
+                    status, elapsed, size = future.result()
+                except Exception as e:
+                    status, elapsed, size = f"error: {e}", 0.0, 0
+                rows.append((artifact_key(name, *args), status, elapsed, size))
+                if status not in ("built", "cached"):
+                    failed_names.add(name)
+
+                # Whole families (period_elo_*) count as done once every member is built or cached
+                if (name not in failed_names and not any(t[0] == name for t in pending)
+                        and not any(t[0] == name for t in running.values())):
+                    done_names.add(name)
+
+            if pending and not running:
+                # Only reachable if a dependency failed
+                for name, args in pending:
+                    rows.append((artifact_key(name, *args), "skipped (dependency failed)", 0.0, 0))
+                pending = []
+
+    return rows
+
+
+def print_table(rows, wall):
+    width = max(len(r[0]) for r in rows)
+    status_width = max(8, max(len(r[1]) for r in rows))
+    rule = "-" * (width + status_width + 26)
+    print(f"{'artifact':<{width}}  {'status':<{status_width}}  {'seconds':>8}  {'size':>10}")
+    print(rule)
+    for name, status, elapsed, size in sorted(rows, key=lambda r: -r[2]):
+        print(f"{name:<{width}}  {status:<{status_width}}  {elapsed:>8.2f}  {size / 1024:>8.0f} KB")
+    print(rule)
+    print(f"{'total (sum)':<{width}}  {'':<{status_width}}  {sum(r[2] for r in rows):>8.2f}")
+    print(f"{'wall time':<{width}}  {'':<{status_width}}  {wall:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Materialize every derived artifact in the artifact store.")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default : CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild artifacts already on disk")
+    args = parser.parse_args(argv)
+
+    print(f"🔥 Pre-warm → {artifact_store.root}")
+    start = time.perf_counter()
+    rows = prewarm(jobs=args.jobs, force=args.force)
+    print_table(rows, time.perf_counter() - start)
+
+    failed = [r for r in rows if r[1] not in ("built", "cached")]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+import cProfile
+import os
+import pstats
+import re
+from datetime import datetime, timezone
+
+# ======================================================
+# Opt-in per-rerun profiler
+# ======================================================
+# Wraps one script run (app.py or a page's render()) in cProfile and saves
+# it as profiles/<utc time>_<page>_<widget values>.pstats :
+#
+#   AFCON_PROFILE=1 streamlit run app.py        every rerun
+#   AFCON_PROFILE=query streamlit run app.py    only reruns opened with ?profile=1
+#
+#   python -m pstats profiles/20251221T101500_123Z_compare_compare_team_a=Morocco....pstats
+#
+# Unset, the page decorator returns render() itself and app.py only tests
+# one constant : no profiler, no extra call.
+
+MODE = os.environ.get("AFCON_PROFILE", "").lower()
+ENABLED = MODE not in ("", "0", "false")
+PROFILE_DIR = os.environ.get("AFCON_PROFILE_DIR", "profiles")
+TOP_N = 25
+MAX_NAME = 160
+
+
+def should_profile(query_value=None):
+    """AFCON_PROFILE=query : only when the query parameter is set; any other value : always."""
+    if not ENABLED:
+        return False
+    if MODE == "query":
+        return query_value not in (None, "", "0", "false")
+    return True
+
+
+def _slug(text):
+    return re.sub(r"[^\w.=-]+", "-", str(text)).strip("-")
+
+
+def profile_path(page, params=None, directory=None):
+    """Timestamped file name carrying the page and the scalar widget values."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S_%f")[:-3] + "Z"
+    parts = [f"{k}={v}" for k, v in sorted((params or {}).items()) if isinstance(v, (str, int, float, bool))]
+    name = _slug("_".join([page] + parts))[:MAX_NAME]
+    return os.path.join(directory or PROFILE_DIR, f"{stamp}_{name}.pstats")
+
+
+def _location(func):
+    filename, line, name = func
+    if filename == "~":                      # builtins
+        return name
+    path = os.path.relpath(filename) if filename.startswith(os.getcwd()) else os.path.basename(filename)
+    return f"{path}:{line}({name})"
+
+
+def top_functions(stats, n=TOP_N):
+    """Functions sorted by cumulative time : [{function, calls, tottime_s, cumtime_s}]."""
+    if not isinstance(stats, pstats.Stats):
+        stats = pstats.Stats(stats)
+    stats.sort_stats("cumulative")
+    rows = []
+    for func in stats.fcn_list[:n]:
+        _, ncalls, tottime, cumtime, _ = stats.stats[func]
+        rows.append({"function": _location(func), "calls": ncalls, "tottime_s": round(tottime, 4),
+                     "cumtime_s": round(cumtime, 4)})
+    return rows
+
+
+class RerunProfile:
+    """
+    with RerunProfile("compare", params) as prof: ...
+    → prof.path (saved .pstats), prof.top (top functions by cumulative time)
+    `params` may be a callable, read when the run ends (widget values).
+    """
+
+    def __init__(self, page, params=None, directory=None):
+        self.page = page
+        self.params = params
+        self.directory = directory
+        self.path = None
+        self.top = []
+        self._profiler = cProfile.Profile()
+
+    def __enter__(self):
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiler.disable()
+        self.save()
+        return False
+
+    def save(self):
+        params = self.params() if callable(self.params) else self.params
+        self.path = profile_path(self.page, params, self.directory)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        stats = pstats.Stats(self._profiler)
+        stats.dump_stats(self.path)
+        self.top = top_functions(stats)
+        return self.path
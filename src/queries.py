@@ -0,0 +1,108 @@
+import json
+import math
+from collections.abc import Mapping
+
+import pandas as pd
+
+from src.artifacts import get_artifact
+from src.datasets import CAN_FINAL, CAN_QUALIF, get_dataset
+from src.team_stats import team_records
+
+# ======================================================
+# Read queries over the precomputed artifacts
+# ======================================================
+# Shared by the CLI (src/cli.py) and the HTTP API (src/api.py).
+# Team names are the English names of the datasets ("Ivory Coast").
+
+
+def to_jsonable(value):
+    """DataFrames → list of records, numpy scalars → Python scalars, NaN / ±inf → None (recursively)."""
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient="records", date_format="iso", force_ascii=False))
+    if isinstance(value, Mapping):
+        return {k: to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if hasattr(value, "item"):   # numpy scalars
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None              # strict JSON has no NaN
+    return value
+
+
+def known_teams():
+    afcon = get_dataset("afcon")
+    return set(afcon["home_team"]).union(afcon["away_team"])
+
+
+def _check_team(team):
+    if team not in known_teams():
+        raise KeyError(f"Unknown team '{team}' (use the English name, e.g. 'Ivory Coast')")
+
+
+def elo_ranking(since=None, top=None):
+    """team, elo, rank. since=None → advanced model (2010+), else classic Elo since that year."""
+    if since is None:
+        ratings = get_artifact("elo_model").ratings
+    else:
+        _, ratings = get_artifact("period_elo", since)
+
+    table = (
+        pd.DataFrame({"team": list(ratings), "elo": list(ratings.values())})
+        .sort_values("elo", ascending=False)
+        .reset_index(drop=True)
+    )
+    table["elo"] = table["elo"].round(1)
+    table.insert(0, "rank", range(1, len(table) + 1))
+    return table.head(top) if top else table
+
+
+def team_rating(team):
+    """Advanced Elo of one CAF team + its rank among CAF teams."""
+    _check_team(team)
+    ratings = get_artifact("elo_model").snapshot()
+    caf = sorted(known_teams(), key=ratings.get, reverse=True)
+    return {"team": team, "elo": round(ratings.get(team), 1), "caf_rank": caf.index(team) + 1,
+            "snapshot_version": ratings.version}
+
+
+def h2h(team, opponent):
+    """CAN final head-to-head record of team against opponent (team perspective)."""
+    _check_team(team)
+    _check_team(opponent)
+    matrix = get_artifact("can_h2h_matrix")
+    row = matrix[(matrix["team"] == team) & (matrix["opponent"] == opponent)]
+    if row.empty:
+        return {"team": team, "opponent": opponent, "played": 0}
+    return row.iloc[0].to_dict()
+
+
+
+def team_profile(team, n_form=5):
+    """CAN profile of one team (dict of scalars and tables)."""
+    _check_team(team)
+    afcon = get_dataset("afcon")
+
+    def record(tournament):
+        rec = team_records(afcon[afcon["tournament"] == tournament])
+        rec = rec[rec["team"] == team]
+        return rec.iloc[0].drop("team").to_dict() if len(rec) else {}
+
+    form_index = get_artifact("training_form_index")
+    form, points = form_index.form(team, n_form)
+
+    h2h = get_artifact("can_h2h_matrix")
+    shootouts = get_artifact("can_shootout_table")
+    shootouts = shootouts[shootouts["team"] == team]
+
+    return {
+        "team": team,
+        "elo": round(get_artifact("elo_model").get_rating(team), 1),
+        "can_final": record(CAN_FINAL),
+        "can_qualification": record(CAN_QUALIF),
+        "form": {"last": form, "points": points, "matches": form_index.last_matches(team, n_form)},
+        "h2h": h2h[h2h["team"] == team].drop(columns="team").sort_values("played", ascending=False),
+        "top_scorers": get_artifact("can_scorer_index").top(10, team=team),
+        "top_scorers_all_competitions": get_artifact("scorer_index").top(10, team=team),
+        "shootouts": shootouts.iloc[0].drop("team").to_dict() if len(shootouts) else {},
+    }
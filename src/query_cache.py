@@ -0,0 +1,167 @@
+import functools
+import os
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from src import perf
+from src.datasets import freeze, get_version
+
+# ======================================================
+# Process-wide LRU cache for team / pair queries
+# ======================================================
+# Shared by every Streamlit session of the process. Bounded both in number
+# of entries and in bytes; entries are keyed by the fingerprint of the
+# datasets they read, so a data change invalidates them.
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("AFCON_QUERY_CACHE_ENTRIES", 2048))
+DEFAULT_MAX_BYTES = int(float(os.environ.get("AFCON_QUERY_CACHE_MB", 64)) * 1024 * 1024)
+
+
+def sizeof(value):
+    """Approximate deep size in bytes of a cached value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def _share(value):
+    """Cached values are shared across sessions : frames, series and dicts are handed out read-only."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return freeze(value)
+    if isinstance(value, dict):
+        return MappingProxyType({k: _share(v) for k, v in value.items()})
+    if isinstance(value, (tuple, list)):
+        return tuple(_share(v) for v in value)
+    return value
+
+
+class QueryCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (value, size)
+        self._versions = {}             # function name -> current data version
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """(True, value) on hit, (False, None) on miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key, value):
+        size = sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def set_version(self, name, version):
+        """Drop every entry of `name` computed on another data version."""
+        if self._versions.get(name) == version:
+            return
+        with self._lock:
+            if self._versions.get(name) == version:
+                return
+            stale = [k for k in self._entries if k[0] == name and k[1] != version]
+            for k in stale:
+                self.bytes -= self._entries.pop(k)[1]
+            self.invalidations += len(stale)
+            self._versions[name] = version
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.bytes = 0
+
+    def usage(self):
+        """{function name: (entries, bytes)} of the cached values."""
+        with self._lock:
+            keys = [(k[0], size) for k, (_, size) in self._entries.items()]
+        usage = {}
+        for name, size in keys:
+            entries, total = usage.get(name, (0, 0))
+            usage[name] = (entries + 1, total + size)
+        return usage
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+query_cache = QueryCache()
+
+
+def memoize_query(*datasets, cache=None):
+    """
+    Memoize a query function in the process-wide LRU cache.
+    Arguments must be hashable (team names, years...); the function reads
+    the `datasets` it depends on itself, and their fingerprint is part of the key.
+
+        @memoize_query("afcon")
+        def team_summary(team): ...
+    """
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            store = cache or query_cache
+            version = "|".join(get_version(d) for d in datasets)
+            store.set_version(name, version)
+
+            key = (name, version, args, tuple(sorted(kwargs.items())))
+            hit, value = store.get(key)
+            perf.note_cache(hit)
+            if hit:
+                return value
+            value = _share(func(*args, **kwargs))
+            store.put(key, value)
+            return value
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
@@ -0,0 +1,141 @@
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from src.can2025 import GROUPS
+from src.datasets import freeze
+from src.simulation import (default_goal_model, group_fixtures, group_standings, knockout_arrays, knockout_draws,
+                            play_knockout, probability_table, qualified_teams, team_elos)
+
+# ======================================================
+# Scénarios "et si ?" (résultats de poule fixés)
+# ======================================================
+# n tournois tirés une fois et gardés en mémoire : scores des 36 matchs de
+# poule, classements de chaque groupe, tirage des 8èmes. Fixer un résultat
+# ("Maroc 1-1 Mali") remplace ce match dans les n tirages, recalcule le
+# classement de SON groupe seulement, puis rejoue la phase finale avec la
+# même graine (mêmes aléas d'un scénario à l'autre : les écarts affichés
+# viennent du scénario, pas du bruit Monte Carlo).
+#
+#   sims = SimulationSet(snapshot, n=100_000, seed=0)
+#   sims.probabilities({("Maroc", "Mali"): (1, 1)})
+
+DEFAULT_SIMULATIONS = 100_000
+MAX_SCENARIOS = 64                  # tables de probabilités gardées par SimulationSet
+
+_RESULT = re.compile(r"^\s*(.+?)\s+(\d+)\s*-\s*(\d+)\s+(.+?)\s*$")
+
+
+def parse_result(text):
+    """"Maroc 1-1 Mali" → (("Maroc", "Mali"), (1, 1))."""
+    match = _RESULT.match(text)
+    if match is None:
+        raise ValueError(f"Résultat illisible : '{text}' (attendu : 'Maroc 1-1 Mali')")
+    team_a, score_a, score_b, team_b = match.groups()
+    return (team_a, team_b), (int(score_a), int(score_b))
+
+
+class SimulationSet:
+    """n tournois CAN 2025 stockés, re-simulables avec des résultats de poule fixés."""
+
+    def __init__(self, ratings, n=DEFAULT_SIMULATIONS, seed=0, groups=GROUPS, goal_model=None, played=None,
+                 knockouts=None):
+        """
+        `played` : résultats de poule déjà joués (même format que les locks), seuls les autres matchs sont tirés.
+        `knockouts` : phase finale déjà jouée [(vainqueur, perdant, ...)], affiches et résultats imposés.
+        """
+        self.ratings = ratings
+        self.n = n
+        self.goal_model = goal_model or default_goal_model()
+        self.teams, self.home, self.away = group_fixtures(groups)
+        self.elos = team_elos(ratings, self.teams)
+        self.knockouts = knockout_arrays(knockouts, self.teams) if knockouts else None
+        self._pairs = {(self.teams[h], self.teams[a]): i for i, (h, a) in enumerate(zip(self.home, self.away))}
+
+        group_seed, draw_seed, self._knockout_seed = np.random.SeedSequence(seed).spawn(3)
+        self.played = dict(self._normalize(played))
+        remaining = np.array([i for i in range(len(self.home)) if i not in self.played], dtype=np.intp)
+        self.goals_a = np.zeros((n, len(self.home)), dtype=np.int8)
+        self.goals_b = np.zeros((n, len(self.home)), dtype=np.int8)
+        for i, (score_a, score_b) in self.played.items():
+            self.goals_a[:, i], self.goals_b[:, i] = score_a, score_b
+        if len(remaining):
+            d = self.elos[self.home[remaining]] - self.elos[self.away[remaining]]
+            goals_a, goals_b = self.goal_model.sample(d, np.random.default_rng(group_seed), size=(n, len(remaining)))
+            self.goals_a[:, remaining], self.goals_b[:, remaining] = goals_a, goals_b
+        order, points, diff = group_standings(self.goals_a, self.goals_b, self.home, self.away, len(self.teams))
+        self.order, self.points, self.diff = order.astype(np.int8), points.astype(np.int16), diff.astype(np.int16)
+        self.draws = knockout_draws(n, 16, np.random.default_rng(draw_seed)).astype(np.int8)
+
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------
+    # Matchs fixés
+    # --------------------------------------------------
+    def fixture_index(self, team_a, team_b):
+        """(indice du match de poule, inversé ?) ; KeyError si les équipes ne se rencontrent pas en poule."""
+        if (team_a, team_b) in self._pairs:
+            return self._pairs[(team_a, team_b)], False
+        if (team_b, team_a) in self._pairs:
+            return self._pairs[(team_b, team_a)], True
+        raise KeyError(f"Pas de match de poule {team_a} - {team_b}")
+
+    def _normalize(self, locks):
+        """{(A, B): (a, b)} → {indice: (buts domicile, buts extérieur)}, dans l'ordre des indices."""
+        fixed = {}
+        for (team_a, team_b), (score_a, score_b) in (locks or {}).items():
+            i, swapped = self.fixture_index(team_a, team_b)
+            fixed[i] = (int(score_b), int(score_a)) if swapped else (int(score_a), int(score_b))
+        return tuple(sorted(fixed.items()))
+
+    def _standings(self, fixed):
+        """Classements avec les matchs fixés : seuls les groupes concernés sont recalculés."""
+        if not fixed:
+            return self.order, self.points, self.diff
+
+        order, points, diff = self.order.copy(), self.points.copy(), self.diff.copy()
+        for g in sorted({i // 6 for i, _ in fixed}):
+            cols = slice(6 * g, 6 * g + 6)
+            goals_a, goals_b = self.goals_a[:, cols].copy(), self.goals_b[:, cols].copy()
+            for i, (score_a, score_b) in fixed:
+                if i // 6 == g:
+                    goals_a[:, i - 6 * g], goals_b[:, i - 6 * g] = score_a, score_b
+            g_order, g_points, g_diff = group_standings(goals_a, goals_b, self.home[cols] - 4 * g,
+                                                        self.away[cols] - 4 * g, 4)
+            order[:, g, :] = g_order[:, 0, :] + 4 * g
+            points[:, 4 * g:4 * g + 4], diff[:, 4 * g:4 * g + 4] = g_points, g_diff
+        return order, points, diff
+
+    # --------------------------------------------------
+    # Probabilités
+    # --------------------------------------------------
+    def probabilities(self, locks=None):
+        """
+        Table de simulate_many avec les résultats de poule fixés.
+        :param locks: {(équipe A, équipe B): (buts A, buts B)} (noms FR, dans un sens ou dans l'autre),
+                      matchs pas encore joués seulement (ValueError sinon)
+        """
+        key = self._normalize(locks)
+        replayed = [i for i, _ in key if i in self.played]
+        if replayed:
+            names = ", ".join(f"{self.teams[self.home[i]]} - {self.teams[self.away[i]]}" for i in replayed)
+            raise ValueError(f"Match(s) déjà joué(s), résultat non modifiable : {names}")
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        qualified = qualified_teams(*self._standings(key))
+        bracket = np.take_along_axis(qualified, self.draws.astype(np.intp), axis=1)
+        rng = np.random.default_rng(self._knockout_seed)
+        reached, winners = play_knockout(self.elos, bracket, rng, self.goal_model, self.knockouts)
+        table = freeze(probability_table(self.ratings, self.teams, reached, winners, self.n))
+
+        with self._lock:
+            self._results[key] = table
+            if len(self._results) > MAX_SCENARIOS:
+                self._results.popitem(last=False)
+        return table
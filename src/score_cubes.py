@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+
+# ======================================================
+# Scoreline cubes
+# ======================================================
+# Integer histograms of scorelines (goals A x goals B) per year, stored as
+# prefix sums over years so any period query is a difference of two slices.
+# Scores above `cap` are folded into the last bin ("cap+").
+
+DEFAULT_CAP = 10
+
+
+def _bin_labels(cap):
+    return [str(i) for i in range(cap)] + [f"{cap}+"]
+
+
+def _prefix(counts):
+    """Prefix sums along axis 0, with a leading zero slice."""
+    out = np.zeros((counts.shape[0] + 1,) + counts.shape[1:], dtype=np.int32)
+    np.cumsum(counts, axis=0, out=out[1:])
+    return out
+
+
+class ScoreCube:
+    """
+    Scoreline histograms for a match table.
+
+    - global view : home goals x away goals, per year
+    - team view   : goals for x goals against, per (team, year)
+    """
+
+    def __init__(self, years, global_cum, team_names, team_offsets, team_years, team_cum, cap):
+        self.years = years
+        self.cap = cap
+        self.labels = _bin_labels(cap)
+        self._global_cum = global_cum
+        self._team_pos = {t: i for i, t in enumerate(team_names)}
+        self._team_offsets = team_offsets
+        self._team_years = team_years
+        self._team_cum = team_cum
+
+    # --------------------------------------------------
+    # Build
+    # --------------------------------------------------
+    @classmethod
+    def from_matches(cls, df, cap=DEFAULT_CAP):
+        df = df.dropna(subset=["home_score", "away_score"])
+        bins = cap + 1
+
+        year = pd.to_datetime(df["date"]).dt.year.to_numpy()
+        h = np.minimum(df["home_score"].to_numpy().astype(np.int64), cap)
+        a = np.minimum(df["away_score"].to_numpy().astype(np.int64), cap)
+
+        # Global cube : one bincount over (year, h, a)
+        years, year_idx = np.unique(year, return_inverse=True)
+        flat = (year_idx * bins + h) * bins + a
+        counts = np.bincount(flat, minlength=len(years) * bins * bins)
+        global_cum = _prefix(counts.reshape(len(years), bins, bins))
+
+        # Team cube : both perspectives stacked, grouped by (team, year)
+        teams = np.concatenate([df["home_team"].to_numpy(), df["away_team"].to_numpy()])
+        team_names, team_idx = np.unique(teams, return_inverse=True)
+        t_year_idx = np.concatenate([year_idx, year_idx])
+        gf = np.concatenate([h, a])
+        ga = np.concatenate([a, h])
+
+        pair = team_idx * len(years) + t_year_idx
+        pairs, pair_idx = np.unique(pair, return_inverse=True)
+        flat = (pair_idx * bins + gf) * bins + ga
+        counts = np.bincount(flat, minlength=len(pairs) * bins * bins)
+        team_cum = _prefix(counts.reshape(len(pairs), bins, bins))
+
+        pair_team = pairs // len(years)
+        team_offsets = np.searchsorted(pair_team, np.arange(len(team_names) + 1))
+        team_years = years[pairs % len(years)]
+
+        return cls(years, global_cum, team_names, team_offsets, team_years, team_cum, cap)
+
+    # --------------------------------------------------
+    # Queries
+    # --------------------------------------------------
+    @property
+    def teams(self):
+        return list(self._team_pos)
+
+    def counts(self, start_year=None, end_year=None, team=None):
+        """Raw (cap+1) x (cap+1) count array for a period, optionally from a team's perspective."""
+        lo_y = -np.inf if start_year is None else start_year
+        hi_y = np.inf if end_year is None else end_year
+
+        if team is None:
+            lo = np.searchsorted(self.years, lo_y, side="left")
+            hi = np.searchsorted(self.years, hi_y, side="right")
+            return self._global_cum[hi] - self._global_cum[lo]
+
+        pos = self._team_pos.get(team)
+        if pos is None:
+            return np.zeros((self.cap + 1, self.cap + 1), dtype=np.int32)
+
+        start, stop = self._team_offsets[pos], self._team_offsets[pos + 1]
+        t_years = self._team_years[start:stop]
+        lo = start + np.searchsorted(t_years, lo_y, side="left")
+        hi = start + np.searchsorted(t_years, hi_y, side="right")
+        return self._team_cum[hi] - self._team_cum[lo]
+
+    def matrix(self, start_year=None, end_year=None, team=None, trim=True):
+        """
+        Score heatmap as a DataFrame (rows: home / goals for, columns: away / goals against).
+        With trim=True, empty trailing rows and columns are dropped.
+        """
+        c = self.counts(start_year, end_year, team)
+        n_rows, n_cols = c.shape
+        if trim and c.any():
+            n_rows = int(np.flatnonzero(c.any(axis=1))[-1]) + 1
+            n_cols = int(np.flatnonzero(c.any(axis=0))[-1]) + 1
+
+        return pd.DataFrame(
+            c[:n_rows, :n_cols],
+            index=pd.Index(self.labels[:n_rows], name="home_score" if team is None else "goals_for"),
+            columns=pd.Index(self.labels[:n_cols], name="away_score" if team is None else "goals_against"),
+        )
+
+    def top_scores(self, n=None, start_year=None, end_year=None, team=None):
+        """Most frequent scorelines, as a DataFrame (score, count)."""
+        c = self.counts(start_year, end_year, team).ravel()
+        nz = np.flatnonzero(c)
+        order = nz[np.argsort(-c[nz], kind="stable")]
+        if n is not None:
+            order = order[:n]
+
+        bins = self.cap + 1
+        scores = [f"{self.labels[i // bins]}-{self.labels[i % bins]}" for i in order]
+        return pd.DataFrame({"score": scores, "count": c[order]})
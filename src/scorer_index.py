@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+# ======================================================
+# Scorer leaderboard index
+# ======================================================
+# Counts keyed by (scorer, team, year), pre-sorted once so that
+# top-N queries per edition, per country or all time are slices.
+
+MATCH_KEYS = ["date", "home_team", "away_team"]
+COUNT_COLS = ["goals", "penalties", "own_goals"]
+
+
+def _sorted_with_offsets(df, group_col):
+    """Sort by (group, -goals, scorer) and return the frame plus group offsets."""
+    df = df.sort_values([group_col, "goals", "scorer"], ascending=[True, False, True], kind="stable")
+    df = df.reset_index(drop=True)
+    keys = df[group_col].to_numpy()
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], dtype=int)
+    bounds = np.r_[starts, len(keys)]
+    offsets = {keys[s]: (bounds[i], bounds[i + 1]) for i, s in enumerate(starts)}
+    return df, offsets
+
+
+class ScorerIndex:
+    """
+    Goal / penalty / own-goal counts per (scorer, team, year).
+
+    `goals` excludes own goals; own goals are counted separately for the
+    player who scored them (`team` is the team credited with the goal).
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+        # Per edition
+        self._by_year, self._year_offsets = _sorted_with_offsets(table, "year")
+
+        # Per country (all editions)
+        per_team = table.groupby(["team", "scorer"], as_index=False)[COUNT_COLS].sum()
+        self._by_team, self._team_offsets = _sorted_with_offsets(per_team, "team")
+
+        # All time (a player is listed with the team the player scored most for)
+        per_scorer = (
+            table.groupby(["scorer", "team"], as_index=False)[COUNT_COLS].sum()
+            .sort_values(["scorer", "goals"], ascending=[True, False], kind="stable")
+        )
+        all_time = per_scorer.groupby("scorer", as_index=False).agg(
+            team=("team", "first"),
+            goals=("goals", "sum"),
+            penalties=("penalties", "sum"),
+            own_goals=("own_goals", "sum"),
+        )
+        self._all_time = all_time.sort_values(
+            ["goals", "scorer"], ascending=[False, True], kind="stable"
+        ).reset_index(drop=True)
+
+    # --------------------------------------------------
+    # Build
+    # --------------------------------------------------
+    @classmethod
+    def from_goals(cls, goals, matches=None):
+        """
+        Build from a goalscorers frame (goalscorers.csv schema).
+        If `matches` is given, only goals from those matches are kept
+        (e.g. the AFCON final-phase subset of the global file).
+        """
+        goals = goals.dropna(subset=["scorer"])
+        if matches is not None:
+            goals = goals.merge(matches[MATCH_KEYS].drop_duplicates(), on=MATCH_KEYS, how="inner")
+
+        own = goals["own_goal"].astype(bool).to_numpy()
+        pen = goals["penalty"].astype(bool).to_numpy()
+        counts = pd.DataFrame({
+            "scorer": goals["scorer"].to_numpy(),
+            "team": goals["team"].to_numpy(),
+            "year": pd.to_datetime(goals["date"]).dt.year.to_numpy(),
+            "goals": (~own).astype(np.int32),
+            "penalties": (pen & ~own).astype(np.int32),
+            "own_goals": own.astype(np.int32),
+        })
+        table = counts.groupby(["scorer", "team", "year"], as_index=False)[COUNT_COLS].sum()
+        return cls(table)
+
+    # --------------------------------------------------
+    # Queries
+    # --------------------------------------------------
+    @property
+    def years(self):
+        return [int(y) for y in sorted(self._year_offsets)]
+
+    @property
+    def teams(self):
+        return sorted(self._team_offsets)
+
+    def top(self, n=None, year=None, team=None):
+        """
+        Top scorers, sorted by goals (desc) then name.
+        - year only : one edition
+        - team only : one country, all editions
+        - both      : one country in one edition
+        - neither   : all time
+        """
+        if year is not None:
+            lo, hi = self._year_offsets.get(year, (0, 0))
+            df = self._by_year.iloc[lo:hi]
+            if team is not None:
+                df = df[df["team"] == team]
+        elif team is not None:
+            lo, hi = self._team_offsets.get(team, (0, 0))
+            df = self._by_team.iloc[lo:hi]
+        else:
+            df = self._all_time
+
+        df = df[df["goals"] > 0]
+        if n is not None:
+            df = df.head(n)
+        return df.reset_index(drop=True)
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+# ======================================================
+# Penalty shootouts
+# ======================================================
+# Shootouts are attached to their exact match row through the
+# (date, home_team, away_team) key, then aggregated per team.
+
+MATCH_KEYS = ["date", "home_team", "away_team"]
+
+
+def attach_shootouts(matches, shootouts):
+    """
+    Left-join shootout outcomes onto matches.
+    Adds `shootout_winner` and `first_shooter` (NaN when no shootout / unknown).
+    """
+    keyed = (
+        shootouts[MATCH_KEYS + ["winner", "first_shooter"]]
+        .drop_duplicates(subset=MATCH_KEYS)
+        .rename(columns={"winner": "shootout_winner"})
+    )
+    out = matches.merge(keyed, on=MATCH_KEYS, how="left", validate="many_to_one")
+    out.index = matches.index
+    return out
+
+
+def shootout_table(matches):
+    """
+    Per-team shootout record for matches carrying `shootout_winner`.
+
+    Columns : team, participations, wins, win_pct,
+              first_participations, first_wins, first_win_pct,
+              second_participations, second_wins, second_win_pct
+    (first / second only count shootouts where the first shooter is known)
+    """
+    so = matches[matches["shootout_winner"].notna()]
+
+    teams = np.concatenate([so["home_team"].to_numpy(), so["away_team"].to_numpy()])
+    winner = np.tile(so["shootout_winner"].to_numpy(), 2)
+    first = np.tile(so["first_shooter"].to_numpy(), 2)
+
+    won = teams == winner
+    known = pd.notna(first)
+    shot_first = known & (teams == first)
+    shot_second = known & ~shot_first
+
+    long = pd.DataFrame({
+        "team": teams,
+        "participations": 1,
+        "wins": won.astype(int),
+        "first_participations": shot_first.astype(int),
+        "first_wins": (shot_first & won).astype(int),
+        "second_participations": shot_second.astype(int),
+        "second_wins": (shot_second & won).astype(int),
+    })
+    table = long.groupby("team", as_index=False).sum()
+
+    for prefix in ["", "first_", "second_"]:
+        played = table[f"{prefix}participations"]
+        table[f"{prefix}win_pct"] = (table[f"{prefix}wins"] / played.where(played > 0) * 100).round(1)
+
+    return table.sort_values(["participations", "win_pct"], ascending=False).reset_index(drop=True)
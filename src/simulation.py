@@ -0,0 +1,336 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from src.can2025 import GROUPS, HOST, HOST_ADVANTAGE, NAME_MAP
+
+# ======================================================
+# Simulation CAN 2025 (Elo + modèle de buts de Poisson)
+# ======================================================
+# - score : Poisson ajusté sur l'historique (src/goal_model.py, artifact "goal_model")
+# - groupes : 2 premiers + 4 meilleurs troisièmes (Pts, Diff)
+# - phase finale : tirage au sort des 8èmes, égalité départagée selon P(victoire)
+#
+# `ratings` est un RatingSnapshot (ou tout objet avec .get(team_en)).
+# simulate_groups / simulate_knockout jouent UN tournoi (affichage du
+# dashboard); simulate_many joue n tournois d'un coup, en tableaux numpy.
+
+ROUNDS = ["8èmes de Finale", "Quarts de Finale", "Demi-Finales", "Finale"]
+
+
+def default_goal_model():
+    from src.artifacts import get_artifact
+    return get_artifact("goal_model")
+
+
+def win_probability(ratings, t1_fr, t2_fr):
+    elo_a = ratings.get(NAME_MAP.get(t1_fr, t1_fr))
+    elo_b = ratings.get(NAME_MAP.get(t2_fr, t2_fr))
+    home_bonus = HOST_ADVANTAGE if t1_fr == HOST else (-HOST_ADVANTAGE if t2_fr == HOST else 0)
+    return 1 / (1 + 10 ** ((elo_b - (elo_a + home_bonus)) / 400)), (elo_a + home_bonus) - elo_b
+
+
+def simulate_match(ratings, t1_fr, t2_fr, knockout=False, rng=random, goal_model=None):
+    prob_a, diff = win_probability(ratings, t1_fr, t2_fr)
+    ga, gb = (goal_model or default_goal_model()).draw(diff, rng)
+
+    if knockout and ga == gb:
+        if rng.random() < prob_a:
+            ga += 1
+        else:
+            gb += 1
+    return ga, gb
+
+
+def simulate_groups(ratings, groups=GROUPS, rng=random, goal_model=None, played=None):
+    """
+    Phase de groupes.
+    :param played: résultats déjà joués {(équipe A, équipe B): (buts A, buts B)}, gardés tels quels
+    :return: (qualifiés [(équipe, rang dans le groupe)], classements {groupe: [(équipe, Pts, Diff)]})
+    """
+    goal_model = goal_model or default_goal_model()
+    qualified, thirds = [], []
+    tables = {}
+
+    for grp, teams in groups.items():
+        stats = {t: {'Pts': 0, 'BP': 0, 'Diff': 0} for t in teams}
+        matchups = [(teams[i], teams[j]) for i in range(4) for j in range(i + 1, 4)]
+
+        for t1, t2 in matchups:
+            if played and (t1, t2) in played:
+                s1, s2 = played[(t1, t2)]
+            elif played and (t2, t1) in played:
+                s2, s1 = played[(t2, t1)]
+            else:
+                s1, s2 = simulate_match(ratings, t1, t2, rng=rng, goal_model=goal_model)
+            stats[t1]['BP'] += s1
+            stats[t2]['BP'] += s2
+            stats[t1]['Diff'] += (s1 - s2)
+            stats[t2]['Diff'] += (s2 - s1)
+            if s1 > s2:
+                stats[t1]['Pts'] += 3
+            elif s2 > s1:
+                stats[t2]['Pts'] += 3
+            else:
+                stats[t1]['Pts'] += 1
+                stats[t2]['Pts'] += 1
+
+        sorted_teams = sorted(stats.keys(), key=lambda x: (stats[x]['Pts'], stats[x]['Diff'], stats[x]['BP']),
+                              reverse=True)
+        qualified.append((sorted_teams[0], 1))
+        qualified.append((sorted_teams[1], 2))
+        thirds.append((sorted_teams[2], stats[sorted_teams[2]]))
+        tables[grp] = [(t, stats[t]['Pts'], stats[t]['Diff']) for t in sorted_teams]
+
+    thirds.sort(key=lambda x: (x[1]['Pts'], x[1]['Diff']), reverse=True)
+    qualified.extend([(t[0], 3) for t in thirds[:4]])
+    return qualified, tables
+
+
+def knockout_bracket(matches):
+    """
+    Phase finale déjà jouée, [(vainqueur, perdant, buts vainqueur, buts perdant)] dans l'ordre des matchs.
+    :return: ({équipe: (tours gagnés, tour de l'élimination ou None)},
+              [blocs du tableau : équipes d'un même sous-tableau, dans l'ordre du tableau])
+    """
+    records, block_of = {}, {}
+    for winner, loser, *_ in matches:
+        (won_w, lost_w), (won_l, lost_l) = records.get(winner, (0, None)), records.get(loser, (0, None))
+        if lost_w is not None or lost_l is not None:
+            continue                                # match pour la 3e place
+        records[winner], records[loser] = (won_w + 1, None), (won_l, won_l)
+        block = block_of.get(winner, [winner]) + block_of.get(loser, [loser])
+        for team in block:
+            block_of[team] = block
+    blocks = list({id(b): b for b in block_of.values()}.values())
+    return records, blocks
+
+
+def known_winner(records, round_index, t1, t2):
+    """Vainqueur imposé par la phase finale déjà jouée (None : match à tirer)."""
+    if not records:
+        return None
+    status = [int(won > round_index) - int(lost is not None and lost <= round_index)
+              for won, lost in (records.get(t, (0, None)) for t in (t1, t2))]
+    if status[0] == status[1]:
+        return None
+    return t1 if status[0] > status[1] else t2
+
+
+def bracket_order(teams, blocks):
+    """
+    Tableau tiré au sort réordonné pour que chaque bloc déjà joué occupe un sous-tableau : blocs
+    du plus grand au plus petit (alignés, leurs tailles sont des puissances de 2), dans l'ordre du tirage.
+    """
+    present = set(teams)
+    block_of = {t: b for b in blocks if present.issuperset(b) for t in b}
+    units, seen = [], set()
+    for team in teams:
+        block = block_of.get(team, [team])
+        if block[0] not in seen:
+            seen.add(block[0])
+            units.append(block)
+    units.sort(key=len, reverse=True)
+    return [t for unit in units for t in unit]
+
+
+def simulate_knockout(ratings, teams, rng=random, goal_model=None, knockouts=None):
+    """
+    Phase finale à partir des 16 qualifiés (tirage au sort des 8èmes).
+    :param knockouts: matchs déjà joués [(vainqueur, perdant, buts vainqueur, buts perdant)] : affiches, scores
+                      et vainqueurs (tirs au but compris) conservés
+    :return: ([(tour, [(t1, t2, s1, s2, vainqueur)])], vainqueur)
+    """
+    goal_model = goal_model or default_goal_model()
+    records, blocks = knockout_bracket(knockouts or [])
+    scores = {frozenset(match[:2]): match for match in knockouts or []}
+    teams = list(teams)
+    rng.shuffle(teams)
+    teams = bracket_order(teams, blocks)
+    current_round = [(teams[i], teams[i + 1]) for i in range(0, len(teams) - 1, 2)]
+
+    rounds = []
+    winner = None
+    for i, r_name in enumerate(ROUNDS):
+        if not current_round:
+            break
+        results = []
+        for t1, t2 in current_round:
+            forced = known_winner(records, i, t1, t2)
+            played = scores.get(frozenset((t1, t2))) if forced is not None else None
+            if played is not None:
+                # Match réel : score enregistré, nul possible (vainqueur aux tirs au but)
+                winner, _, goals_w, goals_l = played
+                s1, s2 = (goals_w, goals_l) if winner == t1 else (goals_l, goals_w)
+            else:
+                s1, s2 = simulate_match(ratings, t1, t2, knockout=True, rng=rng, goal_model=goal_model)
+                if forced is not None and (s1 > s2) != (forced == t1):
+                    s1, s2 = s2, s1
+                winner = t1 if s1 > s2 else t2
+            results.append((t1, t2, s1, s2, winner))
+        rounds.append((r_name, results))
+
+        next_round = [r[4] for r in results]
+        if len(next_round) > 1:
+            current_round = [(next_round[i], next_round[i + 1]) for i in range(0, len(next_round) - 1, 2)]
+        else:
+            winner = next_round[0]
+            current_round = []
+
+    return rounds, winner
+
+
+def simulate_tournament(ratings, groups=GROUPS, rng=random, goal_model=None):
+    """Un tournoi complet : {'groups', 'qualified', 'rounds', 'winner'}."""
+    goal_model = goal_model or default_goal_model()
+    qualified, tables = simulate_groups(ratings, groups, rng=rng, goal_model=goal_model)
+    rounds, winner = simulate_knockout(ratings, [t for t, _ in qualified], rng=rng, goal_model=goal_model)
+    return {"groups": tables, "qualified": qualified, "rounds": rounds, "winner": winner}
+
+
+# ======================================================
+# n tournois en tableaux (numpy)
+# ======================================================
+# Équipes numérotées dans l'ordre des groupes (A1..A4, B1..B4...) : l'équipe
+# i est dans le groupe i // 4. Les 36 matchs de poules sont tirés en une
+# fois pour les n tournois, puis chaque tour de la phase finale.
+
+def team_elos(ratings, teams):
+    """Elo de chaque équipe (noms FR), bonus du pays hôte inclus."""
+    return np.array([ratings.get(NAME_MAP.get(t, t)) + (HOST_ADVANTAGE if t == HOST else 0) for t in teams])
+
+
+def group_fixtures(groups=GROUPS):
+    """(équipes, indices domicile, indices extérieur) des matchs de poules, groupe par groupe."""
+    teams = [t for grp in groups.values() for t in grp]
+    pairs = [(4 * g + i, 4 * g + j) for g in range(len(groups)) for i in range(4) for j in range(i + 1, 4)]
+    home, away = (np.array(side) for side in zip(*pairs))
+    return teams, home, away
+
+
+def group_standings(goals_a, goals_b, home, away, n_teams):
+    """
+    Classements de n tournois.
+    :return: (order (n, groupes, 4) : indices des équipes du 1er au 4e, points (n, équipes), diff (n, équipes))
+    """
+    incidence_home = np.zeros((len(home), n_teams), dtype=np.int32)
+    incidence_away = np.zeros((len(away), n_teams), dtype=np.int32)
+    incidence_home[np.arange(len(home)), home] = 1
+    incidence_away[np.arange(len(away)), away] = 1
+
+    ga, gb = goals_a.astype(np.int32), goals_b.astype(np.int32)
+    pts_a = 3 * (ga > gb) + (ga == gb)
+    pts_b = 3 * (gb > ga) + (ga == gb)
+    points = pts_a @ incidence_home + pts_b @ incidence_away
+    diff = (ga - gb) @ (incidence_home - incidence_away)
+    scored = ga @ incidence_home + gb @ incidence_away
+
+    # Même ordre que simulate_groups : Pts, Diff, BP, puis ordre du groupe
+    key = (points * 10_000 + (diff + 500)) * 1_000 + scored
+    n_groups = n_teams // 4
+    order = np.argsort(-key.reshape(-1, n_groups, 4), axis=2, kind="stable")
+    order += 4 * np.arange(n_groups)[None, :, None]
+    return order, points, diff
+
+
+def qualified_teams(order, points, diff):
+    """(n, 16) : 1ers, 2es puis les 4 meilleurs 3es (Pts, Diff)."""
+    thirds = order[:, :, 2]
+    third_points = np.take_along_axis(points, thirds, axis=1).astype(np.int64)
+    third_key = third_points * 10_000 + np.take_along_axis(diff, thirds, axis=1)
+    best = np.argsort(-third_key, axis=1, kind="stable")[:, :4]
+    return np.concatenate([order[:, :, 0], order[:, :, 1], np.take_along_axis(thirds, best, axis=1)], axis=1)
+
+
+def knockout_draws(n, n_qualified, rng):
+    """Tirage au sort des 8èmes : une permutation des qualifiés par tournoi."""
+    return np.argsort(rng.random((n, n_qualified)), axis=1)
+
+
+def knockout_arrays(matches, teams):
+    """
+    Phase finale déjà jouée en tableaux indexés comme teams : (tours gagnés, tour de l'élimination
+    (len(ROUNDS) : encore en lice), taille du bloc, 1re équipe du bloc, place dans le bloc).
+    """
+    records, blocks = knockout_bracket(matches)
+    ids = {t: i for i, t in enumerate(teams)}
+    won = np.zeros(len(teams), dtype=np.int8)
+    lost = np.full(len(teams), len(ROUNDS), dtype=np.int8)
+    size, leader, offset = np.ones(len(teams), dtype=np.int8), np.arange(len(teams)), np.zeros(len(teams), dtype=np.int8)
+    for team, (w, l) in records.items():
+        won[ids[team]] = w
+        lost[ids[team]] = len(ROUNDS) if l is None else l
+    for block in blocks:
+        for k, team in enumerate(block):
+            size[ids[team]], leader[ids[team]], offset[ids[team]] = len(block), ids[block[0]], k
+    return won, lost, size, leader, offset
+
+
+def arrange_bracket(bracket, knockouts):
+    """bracket_order pour n tableaux (n, 16) : blocs alignés, les plus grands d'abord, dans l'ordre du tirage."""
+    _, _, size, leader, offset = knockouts
+    n, slots = bracket.shape
+    position = np.full((n, len(size)), slots, dtype=np.int64)       # équipes non qualifiées : après les autres
+    np.put_along_axis(position, bracket, np.arange(slots)[None, :], axis=1)
+    block_position = np.take_along_axis(position, leader[bracket], axis=1)
+    key = ((slots - size[bracket].astype(np.int64)) * (slots + 1) + block_position) * slots + offset[bracket]
+    return np.take_along_axis(bracket, np.argsort(key, axis=1, kind="stable"), axis=1)
+
+
+def play_knockout(elos, bracket, rng, goal_model, knockouts=None):
+    """
+    Phase finale de n tournois à partir des tableaux (n, 16) déjà tirés au sort.
+    :param knockouts: knockout_arrays(...) des matchs déjà joués : affiches et résultats imposés
+    :return: (présences {tour: (n, 2^k) indices des équipes}, vainqueurs (n,))
+    """
+    if knockouts is not None:
+        bracket = arrange_bracket(bracket, knockouts)
+    reached = {}
+    for i, r_name in enumerate(ROUNDS):
+        reached[r_name] = bracket
+        a, b = bracket[:, 0::2], bracket[:, 1::2]
+        d = elos[a] - elos[b]
+        # Nombre fixe de tirages par tour : même graine → mêmes aléas d'un scénario à l'autre
+        u = rng.random((3,) + d.shape)
+        ga, gb = goal_model.inverse(d, u[0], u[1])
+        prob_a = 1 / (1 + 10 ** (-d / 400))
+        a_wins = (ga > gb) | ((ga == gb) & (u[2] < prob_a))
+        if knockouts is not None:
+            won, lost = knockouts[:2]
+            status = (won > i).astype(np.int8) - (lost <= i)
+            a_wins = np.where(status[a] != status[b], status[a] > status[b], a_wins)
+        bracket = np.where(a_wins, a, b)
+    return reached, bracket[:, 0]
+
+
+def probability_table(ratings, teams, reached, winners, n):
+    """Colonnes : team, team_en, elo, <tour>... (en %), winner (%)"""
+    table = pd.DataFrame({
+        "team": teams,
+        "team_en": [NAME_MAP.get(t, t) for t in teams],
+        "elo": [round(ratings.get(NAME_MAP.get(t, t)), 1) for t in teams],
+    })
+    for r_name in ROUNDS:
+        table[r_name] = np.bincount(reached[r_name].ravel(), minlength=len(teams)) / n * 100
+    table["winner"] = np.bincount(winners, minlength=len(teams)) / n * 100
+    return table.sort_values("winner", ascending=False).reset_index(drop=True)
+
+
+def simulate_many(ratings, n=1000, seed=None, groups=GROUPS, goal_model=None):
+    """
+    n tournois → probabilité par équipe d'atteindre chaque tour et de gagner.
+    Colonnes : team, team_en, elo, <tour>... (en %), winner (%)
+    """
+    goal_model = goal_model or default_goal_model()
+    rng = np.random.default_rng(seed)
+    teams, home, away = group_fixtures(groups)
+    elos = team_elos(ratings, teams)
+
+    goals_a, goals_b = goal_model.sample(elos[home] - elos[away], rng, size=(n, len(home)))
+    order, points, diff = group_standings(goals_a, goals_b, home, away, len(teams))
+    qualified = qualified_teams(order, points, diff)
+    bracket = np.take_along_axis(qualified, knockout_draws(n, qualified.shape[1], rng), axis=1)
+
+    reached, winners = play_knockout(elos, bracket, rng, goal_model)
+    return probability_table(ratings, teams, reached, winners, n)
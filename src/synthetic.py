@@ -0,0 +1,237 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# ======================================================
+# Synthetic datasets (same CSV schemas as data/)
+# ======================================================
+# Seeded, fully vectorized generator for scaling tests :
+#
+#   results.csv      date,home_team,away_team,home_score,away_score,tournament,city,country,neutral
+#   goalscorers.csv  date,home_team,away_team,team,scorer,minute,own_goal,penalty
+#   shootouts.csv    date,home_team,away_team,winner,first_shooter
+#   former_names.csv current,former,start_date,end_date
+#
+#   python -m src.synthetic --out data/synthetic --teams 54 --years 1957-2025 --per-year 700 --seed 0
+#
+# Each team gets a hidden strength; scores are Poisson around it (home
+# advantage unless neutral). Goals are split between a fixed squad per team,
+# shootouts follow drawn cup matches.
+
+# (tournament, share of matches, neutral probability, can end in a shootout)
+TOURNAMENTS = [
+    ("Friendly", 0.37, 0.10, False),
+    ("FIFA World Cup qualification", 0.18, 0.03, False),
+    ("African Cup of Nations qualification", 0.17, 0.03, False),
+    ("African Cup of Nations", 0.06, 0.85, True),
+    ("FIFA World Cup", 0.03, 0.95, True),
+    ("African Nations Championship", 0.05, 0.85, True),
+    ("COSAFA Cup", 0.05, 0.70, True),
+    ("CECAFA Cup", 0.05, 0.70, True),
+    ("WAFU Cup", 0.04, 0.70, True),
+]
+
+BASE_GOALS = 0.10          # log-rate of a goal count between equal teams (~1.1 goals)
+STRENGTH_EFFECT = 0.35
+HOME_EFFECT = 0.35
+SQUAD_SIZE = 30
+PENALTY_RATE = 0.067       # as in goalscorers.csv
+OWN_GOAL_RATE = 0.0185
+SHOOTOUT_RATE = 0.45       # share of drawn cup matches decided on penalties
+FIRST_SHOOTER_KNOWN = 0.36
+
+
+def team_names(n_teams):
+    return np.array([f"Nation {i + 1:03d}" for i in range(n_teams)], dtype=object)
+
+
+def _names(codes, categories):
+    # Categorical columns : tens of millions of rows without one Python string per cell
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def _bool_text(values):
+    # Same spelling as the source files
+    return np.where(values, "TRUE", "FALSE")
+
+
+def generate_results(rng, teams, strength, n, start_year, end_year):
+    """Matches (results.csv columns), sorted by date. Scores stay int for the goal generator."""
+    n_teams = len(teams)
+    start = np.datetime64(f"{start_year}-01-01")
+    span = int((np.datetime64(f"{end_year + 1}-01-01") - start).astype(int))
+    dates = start + np.sort(rng.integers(0, span, n)).astype("timedelta64[D]")
+
+    home = rng.integers(0, n_teams, n)
+    away = (home + rng.integers(1, n_teams, n)) % n_teams
+
+    names, shares, neutral_p, _ = zip(*TOURNAMENTS)
+    shares = np.array(shares) / sum(shares)
+    t_idx = rng.choice(len(names), size=n, p=shares)
+    neutral = rng.random(n) < np.array(neutral_p)[t_idx]
+
+    diff = strength[home] - strength[away]
+    home_adv = np.where(neutral, 0.0, HOME_EFFECT)
+    home_score = rng.poisson(np.exp(BASE_GOALS + STRENGTH_EFFECT * diff + home_adv))
+    away_score = rng.poisson(np.exp(BASE_GOALS - STRENGTH_EFFECT * diff))
+
+    # Neutral venues : played in a third country
+    venue = np.where(neutral, rng.integers(0, n_teams, n), home)
+
+    return pd.DataFrame({
+        "date": dates,
+        "home_team": _names(home, teams),
+        "away_team": _names(away, teams),
+        "home_score": home_score,
+        "away_score": away_score,
+        "tournament": _names(t_idx, list(names)),
+        "city": _names(venue, teams + " City"),
+        "country": _names(venue, teams),
+        "neutral": neutral,
+    }), home, away, t_idx
+
+
+def generate_goals(rng, teams, results, home, away):
+    """One row per goal (goalscorers.csv columns), ordered by match then minute."""
+    hs = results["home_score"].to_numpy()
+    aw = results["away_score"].to_numpy()
+
+    match = np.concatenate([np.repeat(np.arange(len(results)), hs), np.repeat(np.arange(len(results)), aw)])
+    team = np.concatenate([np.repeat(home, hs), np.repeat(away, aw)])
+    opponent = np.concatenate([np.repeat(away, hs), np.repeat(home, aw)])
+    n = len(match)
+
+    own_goal = rng.random(n) < OWN_GOAL_RATE
+    penalty = ~own_goal & (rng.random(n) < PENALTY_RATE)
+    minute = rng.integers(1, 91, n)
+    stoppage = rng.random(n) < 0.04
+    minute[stoppage] = 90 + rng.integers(1, 8, stoppage.sum())
+
+    # Squad players named after their team; own goals are scored by the opponent
+    squads = (teams[:, None] + np.array([f" Player {k + 1:02d}" for k in range(SQUAD_SIZE)])[None, :]).ravel()
+    scorer_team = np.where(own_goal, opponent, team)
+    # Strikers score more : rank-weighted squad index
+    weights = 1.0 / np.arange(1, SQUAD_SIZE + 1)
+    player = rng.choice(SQUAD_SIZE, size=n, p=weights / weights.sum())
+    scorer = scorer_team * SQUAD_SIZE + player
+
+    order = np.lexsort((minute, match))
+    match, team, scorer, minute = match[order], team[order], scorer[order], minute[order]
+    own_goal, penalty = own_goal[order], penalty[order]
+
+    return pd.DataFrame({
+        "date": results["date"].to_numpy()[match],
+        "home_team": _names(home[match], teams),
+        "away_team": _names(away[match], teams),
+        "team": _names(team, teams),
+        "scorer": _names(scorer, squads),
+        "minute": minute,
+        "own_goal": own_goal,
+        "penalty": penalty,
+    })
+
+
+def generate_shootouts(rng, teams, strength, results, home, away, t_idx):
+    """Shootouts after drawn cup matches (shootouts.csv columns)."""
+    cup = np.array([t[3] for t in TOURNAMENTS])[t_idx]
+    drawn = results["home_score"].to_numpy() == results["away_score"].to_numpy()
+    idx = np.flatnonzero(cup & drawn & (rng.random(len(results)) < SHOOTOUT_RATE))
+
+    h, a = home[idx], away[idx]
+    p_home = 1 / (1 + np.exp(-0.3 * (strength[h] - strength[a])))   # barely better than a coin flip
+    winner = np.where(rng.random(len(idx)) < p_home, h, a)
+
+    first = np.where(rng.random(len(idx)) < 0.5, h, a)
+    first[rng.random(len(idx)) >= FIRST_SHOOTER_KNOWN] = -1   # unknown (empty in the CSV)
+
+    return pd.DataFrame({
+        "date": results["date"].to_numpy()[idx],
+        "home_team": _names(h, teams),
+        "away_team": _names(a, teams),
+        "winner": _names(winner, teams),
+        "first_shooter": _names(first, teams),
+    })
+
+
+def generate_former_names(rng, teams, start_year):
+    """A few teams renamed once (former_names.csv columns)."""
+    renamed = rng.choice(len(teams), size=max(1, len(teams) // 10), replace=False)
+    end = np.datetime64(f"{start_year}-01-01") + rng.integers(365, 365 * 30, len(renamed)).astype("timedelta64[D]")
+    return pd.DataFrame({
+        "current": teams[renamed],
+        "former": np.array([f"Old {t}" for t in teams[renamed]], dtype=object),
+        "start_date": np.datetime64(f"{start_year}-01-01"),
+        "end_date": end,
+    })
+
+
+def generate(n_teams=54, start_year=1957, end_year=2025, matches_per_year=700, seed=0, n_matches=None):
+    """
+    Dict of DataFrames : results, goalscorers, shootouts, former_names.
+    `n_matches` overrides matches_per_year (total spread over the years).
+    """
+    rng = np.random.default_rng(seed)
+    teams = team_names(n_teams)
+    strength = rng.normal(0, 1, n_teams)
+    n = n_matches if n_matches is not None else matches_per_year * (end_year - start_year + 1)
+
+    results, home, away, t_idx = generate_results(rng, teams, strength, n, start_year, end_year)
+    return {
+        "results": results,
+        "goalscorers": generate_goals(rng, teams, results, home, away),
+        "shootouts": generate_shootouts(rng, teams, strength, results, home, away, t_idx),
+        "former_names": generate_former_names(rng, teams, start_year),
+    }
+
+
+def synthetic_results(n, n_teams=200, seed=0, start_year=1950, end_year=2025):
+    """Only the matches (results.csv columns), with datetime dates : input of the Elo engines."""
+    rng = np.random.default_rng(seed)
+    teams = team_names(n_teams)
+    results = generate_results(rng, teams, rng.normal(0, 1, n_teams), n, start_year, end_year)[0]
+    results["date"] = pd.to_datetime(results["date"])
+    return results
+
+
+def write_csv(frames, out_dir):
+    """Writes the frames as <out_dir>/<name>.csv in the source format (ISO dates, TRUE/FALSE)."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {}
+    for name, df in frames.items():
+        df = df.copy()
+        for col in ("neutral", "own_goal", "penalty"):
+            if col in df:
+                df[col] = _bool_text(df[col].to_numpy())
+        path = os.path.join(out_dir, f"{name}.csv")
+        df.to_csv(path, index=False, date_format="%Y-%m-%d")
+        paths[name] = path
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic datasets in the data/ CSV schemas.")
+    parser.add_argument("--out", default=os.path.join("data", "synthetic"))
+    parser.add_argument("--teams", type=int, default=54)
+    parser.add_argument("--years", default="1957-2025", help="first-last, e.g. 1957-2025")
+    parser.add_argument("--per-year", type=int, default=700, help="matches per year")
+    parser.add_argument("--matches", type=int, default=None, help="total matches (overrides --per-year)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start_year, end_year = (int(y) for y in args.years.split("-"))
+    start = time.perf_counter()
+    frames = generate(args.teams, start_year, end_year, args.per_year, args.seed, args.matches)
+    generated = time.perf_counter() - start
+    paths = write_csv(frames, args.out)
+
+    for name, df in frames.items():
+        print(f"📄 {paths[name]} ({len(df):,} rows)")
+    print(f"⏱️  generation {generated:.2f}s, total {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
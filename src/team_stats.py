@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+# ======================================================
+# Batch team statistics
+# ======================================================
+# Every function here works on ALL teams at once : the match table is
+# stacked once in team perspective, then aggregated with one groupby.
+
+CAN_FINAL = "African Cup of Nations"
+CAN_QUALIF = "African Cup of Nations qualification"
+
+
+def team_perspective(df):
+    """One row per (team, match) : team, opponent, goals_for, goals_against."""
+    df = df.dropna(subset=["home_score", "away_score"])
+    h = df["home_score"].to_numpy()
+    a = df["away_score"].to_numpy()
+    return pd.DataFrame({
+        "team": np.concatenate([df["home_team"].to_numpy(), df["away_team"].to_numpy()]),
+        "opponent": np.concatenate([df["away_team"].to_numpy(), df["home_team"].to_numpy()]),
+        "goals_for": np.concatenate([h, a]),
+        "goals_against": np.concatenate([a, h]),
+    })
+
+
+def team_records(df, prefix=""):
+    """
+    Record of every team in df.
+    Columns : team, played, wins, draws, losses, goals_for, goals_against,
+              winrate (%), gf_per_match, ga_per_match, clean_sheets_pct (%)
+    """
+    long = team_perspective(df)
+    gf = long["goals_for"].to_numpy()
+    ga = long["goals_against"].to_numpy()
+    long["played"] = 1
+    long["wins"] = (gf > ga).astype(int)
+    long["draws"] = (gf == ga).astype(int)
+    long["losses"] = (gf < ga).astype(int)
+    long["clean_sheets"] = (ga == 0).astype(int)
+
+    rec = long.groupby("team", as_index=False)[
+        ["played", "wins", "draws", "losses", "goals_for", "goals_against", "clean_sheets"]
+    ].sum()
+
+    played = rec["played"]
+    rec["winrate"] = rec["wins"] / played * 100
+    rec["gf_per_match"] = rec["goals_for"] / played
+    rec["ga_per_match"] = rec["goals_against"] / played
+    rec["clean_sheets_pct"] = rec["clean_sheets"] / played * 100
+    rec = rec.drop(columns=["clean_sheets"])
+
+    if prefix:
+        rec = rec.rename(columns={c: prefix + c for c in rec.columns if c != "team"})
+    return rec
+
+
+def power_ranking(ratings, training, afcon, form_index, n_form=5, base_rating=1500):
+    """
+    One row per CAF nation (every team that appears in `afcon`) :
+    Elo, recent form, CAN final record, qualifier record, goal metrics.
+
+    :param ratings: dict team -> Elo
+    :param training: matches used for goal metrics (recent period, all comps)
+    :param afcon: CAN finals + qualifiers
+    :param form_index: src.form.FormIndex built on `training`
+    """
+    teams = pd.Index(sorted(set(afcon["home_team"]).union(afcon["away_team"])), name="team")
+
+    table = pd.DataFrame(index=teams)
+    table["elo"] = teams.map(lambda t: ratings.get(t, base_rating)).astype(float).round(0)
+
+    form = form_index.all_teams(n=n_form).set_index("team")
+    table["form"] = form["form"].reindex(teams).fillna("")
+    table["form_points"] = form["points"].reindex(teams).fillna(0).astype(int)
+
+    can = team_records(afcon[afcon["tournament"] == CAN_FINAL], prefix="can_").set_index("team")
+    qual = team_records(afcon[afcon["tournament"] == CAN_QUALIF], prefix="qual_").set_index("team")
+    recent = team_records(training).set_index("team")[["played", "gf_per_match", "ga_per_match"]]
+    recent["goal_diff_per_match"] = recent["gf_per_match"] - recent["ga_per_match"]
+
+    table = table.join(can[["can_played", "can_wins", "can_winrate", "can_gf_per_match", "can_ga_per_match"]])
+    table = table.join(qual[["qual_played", "qual_wins", "qual_winrate"]])
+    table = table.join(recent)
+
+    count_cols = ["can_played", "can_wins", "qual_played", "qual_wins", "played"]
+    table[count_cols] = table[count_cols].fillna(0).astype(int)
+
+    table = table.sort_values("elo", ascending=False).reset_index()
+    table.insert(0, "rank", np.arange(1, len(table) + 1))
+    return table
+
+
+def h2h_matrix(df):
+    """
+    Head-to-head record of every (team, opponent) pair in df, team perspective.
+    Columns : team, opponent, played, wins, draws, losses, goals_for,
+              goals_against, goal_diff, winrate (%)
+    """
+    long = team_perspective(df)
+    gf = long["goals_for"].to_numpy()
+    ga = long["goals_against"].to_numpy()
+    long["played"] = 1
+    long["wins"] = (gf > ga).astype(int)
+    long["draws"] = (gf == ga).astype(int)
+    long["losses"] = (gf < ga).astype(int)
+
+    pairs = long.groupby(["team", "opponent"], as_index=False)[
+        ["played", "wins", "draws", "losses", "goals_for", "goals_against"]
+    ].sum()
+    pairs["goal_diff"] = pairs["goals_for"] - pairs["goals_against"]
+    pairs["winrate"] = pairs["wins"] / pairs["played"] * 100
+    return pairs